@@ -0,0 +1,52 @@
+"""
+Per-command cost of scopeboss_emulator handle_command: the first and last
+exact commands registered, a prefix family command and an unknown command.
+An unknown command should cost about the same as a hit (CommandRegistry does
+one dict lookup plus a bounded trie walk, not a scan over the handlers).
+
+Usage:
+  uv run python -m benchmarks.bench_dispatch [--n 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from scopeboss_emulator.config import EmulatorConfig, HomeBehavior
+from scopeboss_emulator.core.reducer import handle_command
+from scopeboss_emulator.core.state import LinkState, MotionState, TelescopeState, Timers
+from scopeboss_emulator.protocol.types import CmdFrame
+
+COMMANDS = {
+    "first": ":hS#",
+    "last": ":FS#",
+    "prefix": ":F3#",
+    "unhandled": ":XX#",
+}
+
+
+def run(text: str, n: int, state: TelescopeState, cfg: EmulatorConfig) -> float:
+    cmd = CmdFrame(text=text)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        handle_command(state, cmd, cfg)
+    return (time.perf_counter() - t0) / n
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--n", type=int, default=20000, help="dispatches per command (default: 20000)")
+    args = ap.parse_args()
+
+    cfg = EmulatorConfig(mount_mode_byte="P", max_frame_len=256, nak_on_lock=True, park_duration_ms=100,
+                         home=HomeBehavior(mode="timer", duration_ms=100, succeed=True),
+                         home_status_append_hash=False)
+    state = TelescopeState(now_ms=0, link=LinkState.CONNECTED, motion=MotionState.IDLE_TRACKING, timers=Timers())
+    timings = {name: run(text, args.n, state, cfg) for name, text in COMMANDS.items()}
+    for name, dt in timings.items():
+        print(f"{name:10s} {COMMANDS[name]:6s} {dt * 1e6:8.2f} us")
+    print(f"unhandled / first: {timings['unhandled'] / timings['first']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Throughput benchmark: StreamParser.feed (bulk framing) vs feed_bytewise (reference loop),
+plus FrameViewParser.feed (zero-copy views, text decoded on access).
+
+Replays an Astropad/SkySafari-style polling stream in fixed-size reads and reports
+bytes/sec for each path.
+
+Usage:
+  uv run python -m benchmarks.bench_parser [--mb 4] [--chunk 4096]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from scopeboss_emulator.protocol.parser import StreamParser, FrameViewParser
+from scopeboss_emulator.protocol.types import FrameView
+
+# Typical client traffic: ACK probe, :ED#:G0# display polling, :GR#/:GD# position polling
+PATTERN = b"\x06:ED#:G0#:GR#:GD#:GA#:GZ#:h?#:F1#"
+
+
+def make_stream(size: int) -> bytes:
+    reps = size // len(PATTERN) + 1
+    return (PATTERN * reps)[:size]
+
+
+def run(method: str, data: bytes, chunk: int, max_len: int) -> tuple[float, int]:
+    if method == "views":
+        feed = FrameViewParser(max_len=max_len).feed
+    else:
+        feed = getattr(StreamParser(max_len=max_len), method)
+    frames = 0
+    t0 = time.perf_counter()
+    for pos in range(0, len(data), chunk):
+        cmds = feed(data[pos:pos + chunk])
+        frames += len(cmds)
+    return time.perf_counter() - t0, frames
+
+
+def run_views_decoded(data: bytes, chunk: int, max_len: int) -> tuple[float, int]:
+    """FrameViewParser with every frame's text accessed (what the reducer does)."""
+    feed = FrameViewParser(max_len=max_len).feed
+    frames = 0
+    t0 = time.perf_counter()
+    for pos in range(0, len(data), chunk):
+        for cmd in feed(data[pos:pos + chunk]):
+            if isinstance(cmd, FrameView):
+                cmd.text
+            frames += 1
+    return time.perf_counter() - t0, frames
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--mb", type=float, default=4.0, help="stream size in MiB (default: 4)")
+    ap.add_argument("--chunk", type=int, default=4096, help="bytes per feed() call (default: 4096)")
+    ap.add_argument("--max-len", type=int, default=256)
+    args = ap.parse_args()
+
+    data = make_stream(int(args.mb * 1024 * 1024))
+    results = {}
+    for method in ("feed_bytewise", "feed", "views", "views+text"):
+        if method == "views+text":
+            dt, frames = run_views_decoded(data, args.chunk, args.max_len)
+        else:
+            dt, frames = run(method, data, args.chunk, args.max_len)
+        results[method] = len(data) / dt
+        print(f"{method:14s} {len(data) / dt / 1e6:8.2f} MB/s  ({frames} commands, {dt:.3f} s)")
+    base = results["feed_bytewise"]
+    print("speedup vs feed_bytewise: " + "  ".join(
+        f"{name}={rate / base:.2f}x" for name, rate in results.items() if name != "feed_bytewise"))
+
+
+if __name__ == "__main__":
+    main()
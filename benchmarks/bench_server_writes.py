@@ -0,0 +1,99 @@
+"""
+Per-batch write cost of scopeboss_emulator.server: coalesced (one writelines + one
+drain per read) vs per-reply write + drain.
+
+A blocking client pipelines a batch of reply-producing commands in one segment and
+waits for all reply bytes. Reports server-side send syscalls per batch (counted by
+wrapping socket.send/sendmsg) and round-trip latency per batch.
+
+Usage:
+  uv run python -m benchmarks.bench_server_writes [--batches 2000] [--pairs 4]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from dataclasses import replace
+
+from scopeboss_emulator.config import EmulatorConfig
+from scopeboss_emulator.server import client_session
+from scopeboss_emulator.timers import Scheduler, SimClock
+
+_calls = {"n": 0}
+
+
+def _count(fn):
+    def wrapper(self, *a, **kw):
+        _calls["n"] += 1
+        return fn(self, *a, **kw)
+    return wrapper
+
+
+def run_mode(coalesce: bool, batches: int, pairs: int) -> dict:
+    cfg = replace(EmulatorConfig(), write_coalesce=coalesce)
+    # ACK -> mount byte, :h?# -> status digit: 2 reply bytes per pair
+    batch = b"\x06:h?#" * pairs
+    expect = 2 * pairs
+    ready = threading.Event()
+    port_box = {}
+    stop_box = {}
+
+    async def serve():
+        scheduler = Scheduler(SimClock())
+        server = await asyncio.start_server(
+            lambda r, w: client_session(r, w, cfg, scheduler), "127.0.0.1", 0)
+        port_box["port"] = server.sockets[0].getsockname()[1]
+        stop_box["loop"] = asyncio.get_running_loop()
+        stop_box["stop"] = asyncio.Event()
+        ready.set()
+        async with server:
+            await stop_box["stop"].wait()
+
+    th = threading.Thread(target=lambda: asyncio.run(serve()), daemon=True)
+    th.start()
+    ready.wait()
+
+    s = socket.create_connection(("127.0.0.1", port_box["port"]))
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    lat = []
+    _calls["n"] = 0
+    for _ in range(batches):
+        t0 = time.perf_counter()
+        s.sendall(batch)
+        got = 0
+        while got < expect:
+            got += len(s.recv(4096))
+        lat.append(time.perf_counter() - t0)
+    sends = _calls["n"]
+    s.close()
+    stop_box["loop"].call_soon_threadsafe(stop_box["stop"].set)
+    th.join()
+    lat.sort()
+    return {
+        "sends_per_batch": sends / batches,
+        "p50_us": statistics.median(lat) * 1e6,
+        "p99_us": lat[int(len(lat) * 0.99) - 1] * 1e6,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--batches", type=int, default=2000)
+    ap.add_argument("--pairs", type=int, default=4, help="ACK + :h?# pairs per batch (default: 4)")
+    args = ap.parse_args()
+
+    socket.socket.send = _count(socket.socket.send)
+    socket.socket.sendmsg = _count(socket.socket.sendmsg)
+    for coalesce in (False, True):
+        r = run_mode(coalesce, args.batches, args.pairs)
+        name = "coalesced" if coalesce else "per-reply"
+        print(f"{name:10s} {r['sends_per_batch']:6.2f} send syscalls/batch  "
+              f"p50 {r['p50_us']:8.1f} us  p99 {r['p99_us']:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
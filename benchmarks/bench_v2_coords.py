@@ -0,0 +1,69 @@
+"""
+RA/Dec → Alt/Az (and back) throughput in lx200emulator_v2: scalar calls vs the
+array API, NumPy backend (if installed) and pure-Python fallback.
+
+Points are random RA/Dec with a random time each (Julian dates over one year),
+as for a horizon-visibility table.
+
+Usage:
+  uv run python -m benchmarks.bench_v2_coords [--n 1000000] [--scalar-n 100000]
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import random
+import time
+
+import lx200emulator_v2 as v2
+
+LAT, LON = 40.75, -74.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--n", type=int, default=1_000_000, help="points for the array API")
+    ap.add_argument("--scalar-n", type=int, default=100_000, help="points for the scalar-call baseline")
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    jd0 = v2.julian_date(datetime.datetime(2024, 1, 1))
+    ra = [rng.uniform(0.0, 24.0) for _ in range(args.n)]
+    dec = [rng.uniform(-89.0, 89.0) for _ in range(args.n)]
+    jd = [jd0 + rng.uniform(0.0, 365.0) for _ in range(args.n)]
+    t0 = datetime.datetime(2024, 1, 1)
+    utc = [t0 + datetime.timedelta(days=j - jd0) for j in jd[:args.scalar_n]]
+
+    print(f"{'path':>26s} {'points':>9s} {'seconds':>9s} {'Mpts/s':>8s}")
+
+    def report(name: str, n: int, secs: float) -> None:
+        print(f"{name:>26s} {n:9d} {secs:9.3f} {n / secs / 1e6:8.2f}")
+
+    start = time.perf_counter()
+    for r, d, u in zip(ra, dec, utc):
+        v2.radec_to_altaz(r, d, LAT, LON, u)
+    report("scalar radec_to_altaz", len(utc), time.perf_counter() - start)
+
+    start = time.perf_counter()
+    alt, az = v2.radec_to_altaz_array(ra, dec, LAT, LON, jd, use_numpy=False)
+    report("array, pure Python", args.n, time.perf_counter() - start)
+
+    if v2.np is None:
+        print("NumPy not installed; vectorised backend skipped")
+        return
+    np = v2.np
+    ra_a, dec_a, jd_a = np.asarray(ra), np.asarray(dec), np.asarray(jd)
+    start = time.perf_counter()
+    alt_n, az_n = v2.radec_to_altaz_array(ra_a, dec_a, LAT, LON, jd_a, use_numpy=True)
+    report("array, NumPy", args.n, time.perf_counter() - start)
+    start = time.perf_counter()
+    ra_r, dec_r = v2.altaz_to_radec_array(alt_n, az_n, LAT, LON, jd_a, use_numpy=True)
+    report("array, NumPy (inverse)", args.n, time.perf_counter() - start)
+
+    d_ra = np.abs((ra_r - ra_a + 12.0) % 24.0 - 12.0) * 15.0
+    print(f"max |NumPy - Python| alt {np.max(np.abs(alt_n - np.asarray(alt))):.1e}°, "
+          f"round-trip RA {np.max(d_ra):.1e}°, Dec {np.max(np.abs(dec_r - dec_a)):.1e}°")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Per-command dispatch cost in lx200emulator_v2: table-driven _dispatch (working
+tree) vs the if/startswith chain of an earlier revision loaded from git.
+
+Times TelescopeStateMachine._dispatch for the hot polling commands plus a few
+:S commands (which used uncompiled re.match chains).
+
+Usage:
+  uv run python -m benchmarks.bench_v2_dispatch [--baseline REV] [--n 20000]
+
+--baseline defaults to the repository's first commit.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+COMMANDS = [":GR", ":GD", ":GA", ":GZ", ":ED", ":GW", ":Sr05:30:30", ":Sd-05*23:00", ":Sw4"]
+
+
+def _load(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def load_revision(rev: str):
+    src = subprocess.run(["git", "show", f"{rev}:lx200emulator_v2.py"], cwd=REPO_ROOT,
+                         check=True, capture_output=True, text=True).stdout
+    tmp = Path(tempfile.mkdtemp()) / "lx200emulator_v2_baseline.py"
+    tmp.write_text(src, encoding="utf-8")
+    return _load(tmp, "lx200emulator_v2_baseline")
+
+
+def per_call_us(sm, cmd: str, n: int) -> float:
+    dispatch = sm._dispatch
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            dispatch(cmd)
+        best = min(best, time.perf_counter() - t0)
+    return best / n * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--baseline", default=None, help="git revision to compare against (default: first commit)")
+    ap.add_argument("--n", type=int, default=20000, help="calls per command per round")
+    args = ap.parse_args()
+
+    rev = args.baseline or subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=REPO_ROOT,
+                                          check=True, capture_output=True, text=True).stdout.split()[0]
+    old = load_revision(rev)
+    new = _load(REPO_ROOT / "lx200emulator_v2.py", "lx200emulator_v2_current")
+    sm_old, sm_new = old.TelescopeStateMachine(), new.TelescopeStateMachine()
+
+    print(f"baseline {rev[:10]}", file=sys.stderr)
+    print(f"{'command':>14s} {'baseline us':>12s} {'table us':>10s} {'speedup':>8s}")
+    for cmd in COMMANDS:
+        t_old = per_call_us(sm_old, cmd, args.n)
+        t_new = per_call_us(sm_new, cmd, args.n)
+        print(f"{cmd:>14s} {t_old:12.2f} {t_new:10.2f} {t_old / t_new:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Reply latency of lx200emulator_v2.py: legacy polling loop vs selector server.
+
+The legacy loop serves one client at a time and sleeps 50 ms per recv/flush
+cycle; the selector server replies as soon as a command is dispatched and
+serves all clients concurrently. Both are spawned on free ports and driven by
+benchmarks.loadgen.
+
+Usage:
+  uv run python -m benchmarks.bench_v2_latency [--clients 1 4] [--duration 3] [--mix skysafari]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from .loadgen import _free_port, parse_mix, run_load, spawn_target, summarize
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--clients", type=int, nargs="+", default=[1, 4])
+    ap.add_argument("--duration", type=float, default=3.0)
+    ap.add_argument("--mix", default="skysafari")
+    ap.add_argument("--timeout", type=float, default=5.0)
+    args = ap.parse_args()
+    mix = parse_mix(args.mix)
+
+    print(f"{'server':>10s} {'clients':>7s} {'cmd/s':>10s} {'p50 ms':>9s} {'p99 ms':>9s} {'timeouts':>8s}")
+    for n in args.clients:
+        for target in ("v2-legacy", "v2"):
+            port = _free_port()
+            proc = spawn_target(target, port)
+            try:
+                res, elapsed = asyncio.run(run_load("127.0.0.1", port, mix, n, args.duration, 0.0, args.timeout))
+            finally:
+                proc.terminate()
+                proc.wait(timeout=5)
+            r = summarize(res, elapsed)
+            lat = r["latency_ms"]
+            name = "legacy" if target == "v2-legacy" else "selector"
+            print(f"{name:>10s} {n:7d} {r['cmds_per_s']:10.1f} {lat['p50'] or 0:9.2f} {lat['p99'] or 0:9.2f} "
+                  f"{r['timeouts']:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+lx200emulator_v2 send buffer: str concatenation + 16-char re-slicing (the
+original send_buffer) vs ReplyQueue (deque of bytes + read offset).
+
+Both push the same replies and drain them in 16-byte serial chunks; ReplyQueue
+is also timed draining everything as one gather write.
+
+Usage:
+  uv run python -m benchmarks.bench_v2_send_buffer [--kb 64 256 1024]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from lx200emulator_v2 import ReplyQueue
+
+REPLY = "\x97Select Item:     Object         #"
+
+
+def str_buffer(n_replies: int) -> float:
+    t0 = time.perf_counter()
+    buf = ""
+    for _ in range(n_replies):
+        buf += REPLY
+    while buf:
+        chunk, buf = buf[:16], buf[16:]
+        chunk.encode("latin-1")
+    return time.perf_counter() - t0
+
+
+def queue_chunks(n_replies: int) -> float:
+    t0 = time.perf_counter()
+    q = ReplyQueue()
+    for _ in range(n_replies):
+        q.push(REPLY.encode("latin-1"))
+    while len(q):
+        q.pop(16)
+    return time.perf_counter() - t0
+
+
+def queue_gather(n_replies: int) -> float:
+    t0 = time.perf_counter()
+    q = ReplyQueue()
+    for _ in range(n_replies):
+        q.push(REPLY.encode("latin-1"))
+    q.drain()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--kb", type=int, nargs="+", default=[64, 256, 1024])
+    args = ap.parse_args()
+    print(f"{'pending':>9s} {'str+slice ms':>13s} {'queue/16 ms':>12s} {'queue gather ms':>16s}")
+    for kb in args.kb:
+        n = kb * 1024 // len(REPLY)
+        print(f"{kb:>6d} KB {str_buffer(n) * 1e3:13.1f} {queue_chunks(n) * 1e3:12.1f} {queue_gather(n) * 1e3:16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Load generator for the LX200 emulators.
+
+Opens N concurrent TCP clients, each replaying a command mix as one pipelined write
+per round, and measures per-command reply latency. Works against any of the
+emulators in this repo (or a real bridge): scopeboss_emulator.server,
+lx200emulator_v2.py and scopeboss_lx200gps_emulator.py.
+
+Reports commands/sec, p50/p99 reply latency, NAK rate, timeouts and connection
+errors, and can emit the result as JSON for regression tracking.
+
+Usage:
+  # against an already running emulator
+  uv run python -m benchmarks.loadgen --port 4030 --mix skysafari --clients 20 --duration 10
+  # spawn the target on a free port first
+  uv run python -m benchmarks.loadgen --spawn v2 --mix astropad --clients 4 --json -
+  # every (target, default mix) pair, one JSON document
+  uv run python -m benchmarks.loadgen --suite --duration 5 --json results.json
+
+Custom mixes: --mix ':GR#=hash,:GD#=hash'  (reply kinds: hash, byte, none; \\x06 for ACK)
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+NAK = 0x15
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# (command, reply kind): 'hash' = '#'-terminated string, 'byte' = one byte,
+# 'none' = no reply. A NAK (0x15) in place of any reply ends it and counts as a NAK.
+MIXES: Dict[str, List[Tuple[str, str]]] = {
+    # SkySafari-style position polling
+    "skysafari": [(":GR#", "hash"), (":GD#", "hash")],
+    # Astropad-style handset display polling (see astropad-20231013.log)
+    "astropad": [(":ED#", "hash"), (":G0#", "hash")],
+    # subset understood by the ScopeBoss home/park/focus emulators
+    "scopeboss": [("\x06", "byte"), (":h?#", "byte")],
+}
+
+# How to start each emulator on a given port (cwd = repo root)
+TARGETS: Dict[str, List[str]] = {
+    "scopeboss": [sys.executable, "-m", "scopeboss_emulator.server", "--port", "{port}"],
+    "v2": [sys.executable, "lx200emulator_v2.py", "{port}"],
+    "v2-threaded": [sys.executable, "lx200emulator_v2.py", "{port}", "--server", "threaded"],
+    "v2-legacy": [sys.executable, "lx200emulator_v2.py", "{port}", "--server", "legacy"],
+    "gps": [sys.executable, "scopeboss_lx200gps_emulator.py", "--port", "{port}"],
+}
+
+SUITE = [("scopeboss", "scopeboss"), ("gps", "scopeboss"), ("v2", "skysafari"), ("v2", "astropad")]
+
+
+def parse_mix(spec: str) -> List[Tuple[str, str]]:
+    if spec in MIXES:
+        return MIXES[spec]
+    mix = []
+    for item in spec.split(","):
+        cmd, _, kind = item.partition("=")
+        cmd = cmd.replace("\\x06", "\x06")
+        kind = kind or "hash"
+        if kind not in ("hash", "byte", "none"):
+            raise ValueError(f"unknown reply kind {kind!r} in mix item {item!r}")
+        mix.append((cmd, kind))
+    return mix
+
+
+def percentile(sorted_vals: List[float], p: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_vals:
+        return None
+    k = max(0, math.ceil(p / 100.0 * len(sorted_vals)) - 1)
+    return sorted_vals[k]
+
+
+@dataclass
+class Results:
+    sent: int = 0
+    replies: int = 0
+    naks: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+
+    def record(self, cmd: str, seconds: float) -> None:
+        self.latencies.setdefault(cmd, []).append(seconds)
+
+
+def _consume(buf: bytearray, pending: List[Tuple[str, str]], t0: float, now: float, res: Results) -> None:
+    """Match buffered reply bytes to pending commands in order."""
+    while pending and buf:
+        cmd, kind = pending[0]
+        if buf[0] == NAK:
+            del buf[0]
+            res.naks += 1
+        elif kind == "byte":
+            del buf[0]
+        else:
+            end = buf.find(b"#")
+            if end < 0:
+                return
+            del buf[:end + 1]
+        pending.pop(0)
+        res.replies += 1
+        res.record(cmd, now - t0)
+
+
+async def run_client(host: str, port: int, mix: List[Tuple[str, str]], deadline: float,
+                     interval: float, timeout: float, res: Results) -> None:
+    payload = "".join(cmd for cmd, _ in mix).encode("latin-1")
+    expected = [(cmd, kind) for cmd, kind in mix if kind != "none"]
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        if writer is None:
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+                writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, asyncio.TimeoutError):
+                res.errors += 1
+                await asyncio.sleep(min(timeout, 0.1))
+                continue
+        buf = bytearray()
+        pending = list(expected)
+        t0 = time.perf_counter()
+        try:
+            writer.write(payload)
+            res.sent += len(mix)
+            while pending:
+                left = t0 + timeout - time.perf_counter()
+                if left <= 0:
+                    raise asyncio.TimeoutError
+                data = await asyncio.wait_for(reader.read(4096), left)
+                if not data:
+                    raise ConnectionResetError("server closed connection")
+                buf += data
+                _consume(buf, pending, t0, time.perf_counter(), res)
+        except asyncio.TimeoutError:
+            # replies lost or out of sync: count and reconnect
+            res.timeouts += len(pending)
+            writer.close()
+            writer = None
+            continue
+        except OSError:
+            res.errors += 1
+            writer.close()
+            writer = None
+            continue
+        if interval > 0:
+            await asyncio.sleep(interval)
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(host: str, port: int, mix: List[Tuple[str, str]], clients: int,
+                   duration: float, interval: float, timeout: float) -> Tuple[Results, float]:
+    res = Results()
+    t_start = time.perf_counter()
+    deadline = t_start + duration
+    await asyncio.gather(*(run_client(host, port, mix, deadline, interval, timeout, res) for _ in range(clients)))
+    return res, time.perf_counter() - t_start
+
+
+def _latency_summary(vals: List[float]) -> dict:
+    vals = sorted(vals)
+    ms = lambda v: None if v is None else round(v * 1000.0, 3)
+    return {
+        "count": len(vals),
+        "p50": ms(percentile(vals, 50)),
+        "p99": ms(percentile(vals, 99)),
+        "mean": ms(sum(vals) / len(vals)) if vals else None,
+        "max": ms(vals[-1]) if vals else None,
+    }
+
+
+def summarize(res: Results, elapsed: float, **meta) -> dict:
+    all_lat = [v for vals in res.latencies.values() for v in vals]
+    return {
+        **meta,
+        "elapsed_s": round(elapsed, 3),
+        "commands_sent": res.sent,
+        "replies": res.replies,
+        "naks": res.naks,
+        "timeouts": res.timeouts,
+        "connect_errors": res.errors,
+        "cmds_per_s": round(res.replies / elapsed, 1) if elapsed > 0 else 0.0,
+        "nak_rate": round(res.naks / res.replies, 4) if res.replies else 0.0,
+        "latency_ms": _latency_summary(all_lat),
+        "per_command_ms": {cmd: _latency_summary(vals) for cmd, vals in res.latencies.items()},
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_target(name: str, port: int) -> subprocess.Popen:
+    argv = [a.format(port=port) for a in TARGETS[name]]
+    proc = subprocess.Popen(argv, cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                            env={**os.environ, "PYTHONPATH": str(REPO_ROOT)})
+    t_end = time.monotonic() + 5.0
+    while time.monotonic() < t_end:
+        if proc.poll() is not None:
+            raise RuntimeError(f"target {name!r} exited with code {proc.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError(f"target {name!r} did not start listening on port {port}")
+
+
+def run_one(args, target: Optional[str], mix_name: str) -> dict:
+    mix = parse_mix(mix_name)
+    host, port, proc = args.host, args.port, None
+    if target is not None:
+        host, port = "127.0.0.1", _free_port()
+        proc = spawn_target(target, port)
+    try:
+        res, elapsed = asyncio.run(run_load(host, port, mix, args.clients, args.duration,
+                                            args.interval, args.timeout))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=5)
+    return summarize(res, elapsed, target=target or f"{host}:{port}", mix=mix_name,
+                     clients=args.clients, duration_s=args.duration)
+
+
+def _print_human(r: dict) -> None:
+    lat = r["latency_ms"]
+    print(f"{r['target']:>10s} {r['mix']:>10s}  clients={r['clients']:<4d} "
+          f"{r['cmds_per_s']:>10.1f} cmd/s  p50={lat['p50']} ms  p99={lat['p99']} ms  "
+          f"nak_rate={r['nak_rate']:.2%}  timeouts={r['timeouts']}  errors={r['connect_errors']}",
+          file=sys.stderr)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=4030)
+    ap.add_argument("--spawn", choices=sorted(TARGETS), default=None,
+                    help="start this emulator on a free port and load it")
+    ap.add_argument("--suite", action="store_true",
+                    help="spawn and load every target with its default mix: " +
+                         ", ".join(f"{t}/{m}" for t, m in SUITE))
+    ap.add_argument("--mix", default="skysafari",
+                    help=f"named mix ({', '.join(MIXES)}) or 'cmd=kind,...' (default: skysafari)")
+    ap.add_argument("--clients", type=int, default=10)
+    ap.add_argument("--duration", type=float, default=10.0, help="seconds per run (default: 10)")
+    ap.add_argument("--interval", type=float, default=0.0,
+                    help="per-client pause between rounds in seconds (default: 0, closed loop)")
+    ap.add_argument("--timeout", type=float, default=2.0, help="per-round reply timeout in seconds")
+    ap.add_argument("--json", default=None, help="write JSON results to this path ('-' for stdout)")
+    args = ap.parse_args()
+
+    if args.suite:
+        results = [run_one(args, target, mix) for target, mix in SUITE]
+    else:
+        results = [run_one(args, args.spawn, args.mix)]
+    for r in results:
+        _print_human(r)
+
+    if args.json:
+        doc = {"generated_at": time.time(), "results": results}
+        text = json.dumps(doc, indent=2)
+        if args.json == "-":
+            print(text)
+        else:
+            Path(args.json).write_text(text + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,521 @@
+"""
+Replay a recorded session against an emulator and diff the replies.
+
+Streams a capture (capture.py binary, the bridge's 'ts:W|R:msg' text log, or
+a tcpick dump such as astropad-20231013.log), sends each W record to the
+target at its recorded time divided by --time-scale (0: as fast as the target
+answers, one record at a time), and compares every reply with the one in the
+recording. Commands are cut from the W side with split_frames (anything else,
+e.g. a Celestron 'e', is one command per record) and replies from both sides
+with the command's reply format in MeadeLX200protocol.json, so pipelined
+commands and replies split over several reads pair up in order.
+
+Reports, per command (spec template, e.g. ':SrHH:MM.T#'): count, exact and
+shape mismatches (shape: digits ignored, for position/time polling), timeouts,
+the target's reply latency and the latency in the recording, plus the first
+mismatching exchange. Records are streamed and latencies kept in log-spaced
+histograms, so memory does not grow with the capture.
+
+Usage:
+  uv run python -m benchmarks.replay skysafari-celestronAdvancedGT.log --spawn v2
+  uv run python -m benchmarks.replay astropad.lxcap --in-process lx200gps --time-scale 0
+  uv run python -m benchmarks.replay session.log --port 4030 --json report.json
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import json
+import math
+import selectors
+import socket
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from buffered_log import OFF
+from capture import Record, iter_records
+from lx200_protocol import NONE, QUIET, ProtocolSpec, reply_length, split_frames
+
+from .loadgen import TARGETS, _free_port, spawn_target
+
+NAK = b"\x15"
+BUCKETS_PER_DECADE = 20
+MIN_LATENCY = 1e-6
+
+
+class LatencyHistogram:
+    """Log-spaced latency buckets from 1 µs (about 12 % wide); exact count, mean and max."""
+
+    def __init__(self):
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        b = int(math.log10(max(seconds, MIN_LATENCY) / MIN_LATENCY) * BUCKETS_PER_DECADE)
+        self.buckets[b] = self.buckets.get(b, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float | None:
+        """Upper edge of the bucket holding the nearest-rank percentile."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(p / 100.0 * self.count))
+        seen = 0
+        for b in sorted(self.buckets):
+            seen += self.buckets[b]
+            if seen >= rank:
+                return min(self.max, MIN_LATENCY * 10 ** ((b + 1) / BUCKETS_PER_DECADE))
+        return self.max
+
+    def summary(self) -> dict:
+        ms = lambda v: None if v is None else round(v * 1000.0, 3)
+        return {
+            "count": self.count,
+            "p50": ms(self.percentile(50)),
+            "p99": ms(self.percentile(99)),
+            "mean": ms(self.total / self.count) if self.count else None,
+            "max": ms(self.max) if self.count else None,
+        }
+
+
+@dataclass
+class CommandReport:
+    count: int = 0
+    mismatches: int = 0
+    shape_mismatches: int = 0
+    timeouts: int = 0
+    unmatched: int = 0            # no reply in the recording to compare with
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    recorded: LatencyHistogram = field(default_factory=LatencyHistogram)
+    example: tuple | None = None  # first mismatch: (command, recorded, replayed)
+
+
+# ---- Targets -----------------------------------------------------------------
+
+class TcpTarget:
+    """A running emulator (or bridge): one connection per capture client, opened on first use."""
+
+    synchronous = False
+    quiet = 0.05    # an undelimited reply ends after this long without bytes
+
+    def __init__(self, host: str, port: int, timeout: float = 2.0):
+        self.addr = (host, port)
+        self.timeout = timeout
+        self._socks: dict[int, socket.socket] = {}
+        self._sel = selectors.DefaultSelector()
+
+    def send(self, client: int, data: bytes) -> None:
+        sock = self._socks.get(client)
+        if sock is None:
+            sock = socket.create_connection(self.addr, timeout=self.timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._socks[client] = sock
+            self._sel.register(sock, selectors.EVENT_READ, client)
+        sock.sendall(data)
+
+    def poll(self, timeout: float) -> list[tuple[int, bytes]]:
+        """(client, bytes) read within timeout; waits at most timeout if nothing is there."""
+        if not self._socks:
+            time.sleep(timeout)
+            return []
+        out = []
+        for key, _events in self._sel.select(timeout):
+            try:
+                data = key.fileobj.recv(65536)
+            except OSError:
+                data = b""
+            if not data:                       # closed by the target
+                self._sel.unregister(key.fileobj)
+                key.fileobj.close()
+                del self._socks[key.data]
+                continue
+            out.append((key.data, data))
+        return out
+
+    def close(self) -> None:
+        for sock in self._socks.values():
+            sock.close()
+        self._socks.clear()
+        self._sel.close()
+
+
+class SessionTarget:
+    """
+    lx200emulator_v2 in this process: one ClientSession per capture client on a
+    shared TelescopeStateMachine, no sockets. Replies are complete when send()
+    returns, so a reply still missing afterwards is a timeout right away.
+    """
+
+    synchronous = True
+    quiet = 0.0
+
+    def __init__(self, mode: str = "lx200gps"):
+        import lx200emulator_v2 as v2
+        for category in ("commands", "tx", "display", "motion", "server"):
+            v2.LOG.set_level(category, OFF)
+        self._v2 = v2
+        self.state_machine = v2.TelescopeStateMachine(mode)
+        self._sessions: dict = {}
+        self._ready: list[tuple[int, bytes]] = []
+
+    def send(self, client: int, data: bytes) -> None:
+        session = self._sessions.get(client)
+        if session is None:
+            session = self._sessions[client] = self._v2.ClientSession(self.state_machine)
+        session.feed(data)
+        reply = b"".join(session.pop_replies())
+        if reply:
+            self._ready.append((client, reply))
+
+    def poll(self, timeout: float) -> list[tuple[int, bytes]]:
+        if not self._ready:
+            if timeout > 0:
+                time.sleep(timeout)
+            return []
+        out, self._ready = self._ready, []
+        return out
+
+    def close(self) -> None:
+        self._sessions.clear()
+
+
+# ---- Replay engine -----------------------------------------------------------
+
+def _shape(reply: bytes) -> bytes:
+    return reply.translate(_DIGITS_TO_ZERO)
+
+
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+
+
+class _Stream:
+    """Per capture client: what was sent, and both reply streams not yet paired."""
+
+    __slots__ = ("inbuf", "sent", "rx", "rx_time", "pending", "exp_rx", "exp_ts", "actual", "expected")
+
+    def __init__(self):
+        self.inbuf = bytearray()               # W bytes not yet a complete command
+        self.sent = collections.deque()        # [key, frame, fmt, sent_at] awaiting the target's reply
+        self.rx = bytearray()                  # target bytes not yet cut into a reply
+        self.rx_time = 0.0
+        self.pending = collections.deque()     # [key, fmt, recorded W ts] awaiting the recorded reply
+        self.exp_rx = bytearray()              # recorded R bytes not yet cut into a reply
+        self.exp_ts = 0                        # ts_ns of the last R record added to exp_rx
+        self.actual = collections.deque()      # (key, frame, reply, latency, timed_out)
+        self.expected = collections.deque()    # (reply, recorded latency)
+
+
+class Replayer:
+    def __init__(
+        self,
+        target,
+        time_scale: float = 1.0,
+        timeout: float = 1.0,
+        spec: ProtocolSpec | None = None,
+    ):
+        if time_scale < 0:
+            raise ValueError(f"time_scale must be >= 0, got {time_scale}")
+        self.target = target
+        self.time_scale = time_scale
+        self.timeout = 0.0 if target.synchronous else timeout
+        self.quiet = target.quiet
+        self.spec = spec or ProtocolSpec.load()
+        self.commands: dict[str, CommandReport] = {}
+        self.records = 0
+        self.sent = 0
+        self.unsolicited = {"recorded": 0, "replayed": 0}    # bytes with no command waiting
+        self.elapsed = 0.0
+        self._streams: dict[int, _Stream] = {}
+        self._keys: dict[bytes, str] = {}
+
+    # ---- Driving -----------------------------------------------------------
+
+    def run(self, records: Iterable[Record], limit: int | None = None) -> dict:
+        start = time.perf_counter()
+        first_ns = None
+        for rec in records:
+            if limit is not None and self.records >= limit:
+                break
+            self.records += 1
+            s = self._streams.get(rec.client)
+            if s is None:
+                s = self._streams[rec.client] = _Stream()
+            if rec.direction == "R":
+                if s.pending:
+                    s.exp_rx += rec.data
+                    s.exp_ts = rec.ts_ns
+                    self._cut_expected(s, boundary=False)
+                else:
+                    self.unsolicited["recorded"] += len(rec.data)
+                continue
+            s.inbuf += rec.data
+            frames = split_frames(s.inbuf)
+            if s.inbuf and s.inbuf[0] != ord(":"):   # not LX200 framing: the record is the command
+                frames.append(bytes(s.inbuf))
+                s.inbuf.clear()
+            if not frames:
+                continue
+            self._cut_expected(s, boundary=True)
+            if first_ns is None:
+                first_ns = rec.ts_ns
+            if self.time_scale > 0:
+                self._wait(start + (rec.ts_ns - first_ns) / 1e9 / self.time_scale)
+            else:
+                self._wait(None)
+            # a synchronous target answers each command before the next is sent, which
+            # keeps an undelimited reply from swallowing the replies after it
+            batches = [[f] for f in frames] if self.target.synchronous else [frames]
+            for batch in batches:
+                now = time.perf_counter()
+                for frame in batch:
+                    key = self._key(frame)
+                    fmt = self.spec.reply_format(frame)
+                    s.sent.append([key, frame, fmt, now])
+                    s.pending.append([key, fmt, rec.ts_ns])
+                self.sent += len(batch)
+                self.target.send(rec.client, b"".join(batch))
+                self._receive(0.0)
+                self._take_actual(s, time.perf_counter())
+        self._wait(None)
+        for s in self._streams.values():
+            self._cut_expected(s, boundary=bool(s.exp_rx))
+            while s.pending:                         # the recording ends before these replies
+                s.pending.popleft()
+                s.expected.append((None, None))
+            self._pair(s)
+        self.elapsed = time.perf_counter() - start
+        return self.report()
+
+    def _wait(self, until: float | None) -> None:
+        """Route target replies until `until` (None: until nothing is outstanding)."""
+        while True:
+            now = time.perf_counter()
+            busy = [s for s in self._streams.values() if s.sent]
+            if until is None and not busy:
+                return
+            if until is not None and now >= until:
+                return
+            timeout = 0.25 if until is None else until - now
+            for s in busy:
+                timeout = min(timeout, s.sent[0][3] + self.timeout - now)
+                if s.sent[0][2].kind == QUIET:
+                    timeout = min(timeout, max(s.sent[0][3], s.rx_time) + self.quiet - now)
+            self._receive(max(0.0, timeout))
+            now = time.perf_counter()
+            for s in busy:
+                self._take_actual(s, now)
+
+    def _receive(self, timeout: float) -> None:
+        for client, data in self.target.poll(timeout):
+            s = self._streams[client]
+            if s.sent:
+                s.rx += data
+                s.rx_time = time.perf_counter()
+            else:
+                self.unsolicited["replayed"] += len(data)
+
+    # ---- Cutting and pairing replies ---------------------------------------
+
+    def _take_actual(self, s: _Stream, now: float) -> None:
+        rx = s.rx
+        while s.sent:
+            key, frame, fmt, sent_at = s.sent[0]
+            timed_out = False
+            if fmt.kind == NONE:
+                n = 0
+            elif rx[:1] == NAK:                  # NAK ends any reply
+                n = 1
+            else:
+                n = reply_length(fmt, rx)
+                if n is None and fmt.kind == QUIET and now - max(sent_at, s.rx_time) >= self.quiet:
+                    n = len(rx)
+                if n is None:
+                    if now - sent_at < self.timeout:
+                        break
+                    n, timed_out = len(rx), True
+            reply = bytes(rx[:n])
+            del rx[:n]
+            latency = s.rx_time - sent_at if reply else None
+            s.sent.popleft()
+            s.actual.append((key, frame, reply, latency, timed_out))
+        if not s.sent:
+            rx.clear()
+        self._pair(s)
+
+    def _cut_expected(self, s: _Stream, boundary: bool) -> None:
+        """
+        Cut recorded replies for the commands waiting for one. An undelimited
+        reply ends at the client's next command (boundary) or with the last
+        bytes the recording has; its recorded latency runs to the last R
+        record it includes, not to that next command.
+        """
+        ts_ns = s.exp_ts
+        rx = s.exp_rx
+        while s.pending:
+            key, fmt, w_ts = s.pending[0]
+            if fmt.kind == NONE:
+                n = 0
+            elif rx[:1] == NAK:
+                n = 1
+            else:
+                n = reply_length(fmt, rx)
+                if n is None and fmt.kind == QUIET and boundary:
+                    n = len(rx)
+                if n is None:
+                    break
+            reply = bytes(rx[:n])
+            del rx[:n]
+            s.pending.popleft()
+            s.expected.append((reply, (ts_ns - w_ts) / 1e9 if reply and ts_ns >= w_ts else None))
+        if not s.pending and rx:
+            self.unsolicited["recorded"] += len(rx)
+            rx.clear()
+        self._pair(s)
+
+    def _pair(self, s: _Stream) -> None:
+        while s.actual and s.expected:
+            key, frame, got, latency, timed_out = s.actual.popleft()
+            want, recorded = s.expected.popleft()
+            r = self.commands.get(key)
+            if r is None:
+                r = self.commands[key] = CommandReport()
+            r.count += 1
+            if latency is not None:
+                r.latency.add(latency)
+            if recorded is not None:
+                r.recorded.add(recorded)
+            if timed_out:
+                r.timeouts += 1
+            if want is None:
+                r.unmatched += 1
+            elif got != want:
+                r.mismatches += 1
+                if _shape(got) != _shape(want):
+                    r.shape_mismatches += 1
+                if r.example is None:
+                    r.example = (frame, want, got)
+
+    def _key(self, frame: bytes) -> str:
+        key = self._keys.get(frame)
+        if key is None:
+            entry = self.spec.lookup(frame)
+            if entry is not None:
+                key = entry.template
+            else:                                    # bounded: unknown commands by their first bytes
+                key = frame.decode("latin-1") if len(frame) <= 2 else frame[:2].decode("latin-1") + "..."
+            if len(self._keys) < 4096:
+                self._keys[frame] = key
+        return key
+
+    # ---- Report ------------------------------------------------------------
+
+    def report(self) -> dict:
+        show = lambda b: None if b is None else b.decode("latin-1")
+        per_command = {}
+        totals = collections.Counter()
+        for key, r in sorted(self.commands.items(), key=lambda kv: -kv[1].count):
+            per_command[key] = {
+                "count": r.count,
+                "mismatches": r.mismatches,
+                "shape_mismatches": r.shape_mismatches,
+                "timeouts": r.timeouts,
+                "unmatched": r.unmatched,
+                "latency_ms": r.latency.summary(),
+                "recorded_ms": r.recorded.summary(),
+                "example": None if r.example is None else dict(zip(("sent", "recorded", "replayed"),
+                                                                   map(show, r.example))),
+            }
+            totals.update(count=r.count, mismatches=r.mismatches, shape_mismatches=r.shape_mismatches,
+                          timeouts=r.timeouts, unmatched=r.unmatched)
+        return {
+            "elapsed_s": round(self.elapsed, 3),
+            "records": self.records,
+            "commands_sent": self.sent,
+            "compared": totals["count"] - totals["unmatched"],
+            "mismatches": totals["mismatches"],
+            "shape_mismatches": totals["shape_mismatches"],
+            "timeouts": totals["timeouts"],
+            "unsolicited_bytes": dict(self.unsolicited),
+            "per_command": per_command,
+        }
+
+
+def _escape(text: str, width: int = 0) -> str:
+    text = text.encode("latin-1", "replace").decode("ascii", "backslashreplace")
+    return text if not width or len(text) <= width else text[:width - 3] + "..."
+
+
+def print_report(r: dict, file=sys.stderr) -> None:
+    print(f"{r['records']} records, {r['commands_sent']} commands in {r['elapsed_s']} s: "
+          f"{r['compared']} compared, {r['mismatches']} mismatches "
+          f"({r['shape_mismatches']} in shape), {r['timeouts']} timeouts", file=file)
+    print(f"{'command':<18s} {'count':>7s} {'mismatch':>8s} {'shape':>7s} {'timeout':>7s} "
+          f"{'p50 ms':>8s} {'p99 ms':>8s} {'rec p50':>8s}", file=file)
+    fmt = lambda v: "-" if v is None else f"{v:.3f}"
+    for key, c in r["per_command"].items():
+        print(f"{_escape(key, 18):<18s} {c['count']:>7d} {c['mismatches']:>8d} {c['shape_mismatches']:>7d} "
+              f"{c['timeouts']:>7d} {fmt(c['latency_ms']['p50']):>8s} {fmt(c['latency_ms']['p99']):>8s} "
+              f"{fmt(c['recorded_ms']['p50']):>8s}", file=file)
+    for key, c in r["per_command"].items():
+        ex = c["example"]
+        if ex is not None:
+            print(f"  {_escape(key)}: sent '{_escape(ex['sent'], 40)}' recorded '{_escape(ex['recorded'], 40)}' "
+                  f"replayed '{_escape(ex['replayed'], 40)}'", file=file)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("capture", help="capture (.lxcap), bridge text log or tcpick dump")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=4030)
+    ap.add_argument("--spawn", choices=sorted(TARGETS), default=None,
+                    help="start this emulator on a free port and replay against it")
+    ap.add_argument("--in-process", metavar="MODE", default=None,
+                    help="replay against lx200emulator_v2's state machine in this process "
+                         "(MODE: an EMULATOR_PROFILES key, e.g. lx200gps)")
+    ap.add_argument("--time-scale", type=float, default=1.0,
+                    help="replay N times faster than recorded; 0 = as fast as the target answers (default: 1)")
+    ap.add_argument("--timeout", type=float, default=1.0, help="per-reply timeout in seconds (default: 1)")
+    ap.add_argument("--limit", type=int, default=None, help="stop after N capture records")
+    ap.add_argument("--json", default=None, help="write the report as JSON to this path ('-' for stdout)")
+    args = ap.parse_args()
+    if args.time_scale < 0:
+        ap.error(f"--time-scale must be >= 0, got {args.time_scale}")
+
+    proc = None
+    if args.in_process is not None:
+        target = SessionTarget(args.in_process)
+        name = f"in-process:{args.in_process}"
+    else:
+        host, port = args.host, args.port
+        if args.spawn is not None:
+            host, port = "127.0.0.1", _free_port()
+            proc = spawn_target(args.spawn, port)
+        target = TcpTarget(host, port)
+        name = args.spawn or f"{host}:{port}"
+    try:
+        report = Replayer(target, args.time_scale, args.timeout).run(iter_records(args.capture), args.limit)
+    finally:
+        target.close()
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=5)
+    report = {"capture": args.capture, "target": name, "time_scale": args.time_scale, **report}
+    print_report(report)
+    if args.json:
+        text = json.dumps(report, indent=2)
+        if args.json == "-":
+            print(text)
+        else:
+            Path(args.json).write_text(text + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
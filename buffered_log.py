@@ -0,0 +1,191 @@
+"""
+Asynchronous, buffered logging for the emulator and the net2serial bridge.
+
+Callers append a record (timestamp, category, level, message, args) to a
+bounded in-memory queue and return; a background writer thread formats the
+records and writes them in batches, flushing once per batch instead of once
+per line. When the queue is full new records are dropped and counted, so a
+slow terminal or disk never stalls the command path.
+
+Each category (e.g. commands, tx, display, motion) has its own level; a
+record below its category's level is discarded before anything is formatted.
+
+Usage:
+  log = BufferedLog(levels={"tx": OFF})
+  log.log("commands", "CMD [%s]", cmd)
+  log.close()                              # drain and flush
+"""
+from __future__ import annotations
+
+import atexit
+import collections
+import logging
+import sys
+import threading
+import time
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+OFF = logging.CRITICAL + 10
+
+LEVEL_NAMES = {"debug": DEBUG, "info": INFO, "warning": WARNING, "off": OFF}
+
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_FLUSH_INTERVAL = 0.2   # seconds between writer batches
+
+
+def parse_levels(spec: str) -> dict[str, int]:
+    """Parse 'commands=off,tx=debug' into {category: level}."""
+    levels = {}
+    for item in filter(None, (s.strip() for s in spec.split(","))):
+        category, sep, name = item.partition("=")
+        if not sep or name.lower() not in LEVEL_NAMES:
+            raise ValueError(f"bad log level {item!r}; expected category=" + "|".join(LEVEL_NAMES))
+        levels[category.strip()] = LEVEL_NAMES[name.lower()]
+    return levels
+
+
+def format_bracketed(record: tuple) -> str:
+    """Default line format: '[YYYY-mm-dd@HH:MM:SS] message'."""
+    ts, _category, _level, msg, args = record
+    if args:
+        msg = msg % args
+    return f"[{time.strftime('%Y-%m-%d@%H:%M:%S', time.localtime(ts))}] {msg}\n"
+
+
+class BufferedLog:
+    """
+    Bounded record queue plus one writer thread. stream None means whatever
+    sys.stdout is at write time. The writer is started on the first record and
+    sleeps without a timer while the queue is empty.
+    """
+
+    def __init__(
+        self,
+        stream=None,
+        formatter=format_bracketed,
+        levels: dict[str, int] | None = None,
+        default_level: int = INFO,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        self.stream = stream
+        self.formatter = formatter
+        self.levels = dict(levels or {})
+        self.default_level = default_level
+        self.max_queue = max_queue
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._queue: collections.deque = collections.deque()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._lock = threading.Lock()        # writer start / close
+        self._full_lock = threading.Lock()   # overflow check + drop counter near max_queue
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._reported_drops = 0
+
+    # ---- Producer side ---------------------------------------------------
+
+    def enabled(self, category: str, level: int = INFO) -> bool:
+        return level >= self.levels.get(category, self.default_level)
+
+    def set_level(self, category: str, level: int) -> None:
+        self.levels[category] = level
+
+    def log(self, category: str, msg, *args, level: int = INFO) -> None:
+        """Queue one record; formatting (msg % args) happens on the writer thread."""
+        if level < self.levels.get(category, self.default_level) or self._closed:
+            return
+        queue = self._queue
+        record = (time.time(), category, level, msg, args)
+        was_empty = not queue
+        if len(queue) < self.max_queue // 2:
+            queue.append(record)       # far from full: no lock on the common path
+        else:
+            with self._full_lock:      # re-check and count drops exactly across threads
+                if len(queue) >= self.max_queue:
+                    self.dropped += 1
+                    return
+                queue.append(record)
+        if self._thread is None:
+            self._start()
+        elif was_empty or len(queue) >= self.max_queue // 2:
+            self._wake.set()   # wake an idle writer, or drain a filling queue early
+
+    # ---- Writer side -----------------------------------------------------
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="log-writer")
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            if not self._queue and self.dropped == self._reported_drops and not self._closed:
+                self._wake.wait()          # idle: no timer until log() queues a record
+                self._wake.clear()
+            if not self._closed:
+                self._wake.wait(self.flush_interval)   # let a batch collect
+            self._wake.clear()
+            self._write_batch()
+            if self._closed and not self._queue:
+                return
+
+    def _write_batch(self) -> None:
+        queue = self._queue
+        if not queue and self.dropped == self._reported_drops:
+            self._idle.set()
+            return
+        self._idle.clear()
+        lines = []
+        pop = queue.popleft
+        fmt = self.formatter
+        for _ in range(len(queue)):
+            try:
+                lines.append(fmt(pop()))
+            except Exception as e:   # a bad record must not kill the writer
+                lines.append(f"log format error: {e!r}\n")
+        self.written += len(lines)
+        dropped = self.dropped
+        if dropped != self._reported_drops:
+            lines.append(f"[log] {dropped - self._reported_drops} record(s) dropped "
+                         f"(queue full, {dropped} total)\n")
+            self._reported_drops = dropped
+        stream = self.stream if self.stream is not None else sys.stdout
+        try:
+            stream.write("".join(lines))
+            stream.flush()
+        except (OSError, ValueError):
+            pass   # closed stream / broken pipe: nothing sensible left to do
+        if not queue:
+            self._idle.set()
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Block until everything queued so far has been written."""
+        if self._thread is None or (not self._queue and self._idle.is_set()):
+            return
+        self._idle.clear()
+        self._wake.set()
+        self._idle.wait(timeout)
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Write what is queued, then stop the writer. Later records are ignored."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._wake.set()
+            thread.join(timeout)
+        else:
+            self._write_batch()
+
+    def stats(self) -> dict:
+        return {"queued": len(self._queue), "written": self.written, "dropped": self.dropped}
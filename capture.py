@@ -0,0 +1,437 @@
+"""
+Binary, indexed capture format for bridge traffic, plus converters.
+
+The bridge's text log ('1772468644.490:W::GR#') decodes bytes as ASCII, so
+non-ASCII bytes such as the 0x97/0x9f display prefixes are lost, and finding
+one moment of a multi-hour capture means scanning it from the top. A capture
+file keeps the raw bytes:
+
+  header   "LX200CAP", u16 version, u16 reserved, i64 wall offset (ns)
+  record   u32 length, i64 timestamp (ns), u16 client id, 1 byte 'W'|'R', data
+
+all little-endian. Timestamps are monotonic and never decrease within a file;
+timestamp + wall offset is Unix time in ns. A sidecar "<capture>.idx" holds
+one (timestamp, file offset) entry every INDEX_EVERY records, so reading from
+a given time is a bisect plus a short scan. The index can always be rebuilt
+from the capture (build_index), and a record cut short by a crash ends the
+capture instead of failing it.
+
+Converters:
+  text    the bridge's 'ts:W|R:msg' lines; continuation lines belong to the
+          record above. Written back with raw bytes, so text -> capture ->
+          text is lossless for what the text still had.
+  tcpick  'tcpick -yP' dumps like astropad-20231013.log. These carry neither
+          timestamps nor directions: each ESTABLISHED connection gets a client
+          id, each payload line becomes one record, a line made only of
+          ':...#' commands (or ACK) is W and anything else R, and records are
+          spaced TCPICK_SPACING_NS apart from the "Starting tcpick ... at"
+          time (taken as UTC).
+
+Usage:
+  python capture.py from-text skysafari-celestronAdvancedGT.log sky.lxcap
+  python capture.py from-tcpick astropad-20231013.log astropad.lxcap
+  python capture.py to-text sky.lxcap [OUT|-] [--from S] [--to S]
+  python capture.py info sky.lxcap
+  python capture.py index sky.lxcap            # rebuild the sidecar
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import calendar
+import re
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, NamedTuple
+
+MAGIC = b"LX200CAP"
+INDEX_MAGIC = b"LX200IDX"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHq")       # magic, version, reserved, wall offset ns
+_RECORD = struct.Struct("<IqHc")        # length, ts ns, client, direction
+_INDEX_HEADER = struct.Struct("<8sHHI")  # magic, version, reserved, records per entry
+_INDEX_ENTRY = struct.Struct("<qQ")     # ts ns, offset of the record
+
+INDEX_EVERY = 1024
+READ_CHUNK = 1 << 20
+WRITE_BUFFER = 1 << 18
+TCPICK_SPACING_NS = 1_000_000           # 1 ms between tcpick records
+
+
+class Record(NamedTuple):
+    ts_ns: int
+    direction: str      # 'W' (client -> mount) or 'R' (mount -> client)
+    client: int
+    data: bytes
+
+
+def index_path(path: str | Path) -> Path:
+    return Path(f"{path}.idx")
+
+
+class CaptureWriter:
+    """
+    Appends records to a new capture and its index. Thread-safe; writes go to
+    a WRITE_BUFFER-sized file buffer, so a record costs a struct pack and a
+    memory copy. Also usable as the bridge's traffic sink via log().
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        wall_offset_ns: int | None = None,
+        index_every: int = INDEX_EVERY,
+    ):
+        if wall_offset_ns is None:
+            wall_offset_ns = time.time_ns() - time.monotonic_ns()
+        self.path = Path(path)
+        self.wall_offset_ns = wall_offset_ns
+        self.index_every = index_every
+        self.records = 0
+        self.bytes = 0
+        self._last_ns = None
+        self._lock = threading.Lock()
+        self._f = open(self.path, "wb", buffering=WRITE_BUFFER)
+        self._idx = open(index_path(self.path), "wb")
+        self._f.write(_HEADER.pack(MAGIC, VERSION, 0, wall_offset_ns))
+        self._idx.write(_INDEX_HEADER.pack(INDEX_MAGIC, VERSION, 0, index_every))
+        self._offset = _HEADER.size
+
+    def write(self, direction: str, data: bytes, client: int = 0, ts_ns: int | None = None) -> None:
+        """Append one record; ts_ns defaults to now and is clamped to be non-decreasing."""
+        if ts_ns is None:
+            ts_ns = time.monotonic_ns()
+        with self._lock:
+            if self._f.closed:
+                return
+            if self._last_ns is not None and ts_ns < self._last_ns:
+                ts_ns = self._last_ns
+            self._last_ns = ts_ns
+            if self.records % self.index_every == 0:
+                self._idx.write(_INDEX_ENTRY.pack(ts_ns, self._offset))
+            self._f.write(_RECORD.pack(len(data), ts_ns, client, direction.encode("ascii")))
+            self._f.write(data)
+            self._offset += _RECORD.size + len(data)
+            self.records += 1
+            self.bytes += len(data)
+
+    def log(self, direction: str, data: bytes, client: int = 0) -> None:
+        """Bridge sink interface (same call as BufferedLog.log(direction, data, client))."""
+        self.write(direction, data, client)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._f.closed:
+                self._f.flush()
+                self._idx.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._f.closed:
+                return
+            self._f.close()
+            self._idx.close()
+
+    def __enter__(self) -> "CaptureWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _read_header(f: BinaryIO, path) -> int:
+    raw = f.read(_HEADER.size)
+    if len(raw) < _HEADER.size:
+        raise ValueError(f"{path}: not a capture file (too short)")
+    magic, version, _reserved, wall_offset_ns = _HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a capture file")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported capture version {version}")
+    return wall_offset_ns
+
+
+def _scan(f: BinaryIO, offset: int) -> Iterator[tuple[int, Record]]:
+    """(offset, record) from offset to the end, reading READ_CHUNK at a time."""
+    f.seek(offset)
+    buf = b""
+    pos = 0
+    unpack = _RECORD.unpack_from
+    head = _RECORD.size
+    while True:
+        if len(buf) - pos < head:
+            more = f.read(READ_CHUNK)
+            if not more:
+                return          # clean end, or a header cut short
+            buf = buf[pos:] + more
+            pos = 0
+            continue
+        length, ts_ns, client, direction = unpack(buf, pos)
+        end = pos + head + length
+        if end > len(buf):
+            more = f.read(max(READ_CHUNK, end - len(buf)))
+            if not more:
+                return          # data cut short
+            buf = buf[pos:] + more
+            pos = 0
+            continue
+        yield offset, Record(ts_ns, direction.decode("ascii"), client, buf[pos + head:end])
+        offset += end - pos
+        pos = end
+
+
+class CaptureReader:
+    """Streams records from a capture; records(start_ns) seeks through the index."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._f = open(self.path, "rb")
+        try:
+            self.wall_offset_ns = _read_header(self._f, self.path)
+        except ValueError:
+            self._f.close()
+            raise
+        self._index: tuple[list[int], list[int]] | None = None
+
+    def _load_index(self) -> tuple[list[int], list[int]]:
+        if self._index is None:
+            entries = None
+            try:
+                entries = read_index(self.path)
+            except (OSError, ValueError):
+                pass
+            if entries is None:
+                entries = build_index(self.path)
+            self._index = ([ts for ts, _ in entries], [off for _, off in entries])
+        return self._index
+
+    def records(self, start_ns: int | None = None, end_ns: int | None = None) -> Iterator[Record]:
+        """Records with start_ns <= ts < end_ns (monotonic ns), in file order."""
+        offset = _HEADER.size
+        if start_ns is not None:
+            times, offsets = self._load_index()
+            i = bisect.bisect_left(times, start_ns) - 1
+            if i >= 0:
+                offset = offsets[i]
+        for _offset, rec in _scan(self._f, offset):
+            if start_ns is not None and rec.ts_ns < start_ns:
+                continue
+            if end_ns is not None and rec.ts_ns >= end_ns:
+                return
+            yield rec
+
+    def wall_time(self, ts_ns: int) -> float:
+        """Unix time in seconds for a record timestamp."""
+        return (ts_ns + self.wall_offset_ns) / 1e9
+
+    def __iter__(self) -> Iterator[Record]:
+        return self.records()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "CaptureReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_index(path: str | Path) -> list[tuple[int, int]] | None:
+    """Entries of path's sidecar index, or None if there is none."""
+    try:
+        raw = index_path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    if len(raw) < _INDEX_HEADER.size:
+        raise ValueError(f"{index_path(path)}: truncated index")
+    magic, version, _reserved, _every = _INDEX_HEADER.unpack_from(raw)
+    if magic != INDEX_MAGIC or version != VERSION:
+        raise ValueError(f"{index_path(path)}: not a capture index")
+    n = (len(raw) - _INDEX_HEADER.size) // _INDEX_ENTRY.size
+    return [_INDEX_ENTRY.unpack_from(raw, _INDEX_HEADER.size + i * _INDEX_ENTRY.size) for i in range(n)]
+
+
+def build_index(path: str | Path, index_every: int = INDEX_EVERY) -> list[tuple[int, int]]:
+    """Rebuild path's sidecar index by scanning the capture; returns the entries."""
+    entries = []
+    with open(path, "rb") as f:
+        _read_header(f, path)
+        for n, (offset, rec) in enumerate(_scan(f, _HEADER.size)):
+            if n % index_every == 0:
+                entries.append((rec.ts_ns, offset))
+    with open(index_path(path), "wb") as idx:
+        idx.write(_INDEX_HEADER.pack(INDEX_MAGIC, VERSION, 0, index_every))
+        idx.writelines(_INDEX_ENTRY.pack(ts, off) for ts, off in entries)
+    return entries
+
+
+# ---- Text log ('ts:W|R:msg') -------------------------------------------------
+
+_TEXT_LINE = re.compile(rb"(\d+)(?:\.(\d{1,9}))?:([RW]):")
+
+
+def read_text(lines: Iterable[bytes]) -> Iterator[Record]:
+    """Records from the bridge's text log, read as bytes. Times are Unix ns."""
+    pending = None
+    for line in lines:
+        line = line[:-1] if line.endswith(b"\n") else line
+        m = _TEXT_LINE.match(line)
+        if m is None:
+            if pending is not None:      # the message itself contained a newline
+                pending[3] += b"\n" + line
+            continue
+        if pending is not None:
+            yield Record(pending[0], pending[1], 0, bytes(pending[3]))
+        secs, frac, direction = m.groups()
+        ts_ns = int(secs) * 1_000_000_000 + (int(frac.ljust(9, b"0")) if frac else 0)
+        pending = [ts_ns, direction.decode("ascii"), 0, bytearray(line[m.end():])]
+    if pending is not None:
+        yield Record(pending[0], pending[1], 0, bytes(pending[3]))
+
+
+def format_text(rec: Record, wall_offset_ns: int = 0) -> bytes:
+    """One text log line with the raw bytes of the record."""
+    ts = (rec.ts_ns + wall_offset_ns) // 1_000_000
+    return b"%d.%03d:%s:%s\n" % (ts // 1000, ts % 1000, rec.direction.encode("ascii"), rec.data)
+
+
+# ---- tcpick dump -------------------------------------------------------------
+
+_TCPICK_START = re.compile(rb"Starting tcpick \S+ at (\d{4}-\d\d-\d\d \d\d:\d\d)")
+_TCPICK_STATE = re.compile(rb"\d+\s+([A-Z][A-Z0-9-]+)\s+\S+:\d+ > \S+:\d+$")
+_TCPICK_CLOSED = (b"CLOSED", b"RESET")
+_COMMANDS_ONLY = re.compile(rb"(?:\x06|:[A-Za-z$?][^#:]*#)+")
+
+
+def read_tcpick(lines: Iterable[bytes]) -> Iterator[Record]:
+    """Records from a 'tcpick -yP' dump, read as bytes. Times are Unix ns (see module doc)."""
+    ts_ns = 0
+    client = 0
+    in_session = False
+    for line in lines:
+        line = line[:-1] if line.endswith(b"\n") else line
+        m = _TCPICK_START.match(line)
+        if m:
+            start = calendar.timegm(time.strptime(m.group(1).decode("ascii"), "%Y-%m-%d %H:%M"))
+            ts_ns = max(ts_ns, start * 1_000_000_000)
+            in_session = False
+            continue
+        m = _TCPICK_STATE.match(line)
+        if m:
+            state = m.group(1)
+            if state == b"ESTABLISHED":
+                client += 1
+                in_session = True
+            elif state in _TCPICK_CLOSED:
+                in_session = False
+            continue
+        if not in_session or not line:
+            continue
+        direction = "W" if _COMMANDS_ONLY.fullmatch(line) else "R"
+        yield Record(ts_ns, direction, client, line)
+        ts_ns += TCPICK_SPACING_NS
+
+
+def write_capture(records: Iterable[Record], path: str | Path, wall_offset_ns: int = 0) -> CaptureWriter:
+    """Write records (with their own timestamps) to a new capture at path."""
+    with CaptureWriter(path, wall_offset_ns=wall_offset_ns) as w:
+        for rec in records:
+            w.write(rec.direction, rec.data, rec.client, rec.ts_ns)
+    return w
+
+
+def iter_records(path: str | Path) -> Iterator[Record]:
+    """Stream the records of a capture, text log or tcpick dump, whichever path holds."""
+    with open(path, "rb") as f:
+        head = f.read(len(MAGIC))
+        if head == MAGIC:
+            f.close()
+            with CaptureReader(path) as r:
+                yield from r
+            return
+        f.seek(0)
+        read = read_tcpick if head.startswith(b"Starting") else read_text
+        yield from read(f)
+
+
+# ---- Command line ------------------------------------------------------------
+
+def _open_out(path: str):
+    return sys.stdout.buffer if path == "-" else open(path, "wb")
+
+
+def _seconds_to_ns(seconds: float | None, first_ns: int | None) -> int | None:
+    """--from/--to are seconds from the first record."""
+    if seconds is None or first_ns is None:
+        return None
+    return first_ns + int(seconds * 1e9)
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Convert and inspect binary traffic captures.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("from-text", help="bridge text log -> capture")
+    p.add_argument("src")
+    p.add_argument("dst")
+    p = sub.add_parser("from-tcpick", help="tcpick -yP dump -> capture")
+    p.add_argument("src")
+    p.add_argument("dst")
+    p = sub.add_parser("to-text", help="capture -> bridge text log")
+    p.add_argument("src")
+    p.add_argument("dst", nargs="?", default="-")
+    p.add_argument("--from", dest="start", type=float, default=None, metavar="S",
+                   help="start S seconds after the first record")
+    p.add_argument("--to", dest="end", type=float, default=None, metavar="S",
+                   help="stop S seconds after the first record")
+    p = sub.add_parser("info", help="record count, time span and bytes per direction")
+    p.add_argument("src")
+    p = sub.add_parser("index", help="rebuild the .idx sidecar")
+    p.add_argument("src")
+    args = ap.parse_args(argv)
+
+    if args.command in ("from-text", "from-tcpick"):
+        read = read_text if args.command == "from-text" else read_tcpick
+        with open(args.src, "rb") as f:
+            w = write_capture(read(f), args.dst)
+        print(f"{args.dst}: {w.records} records, {w.bytes} bytes", file=sys.stderr)
+    elif args.command == "to-text":
+        with CaptureReader(args.src) as r:
+            first = next(iter(r), None)
+            first_ns = first.ts_ns if first is not None else None
+            start = _seconds_to_ns(args.start, first_ns)
+            end = _seconds_to_ns(args.end, first_ns)
+            out = _open_out(args.dst)
+            try:
+                out.writelines(format_text(rec, r.wall_offset_ns) for rec in r.records(start, end))
+            finally:
+                if out is not sys.stdout.buffer:
+                    out.close()
+    elif args.command == "info":
+        count = {"W": 0, "R": 0}
+        size = {"W": 0, "R": 0}
+        clients = set()
+        first = last = None
+        with CaptureReader(args.src) as r:
+            for rec in r:
+                count[rec.direction] = count.get(rec.direction, 0) + 1
+                size[rec.direction] = size.get(rec.direction, 0) + len(rec.data)
+                clients.add(rec.client)
+                first = rec.ts_ns if first is None else first
+                last = rec.ts_ns
+            span = (last - first) / 1e9 if first is not None else 0.0
+            start = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(r.wall_time(first))) if first is not None else "-"
+        print(f"{args.src}: {sum(count.values())} records from {start} UTC over {span:.3f} s, "
+              f"{len(clients)} client(s); W {count['W']} records/{size['W']} bytes, "
+              f"R {count['R']} records/{size['R']} bytes")
+    else:
+        entries = build_index(args.src)
+        print(f"{index_path(args.src)}: {len(entries)} entries", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""
+Command lookup over MeadeLX200protocol.json.
+
+The JSON lists command templates such as ':GR#', ':SrHH:MM:SS#' or ':B<n>#'.
+ProtocolSpec compiles them once into an exact-match table and tables of
+literal heads (':Sr', ':B') keyed by head length, so a concrete frame like
+b':Sr12:34:56#' finds its entry with one dict lookup per head length,
+longest first.
+
+For each entry it derives the ReplyFormat: how a reply to that command is
+delimited on the wire, which is what a multiplexer needs to know where one
+reply ends and the next begins. It also marks read-only queries (the :G
+group and the "Get/Query/Read/Return/Request ..." commands that reply), the
+ones whose replies a cache may reuse; everything else may change state.
+Each entry carries a parameter pattern (parse_params) and a support mask
+with one bit per lx200emulator_v2 profile (PROFILE_MODELS).
+
+The same tables are compiled ahead of time into lx200_protocol_table.py, so
+neither the emulator nor ProtocolSpec.load() parses the JSON at startup;
+regenerate it after editing the JSON:
+
+  python lx200_protocol.py compile            # writes lx200_protocol_table.py
+  python lx200_protocol.py compile --check    # exit 1 if it is out of date
+
+split_frames() and reply_length() cut commands and replies off a byte stream.
+
+Usage:
+  spec = ProtocolSpec.load()
+  spec.reply_format(b":GR#")      # ReplyFormat(kind='hash')
+  spec.parse_params(b":Sr12:34:56#")   # {'HH:MM.T': '12:34:56'}
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_SPEC_PATH = Path(__file__).resolve().parent / "MeadeLX200protocol.json"
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parent / "lx200_protocol_table.py"
+
+# Reply kinds
+NONE = "none"                # no reply ("Nothing")
+BYTE = "byte"                # one character, e.g. '0'/'1'
+HASH = "hash"                # '#'-terminated string
+BYTE_OR_HASH = "byte|hash"   # one of the single-character codes, else a '#'-terminated string (:MS#)
+QUIET = "quiet"              # undelimited: the reply ends when the line goes quiet
+
+# Models in the JSON 'support' maps that each lx200emulator_v2 profile
+# (EMULATOR_PROFILES key) stands for. A command is unsupported for a profile
+# when one of its models is listed and all listed ones say '-'.
+PROFILE_MODELS = {
+    "lx200gps": ("LX200GPS", "LX200gps", "AutoStarII"),
+    "lx200classic": ("LX200_lt16",),
+    "lx200_16": ("LX200_16",),
+    "autostar": ("AutoStar",),
+    "autostar2": ("AutoStarII",),
+    "maxrcx": ("MaxRCX", "MaxRCX400", "Max", "LX200gps_RCX", "AutoStarII"),
+}
+PROFILES = tuple(PROFILE_MODELS)
+ALL_PROFILES = (1 << len(PROFILES)) - 1
+
+# Descriptions of replying commands outside :G that only read state
+_READ_VERBS = ("Get", "Query", "Read", "Return", "Request")
+
+# Placeholders in templates that carry no params description
+_PLACEHOLDER = re.compile(r"<|s?(?:D{2,}|d{2,}|N{2,}|HH|MM|YY)")
+
+
+@dataclass(frozen=True)
+class ReplyFormat:
+    kind: str
+    short: frozenset = field(default_factory=frozenset)   # single-byte codes for BYTE_OR_HASH
+
+
+@dataclass(frozen=True)
+class CommandEntry:
+    template: str
+    group: str
+    head: str                 # literal part before the first parameter
+    description: str
+    returns: object
+    reply: ReplyFormat
+    support: dict
+    read_only: bool
+    params: tuple = ()        # placeholder names in template order
+    pattern: str | None = None  # regex over the whole frame, one group per param
+    support_mask: int = ALL_PROFILES   # bit i set: PROFILES[i] answers this command
+
+    def supports(self, profile: str) -> bool:
+        return bool(self.support_mask & profile_bit(profile))
+
+
+def profile_bit(profile: str) -> int:
+    """Support mask bit of an lx200emulator_v2 profile; unknown profiles get the lx200gps bit."""
+    return 1 << (PROFILES.index(profile) if profile in PROFILE_MODELS else 0)
+
+
+def reply_format(returns) -> ReplyFormat:
+    """Classify a 'returns' field of the JSON."""
+    if returns == "Nothing":
+        return ReplyFormat(NONE)
+    if isinstance(returns, dict):
+        codes = list(returns)
+        if all(len(c) == 1 for c in codes):
+            return ReplyFormat(BYTE)
+        if any(c.endswith("#") for c in codes):
+            short = frozenset(c.encode("latin-1") for c in codes if len(c) == 1)
+            return ReplyFormat(BYTE_OR_HASH, short) if short else ReplyFormat(HASH)
+        text = " ".join(str(v) for v in returns.values())
+    else:
+        text = str(returns)
+    if "#" in text:
+        return ReplyFormat(HASH)
+    if re.match(r"\d\b", text):          # e.g. "1 (at current baud rate, ...)"
+        return ReplyFormat(BYTE)
+    return ReplyFormat(QUIET)
+
+
+def _is_read_only(group: str, description: str, reply: ReplyFormat) -> bool:
+    if reply.kind == NONE:
+        return False
+    return group == "G" or description.startswith(_READ_VERBS)
+
+
+def _literal_head(template: str, group: str, params: dict | None) -> str:
+    """Template text up to the first parameter (the whole template if it has none)."""
+    start = 1 + len(group) if template.startswith(":") else 0
+    cuts = [i for i in (template.find(key, start) for key in params or ()) if i >= 0]
+    bracket = template.find("<", start)
+    if bracket >= 0:
+        cuts.append(bracket)
+    if not cuts:   # no usable params description: spot the placeholder itself
+        m = _PLACEHOLDER.search(template, start)
+        if m:
+            cuts.append(m.start())
+    return template[:min(cuts)] if cuts else template
+
+
+def _param_pattern(template: str, head: str, params: dict | None) -> tuple[tuple, str | None]:
+    """
+    Placeholder names and a frame regex for a parameterised template: '<n>'
+    and the params keys become lazy groups, everything else is literal. A
+    template whose placeholders match no params key is one parameter.
+    """
+    if head == template:
+        return (), None
+    rest = template[len(head):]
+    keys = sorted((k for k in params or () if "<" not in k), key=len, reverse=True)
+    names, parts, i = [], [], 0
+    while i < len(rest):
+        if rest[i] == "<" and ">" in rest[i:]:
+            end = rest.index(">", i)
+            names.append(rest[i + 1:end])
+            i = end + 1
+        else:
+            key = next((k for k in keys if rest.startswith(k, i)), None)
+            if key is None:
+                parts.append(re.escape(rest[i]))
+                i += 1
+                continue
+            names.append(key)
+            i += len(key)
+        parts.append("(.*?)")
+    if not names:
+        names = [rest.rstrip("#")]
+        parts = ["(.*?)", "\\#" if rest.endswith("#") else ""]
+    return tuple(names), re.escape(head) + "".join(parts)
+
+
+def _support_mask(support: dict) -> int:
+    mask = 0
+    for bit, profile in enumerate(PROFILES):
+        listed = [support[m] for m in PROFILE_MODELS[profile] if m in support]
+        if not listed or any(v != "-" for v in listed):
+            mask |= 1 << bit
+    return mask
+
+
+def compile_entries(doc: dict) -> list[CommandEntry]:
+    """Every command of the JSON document as a CommandEntry, in document order."""
+    entries = []
+    for group, body in doc.get("commands", {}).items():
+        for c in body.get("commands", []):
+            template = c["cmd"]
+            head = _literal_head(template, group, c.get("params"))
+            description = c.get("description", "")
+            reply = reply_format(c.get("returns"))
+            names, pattern = _param_pattern(template, head, c.get("params"))
+            entries.append(CommandEntry(
+                template=template,
+                group=group,
+                head=head,
+                description=description,
+                returns=c.get("returns"),
+                reply=reply,
+                support=c.get("support", {}),
+                read_only=_is_read_only(group, description, reply),
+                params=names,
+                pattern=pattern,
+                support_mask=_support_mask(c.get("support", {})),
+            ))
+    return entries
+
+
+def build_tables(entries: list[CommandEntry]) -> tuple[dict, list[tuple[int, dict]]]:
+    """
+    Exact templates -> entry index, and (head length, {head: index}) longest
+    head first. The first entry in document order wins a shared head.
+    """
+    exact: dict[str, int] = {}
+    by_len: dict[int, dict[str, int]] = {}
+    for i, e in enumerate(entries):
+        if e.head == e.template:
+            exact.setdefault(e.template, i)
+        else:
+            by_len.setdefault(len(e.head), {}).setdefault(e.head, i)
+    return exact, sorted(by_len.items(), reverse=True)
+
+
+class ProtocolSpec:
+    """Compiled MeadeLX200protocol.json: frame → CommandEntry."""
+
+    def __init__(self, entries: list[CommandEntry], protocol: str = ""):
+        self.protocol = protocol
+        self.entries = list(entries)
+        exact, heads = build_tables(self.entries)
+        self._exact = {t.encode("latin-1"): self.entries[i] for t, i in exact.items()}
+        self._heads = [(n, {h.encode("latin-1"): self.entries[i] for h, i in table.items()})
+                       for n, table in heads]
+        self._patterns: dict[str, re.Pattern] = {}
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "ProtocolSpec":
+        return cls(compile_entries(doc), doc.get("protocol", ""))
+
+    @classmethod
+    def load(cls, path: str | Path = DEFAULT_SPEC_PATH) -> "ProtocolSpec":
+        """The spec at path; for the default JSON, the precompiled table if it is current."""
+        raw = Path(path).read_bytes()
+        if Path(path) == DEFAULT_SPEC_PATH:
+            try:
+                import lx200_protocol_table as table
+            except ImportError:
+                table = None
+            if table is not None and table.SOURCE_SHA256 == hashlib.sha256(raw).hexdigest():
+                return cls.from_table(table)
+        return cls.from_doc(json.loads(raw))
+
+    @classmethod
+    def from_table(cls, table) -> "ProtocolSpec":
+        entries = [
+            CommandEntry(template, group, head, description, returns, ReplyFormat(kind, frozenset(short)),
+                         support, read_only, params, pattern, mask)
+            for (template, group, head, description, returns, kind, short, read_only,
+                 params, pattern, mask, support) in table.ENTRIES
+        ]
+        return cls(entries, table.PROTOCOL)
+
+    def lookup(self, frame: bytes) -> CommandEntry | None:
+        entry = self._exact.get(frame)
+        if entry is not None:
+            return entry
+        if frame.endswith(b"#"):
+            for n, heads in self._heads:
+                entry = heads.get(frame[:n])
+                if entry is not None:
+                    return entry
+        return None
+
+    def reply_format(self, frame: bytes) -> ReplyFormat:
+        """How the reply to frame is delimited; QUIET for commands the spec does not list."""
+        entry = self.lookup(frame)
+        return entry.reply if entry is not None else ReplyFormat(QUIET)
+
+    def is_read_only(self, frame: bytes) -> bool:
+        """True for queries that do not change mount state; unknown commands are not."""
+        entry = self.lookup(frame)
+        return entry is not None and entry.read_only
+
+    def parse_params(self, frame: bytes) -> dict[str, str] | None:
+        """Parameter values by placeholder name; None if frame does not fit its template."""
+        entry = self.lookup(frame)
+        if entry is None:
+            return None
+        if entry.pattern is None:
+            return {}
+        pattern = self._patterns.get(entry.pattern)
+        if pattern is None:
+            pattern = self._patterns[entry.pattern] = re.compile(entry.pattern, re.S)
+        m = pattern.fullmatch(frame.decode("latin-1"))
+        return dict(zip(entry.params, m.groups())) if m else None
+
+    def supported(self, frame: bytes, profile: str) -> bool:
+        """False only for commands the spec marks unsupported on profile's models."""
+        entry = self.lookup(frame)
+        return entry is None or entry.supports(profile)
+
+
+def split_frames(buf: bytearray) -> list[bytes]:
+    """
+    Remove and return the complete commands at the front of buf: single
+    control bytes (ACK 0x06, EOT 0x04) or anything up to and including '#'.
+    """
+    frames = []
+    while buf:
+        if buf[0] in (0x06, 0x04):
+            frames.append(bytes(buf[:1]))
+            del buf[:1]
+            continue
+        end = buf.find(b"#")
+        if end < 0:
+            break
+        frames.append(bytes(buf[:end + 1]))
+        del buf[:end + 1]
+    return frames
+
+
+def reply_length(fmt: ReplyFormat, rx: bytearray) -> int | None:
+    """Length of the complete reply at the front of rx, or None if more is needed."""
+    if not rx:
+        return None
+    kind = fmt.kind
+    if kind == BYTE or (kind == BYTE_OR_HASH and bytes(rx[:1]) in fmt.short):
+        return 1
+    if kind in (HASH, BYTE_OR_HASH):
+        end = rx.find(b"#")
+        return end + 1 if end >= 0 else None
+    return None
+
+
+# ---- Ahead-of-time compiler --------------------------------------------------
+
+_TABLE_HEADER = '''"""
+MeadeLX200protocol.json compiled by `python lx200_protocol.py compile`. Do not edit.
+
+ENTRIES rows: template, group, head, description, returns, reply kind, short
+reply codes, read-only, parameter names, parameter regex, support mask (bit i:
+PROFILES[i]), support map. EXACT maps parameterless templates to a row; HEADS
+maps literal heads of parameterised templates to a row, longest head first.
+"""
+'''
+
+_TABLE_MATCH = '''
+
+def match(frame: str) -> int:
+    """ENTRIES row of a command frame (text including '#', or the ACK byte); -1 if unknown."""
+    i = EXACT.get(frame, -1)
+    if i < 0 and frame[-1:] == "#":
+        for n, heads in HEADS:
+            i = heads.get(frame[:n], -1)
+            if i >= 0:
+                break
+    return i
+'''
+
+
+def compile_table(source: bytes) -> str:
+    """Python source of lx200_protocol_table for the JSON document in source."""
+    doc = json.loads(source)
+    entries = compile_entries(doc)
+    exact, heads = build_tables(entries)
+    rows = [
+        (e.template, e.group, e.head, e.description, e.returns, e.reply.kind,
+         tuple(sorted(e.reply.short)), e.read_only, e.params, e.pattern, e.support_mask, e.support)
+        for e in entries
+    ]
+    out = [_TABLE_HEADER]
+    out.append(f"SOURCE_SHA256 = {hashlib.sha256(source).hexdigest()!r}\n")
+    out.append(f"PROTOCOL = {doc.get('protocol', '')!r}\n")
+    out.append(f"PROFILES = {PROFILES!r}\n")
+    out.append("PROFILE_BITS = {%s}\n" % ", ".join(f"{p!r}: {1 << i}" for i, p in enumerate(PROFILES)))
+    out.append("\nENTRIES = (\n")
+    out.extend(f"    {row!r},\n" for row in rows)
+    out.append(")\n\nSUPPORT = (\n")
+    out.extend(f"    {e.support_mask},   # {e.template!r}\n" for e in entries)
+    out.append(")\n\nEXACT = {\n")
+    out.extend(f"    {t!r}: {i},\n" for t, i in exact.items())
+    out.append("}\n\nHEADS = (\n")
+    for n, table in heads:
+        out.append(f"    ({n}, {{\n")
+        out.extend(f"        {h!r}: {i},\n" for h, i in table.items())
+        out.append("    }),\n")
+    out.append(")\n")
+    out.append(_TABLE_MATCH)
+    return "".join(out)
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description="Compile MeadeLX200protocol.json into lx200_protocol_table.py.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("compile", help="write the compiled table")
+    p.add_argument("--spec", default=str(DEFAULT_SPEC_PATH), help="protocol JSON (default: %(default)s)")
+    p.add_argument("--out", default=str(DEFAULT_TABLE_PATH), help="generated module (default: %(default)s)")
+    p.add_argument("--check", action="store_true", help="only report whether --out is up to date")
+    args = ap.parse_args(argv)
+
+    text = compile_table(Path(args.spec).read_bytes())
+    out = Path(args.out)
+    if args.check:
+        current = out.read_text(encoding="utf-8") if out.exists() else None
+        if current != text:
+            print(f"{out} is out of date; run: python lx200_protocol.py compile", file=sys.stderr)
+            sys.exit(1)
+        return
+    out.write_text(text, encoding="utf-8")
+    print(f"{out}: {text.count(chr(10))} lines", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
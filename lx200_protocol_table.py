@@ -0,0 +1,649 @@
+"""
+MeadeLX200protocol.json compiled by `python lx200_protocol.py compile`. Do not edit.
+
+ENTRIES rows: template, group, head, description, returns, reply kind, short
+reply codes, read-only, parameter names, parameter regex, support mask (bit i:
+PROFILES[i]), support map. EXACT maps parameterless templates to a row; HEADS
+maps literal heads of parameterised templates to a row, longest head first.
+"""
+SOURCE_SHA256 = '8e0afa8ef5fdbcada904dd18cdaec5efb9293096fd661a2a980aa9aabe07d383'
+PROTOCOL = 'Meade Telescope Serial Command Protocol'
+PROFILES = ('lx200gps', 'lx200classic', 'lx200_16', 'autostar', 'autostar2', 'maxrcx')
+PROFILE_BITS = {'lx200gps': 1, 'lx200classic': 2, 'lx200_16': 4, 'autostar': 8, 'autostar2': 16, 'maxrcx': 32}
+
+ENTRIES = (
+    ('\x06', 'ACK', '\x06', 'Query alignment mounting mode', {'A': 'AltAz Mode', 'D': 'Downloader mode (Autostar II & Autostar)', 'L': 'Land Mode', 'P': 'Polar Mode'}, 'byte', (), True, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    ('\x04', 'EOT', '\x04', 'Enter Meade firmware downloader (proprietary)', 'Nothing', 'none', (), False, (), None, 57, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':Aa#', 'A', ':Aa#', 'Start Telescope Automatic Alignment Sequence', {'1': 'Alignment complete', '0': 'Scope not AzEl mounted or alignment failed'}, 'byte', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':AL#', 'A', ':AL#', 'Sets telescope to Land alignment mode', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':AP#', 'A', ':AP#', 'Sets telescope to Polar alignment mode', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':AA#', 'A', ':AA#', 'Sets telescope to AltAz alignment mode', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':$BAdd#', '$B', ':$BA', 'Set Altitude/Dec Antibacklash. <dd> is the backlash value.', 'Nothing', 'none', (), False, ('dd',), ':\\$BA(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$BZdd#', '$B', ':$BZ', 'Set Azimuth/RA Antibacklash. <dd> is the backlash value.', 'Nothing', 'none', (), False, ('dd',), ':\\$BZ(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':B+#', 'B', ':B+#', 'Increase reticule brightness', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':B-#', 'B', ':B-#', 'Decrease reticule brightness', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':B<n>#', 'B', ':B', 'Set reticle flash rate to <n>. LX200: 0..3; Autostar/Autostar II: 0..9', 'Nothing', 'none', (), False, ('n',), ':B(.*?)\\#', 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':BDn#', 'B', ':BD', 'Set Reticule Duty flash duty cycle to <n>. LX200 GPS Only.', 'Nothing', 'none', (), False, ('n',), ':BD(.*?)\\#', 2, {'AutoStar': '-', 'LX200_lt16': 'p', 'LX200_16': '-', 'AutoStarII': '-'}),
+    (':CL#', 'C', ':CL#', 'Synchronize telescope with current Selenographic coordinates', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':CM#', 'C', ':CM#', 'Synchronizes telescope position with currently selected database object coordinates', {'LX200': "A '#' terminated string with the name of the synced object", 'Autostar_AutostarII': "Static string: ' M31 EX GAL MAG 3.5 SZ178.0'#'"}, 'hash', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':D#', 'D', ':D#', 'Request string of bars indicating distance to current target location', {'LX200': 'String of bar characters indicating distance', 'Autostar_AutostarII': 'String containing one bar until slew complete, then null string'}, 'quiet', (), True, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':f+#', 'f', ':f+#', 'Turn on tube exhaust fan (LX16"/Max/RCX) or accessory panel power (Autostar II)', 'Nothing', 'none', (), False, (), None, 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':f-#', 'f', ':f-#', 'Turn off tube exhaust fan (LX16"/Max/RCX) or accessory panel power (Autostar II)', 'Nothing', 'none', (), False, (), None, 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':fH<ddd>#', 'f', ':fH', 'Set corrector plate heater level. Max/RCX only.', 'Nothing', 'none', (), False, ('ddd',), ':fH(.*?)\\#', 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':fp+#', 'f', ':fp+#', 'Turn on switched 12V panel power. Max/RCX only.', 'Nothing', 'none', (), False, (), None, 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':fp-#', 'f', ':fp-#', 'Turn off switched 12V panel power. Max/RCX only.', 'Nothing', 'none', (), False, (), None, 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':fT#', 'f', ':fT#', 'Return Optical Tube Assembly temperature. Autostar II and Max/RCX.', "<sdd.ddd># — '#'-terminated signed ASCII real number in Celsius", 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x', 'MaxRCX': 'x'}),
+    (':fC#', 'f', ':fC#', 'Return corrector plate temperature. Max/RCX only.', "<sdd.ddd># — '#'-terminated signed ASCII real number in Celsius", 'hash', (), True, (), None, 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':F+#', 'F', ':F+#', 'Start focuser moving inward (toward objective)', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':F-#', 'F', ':F-#', 'Start focuser moving outward (away from objective)', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':FB#', 'F', ':FB#', 'Query focuser busy status. Max/RCX400 only.', {'0': 'Focuser idle', '1': 'Focuser moving'}, 'byte', (), True, (), None, 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX400': 'x'}),
+    (':FC<n/s/e/w>#', 'F', ':FC', 'Collimate command — starts corrector plate tilting in specified direction. Max/RCX only. Use :FQ# to halt.', 'Nothing', 'none', (), False, ('n/s/e/w',), ':FC(.*?)\\#', 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':FLD<n>#', 'F', ':FLD', 'Define current position as focuser preset <n>. Max/RCX only.', 'Nothing', 'none', (), False, ('n',), ':FLD(.*?)\\#', 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':FLN<n><name>#', 'F', ':FLN', 'Assign focuser preset <n> the specified <name>. Max/RCX only.', 'Nothing', 'none', (), False, ('n', 'name'), ':FLN(.*?)(.*?)\\#', 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':FLS<n>#', 'F', ':FLS', 'Sync focuser to preset position <n>. Max/RCX only.', 'Nothing', 'none', (), False, ('n',), ':FLS(.*?)\\#', 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':FPsDDDDD.DDDD#', 'F', ':FP', 'Pulse focuser (Autostar II) or move to absolute position in mm (Max/RCX).', 'Nothing', 'none', (), False, ('sDDDDD.DDDD',), ':FP(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x', 'MaxRCX': 'x'}),
+    (':Fp#', 'F', ':Fp#', 'Query digital focuser position. Max/RCX only.', "'#'-terminated ASCII integer — current focuser position", 'hash', (), True, (), None, 32, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': '-', 'MaxRCX': 'x'}),
+    (':FQ#', 'F', ':FQ#', 'Halt focuser motion', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':FF#', 'F', ':FF#', 'Set focus speed to fastest setting', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':FS#', 'F', ':FS#', 'Set focus speed to slowest setting', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':F<n>#', 'F', ':F', 'Set focuser speed to <n>. Autostar and Autostar II only.', 'Nothing', 'none', (), False, ('n',), ':F(.*?)\\#', 57, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':g+#', 'g', ':g+#', 'Turn on GPS. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':g-#', 'g', ':g-#', 'Turn off GPS. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':gps#', 'g', ':gps#', 'Turn on NMEA GPS data stream. Autostar II only.', "Next NMEA format string from GPS followed by '#'", 'hash', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':gT#', 'g', ':gT#', 'Power up GPS and update system time from GPS stream. May take several minutes. Interrupts handbox operations. Autostar II only.', {'0': 'User interrupted or GPS timed out', '1': 'Successful update'}, 'byte', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':G0#', 'G', ':G0#', 'Get Alignment Menu Entry 0 [LX200 legacy]', "'#'-terminated ASCII string", 'hash', (), True, (), None, 63, {}),
+    (':G1#', 'G', ':G1#', 'Get Alignment Menu Entry 1 [LX200 legacy]', "'#'-terminated ASCII string", 'hash', (), True, (), None, 63, {}),
+    (':G2#', 'G', ':G2#', 'Get Alignment Menu Entry 2 [LX200 legacy]', "'#'-terminated ASCII string", 'hash', (), True, (), None, 63, {}),
+    (':Ga#', 'G', ':Ga#', 'Get local telescope time in 12-hour format', 'HH:MM:SS#', 'hash', (), True, (), None, 63, {}),
+    (':GA#', 'G', ':GA#', 'Get telescope altitude', "sDD*MM# or sDD*MM'SS# depending on precision setting", 'hash', (), True, (), None, 63, {}),
+    (':Gb#', 'G', ':Gb#', 'Get browse brighter magnitude limit — faintest object returned by FIND/BROWSE', 'sMM.M#', 'hash', (), True, (), None, 63, {}),
+    (':GC#', 'G', ':GC#', 'Get current local calendar date', 'MM/DD/YY#', 'hash', (), True, (), None, 63, {}),
+    (':Gc#', 'G', ':Gc#', 'Get clock format', {'12#': '12-hour format', '24#': '24-hour format'}, 'hash', (), True, (), None, 63, {}),
+    (':GD#', 'G', ':GD#', 'Get telescope declination', "sDD*MM# or sDD*MM'SS# depending on precision setting", 'hash', (), True, (), None, 63, {}),
+    (':Gd#', 'G', ':Gd#', 'Get currently selected object/target declination', "sDD*MM# or sDD*MM'SS# depending on precision setting", 'hash', (), True, (), None, 63, {}),
+    (':GE#', 'G', ':GE#', 'Get selenographic latitude. LX200gps/RCX only. Returns +99*99# if not pointing at Moon.', 'sDD*MM#', 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x', 'LX200gps_RCX': 'x'}),
+    (':Ge#', 'G', ':Ge#', 'Get selenographic longitude. LX200gps/RCX only. West=negative. Returns +999*99# if not pointing at Moon.', 'sDDD*MM#', 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x', 'LX200gps_RCX': 'x'}),
+    (':GF#', 'G', ':GF#', 'Get find field diameter used in IDENTIFY/FIND commands', 'NNN# (arc minutes, ASCII integer)', 'hash', (), True, (), None, 63, {}),
+    (':Gf#', 'G', ':Gf#', 'Get browse faint magnitude limit — brightest object returned by FIND/BROWSE', 'sMM.M#', 'hash', (), True, (), None, 63, {}),
+    (':GG#', 'G', ':GG#', 'Get UTC offset time — hours to add to local time to get UTC', 'sHH# or sHH.H# (whole vs. fractional hours)', 'hash', (), True, (), None, 63, {}),
+    (':Gg#', 'G', ':Gg#', 'Get current site longitude. East longitudes are negative.', 'sDDD*MM#', 'hash', (), True, (), None, 63, {}),
+    (':GH#', 'G', ':GH#', 'Get Daylight Savings Time setting. Autostar II only.', {'1#': 'DST enabled', '0#': 'DST disabled'}, 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':Gh#', 'G', ':Gh#', 'Get high limit — highest mount-relative altitude telescope will slew to without warning', 'sDD*', 'quiet', (), True, (), None, 63, {}),
+    (':GL#', 'G', ':GL#', 'Get local time in 24-hour format', 'HH:MM:SS#', 'hash', (), True, (), None, 63, {}),
+    (':Gm#', 'G', ':Gm#', 'Get distance to meridian (LST-RA). Max only. Negative on German mount indicates off-side.', "sDD*MM'SS# or sDD*MM# depending on precision setting", 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x', 'Max': 'x'}),
+    (':Gl#', 'G', ':Gl#', 'Get larger size limit — smallest object size returned by FIND/BROWSE', "NNN'#", 'hash', (), True, (), None, 63, {}),
+    (':GM#', 'G', ':GM#', 'Get site 1 name', '<string>#', 'hash', (), True, (), None, 63, {}),
+    (':GN#', 'G', ':GN#', 'Get site 2 name', '<string>#', 'hash', (), True, (), None, 63, {}),
+    (':GO#', 'G', ':GO#', 'Get site 3 name', '<string>#', 'hash', (), True, (), None, 63, {}),
+    (':GP#', 'G', ':GP#', 'Get site 4 name', '<string>#', 'hash', (), True, (), None, 63, {}),
+    (':GpB#', 'G', ':GpB#', 'Get backlash values. Autostar and Autostar II.', '<num> <space><num>#', 'hash', (), True, (), None, 57, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':GpH#', 'G', ':GpH#', 'Get home data. Autostar II only.', '<num><num>#', 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':GpS#', 'G', ':GpS#', 'Get sensor offsets (azerror, elerror, home position offset). Autostar II only.', '<num><num><num>#', 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':Go#', 'G', ':Go#', "Get lower limit — minimum elevation above horizon for slewing without 'Below Horizon' error", 'DD*#', 'hash', (), True, (), None, 63, {}),
+    (':Gq#', 'G', ':Gq#', 'Get minimum quality for FIND operation', {'SU#': 'Super', 'EX#': 'Excellent', 'VG#': 'Very Good', 'GD#': 'Good', 'FR#': 'Fair', 'PR#': 'Poor', 'VP#': 'Very Poor'}, 'hash', (), True, (), None, 63, {}),
+    (':GR#', 'G', ':GR#', 'Get telescope RA', 'HH:MM.T# or HH:MM:SS# depending on precision setting', 'hash', (), True, (), None, 63, {}),
+    (':Gr#', 'G', ':Gr#', 'Get current/target object RA', 'HH:MM.T# or HH:MM:SS# depending on precision setting', 'hash', (), True, (), None, 63, {}),
+    (':GS#', 'G', ':GS#', 'Get sidereal time', 'HH:MM:SS#', 'hash', (), True, (), None, 63, {}),
+    (':Gs#', 'G', ':Gs#', 'Get smaller size limit — largest object returned by FIND command (in arcminutes)', "NNN'#", 'hash', (), True, (), None, 63, {}),
+    (':GT#', 'G', ':GT#', 'Get tracking rate in Hz (60.0 Hz = 1 revolution in 24 hours)', 'TT.T#', 'hash', (), True, (), None, 63, {}),
+    (':Gt#', 'G', ':Gt#', 'Get current site latitude. Positive = North.', 'sDD*MM#', 'hash', (), True, (), None, 63, {}),
+    (':GVD#', 'G', ':GVD#', 'Get telescope firmware date', 'mmm dd yyyy#', 'hash', (), True, (), None, 63, {}),
+    (':GVN#', 'G', ':GVN#', 'Get telescope firmware number', 'dd.d#', 'hash', (), True, (), None, 63, {}),
+    (':GVO#', 'G', ':GVO#', 'Get OTA focuser type', {'0#': 'LX200 type motor focuser', '1#': 'RCX OTA digital focuser', '2+': 'Reserved'}, 'hash', (), True, (), None, 63, {}),
+    (':GVP#', 'G', ':GVP#', 'Get telescope product name', '<string>#', 'hash', (), True, (), None, 63, {}),
+    (':GVT#', 'G', ':GVT#', 'Get telescope firmware time', 'HH:MM:SS#', 'hash', (), True, (), None, 63, {}),
+    (':GW#', 'G', ':GW#', 'Get scope alignment status', '<mount><tracking><alignment>#', 'hash', (), True, (), None, 63, {}),
+    (':Gy#', 'G', ':Gy#', 'Get deep sky object search string. Uppercase = class included; lowercase = ignored.', 'GPDCO# where G=Galaxies, P=Planetary Nebulas, D=Diffuse Nebulas, C=Globular Clusters, O=Open Clusters', 'hash', (), True, (), None, 63, {}),
+    (':GZ#', 'G', ':GZ#', 'Get telescope azimuth', "DDD*MM#T or DDD*MM'SS# depending on precision setting", 'hash', (), True, (), None, 63, {}),
+    (':hC#', 'h', ':hC#', 'Calibrate home position. Causes aligned telescope to seek default home and remember alignment. Progress checkable with :h?#. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':hF#', 'h', ':hF#', 'Seek home position and set/align scope from encoder values in non-volatile memory.', 'Nothing', 'none', (), False, (), None, 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':hIYYMMDDHHMMSS#', 'h', ':hI', 'Bypass handbox entry of daylight savings, date and time. Must be issued while telescope is waiting at initial daylight savings prompt. Intended for permanent installations without GPS.', {'1': 'Command accepted'}, 'byte', (), False, ('YYMMDDHHMMSS',), ':hI(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':hN#', 'h', ':hN#', 'Sleep telescope — power off motors, encoders, displays and lights. Wakes on keystroke or :hW#. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':hP#', 'h', ':hP#', 'Slew to park position', 'Nothing', 'none', (), False, (), None, 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':hS#', 'h', ':hS#', 'Set current scope position as park position. LX200 ignores this command.', 'Nothing', 'none', (), False, (), None, 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':hW#', 'h', ':hW#', 'Wake up sleeping telescope. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':h?#', 'h', ':h?#', 'Query home status', {'0': 'Home search failed', '1': 'Home search found', '2': 'Home search in progress'}, 'byte', (), True, (), None, 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':H#', 'H', ':H#', 'Toggle between 24-hour and 12-hour time format', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':I#', 'I', ':I#', 'Causes telescope to cease current operations and restart at power-on initialization. LX200 GPS only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x', 'LX200GPS': 'x'}),
+    (':LB#', 'L', ':LB#', 'Find previous object and set as current target. Autostar II & Autostar: no function.', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LCNNNN#', 'L', ':LC', 'Set current target to deep sky catalog object number NNNN', 'Nothing', 'none', (), False, ('NNNN',), ':LC(.*?)\\#', 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LF#', 'L', ':LF#', 'Find object using current Size/Type/Limit/Quality constraints and set as current target. Autostar II & Autostar: no function.', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':Lf#', 'L', ':Lf#', "Identify object in current field. Autostar II & Autostar: returns static string '0 - Objects found'.", '<string># containing number of objects in field and object in center field', 'hash', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LI#', 'L', ':LI#', 'Get object information — current target name and type. Autostar II & Autostar: returns static Andromeda Galaxy description.', '<string>#', 'hash', (), True, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LMNNNN#', 'L', ':LM', 'Set current target to Messier Object NNNN', 'Nothing', 'none', (), False, ('NNNN',), ':LM(.*?)\\#', 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LN#', 'L', ':LN#', 'Find next deep sky target subject to current constraints. Autostar II & Autostar: no function.', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LoD#', 'L', ':Lo', 'Select deep sky library', {'1': 'Catalog available', '0': 'Catalog not found'}, 'byte', (), False, ('D',), ':Lo(.*?)\\#', 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LsD#', 'L', ':Ls', 'Select star catalog', {'1': 'Catalog available', '2': 'Catalog not found'}, 'byte', (), False, ('D',), ':Ls(.*?)\\#', 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':LSNNNN#', 'L', ':LS', 'Select star NNNN as current target from currently selected catalog', 'Nothing', 'none', (), False, ('NNNN',), ':LS(.*?)\\#', 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'p'}),
+    (':MA#', 'M', ':MA#', 'Slew to target Alt and Az. LX200: not supported.', {'0': 'No fault', '1': 'Fault'}, 'byte', (), False, (), None, 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':MgnDDDD#', 'M', ':Mgn', 'Guide telescope North for DDDD milliseconds (serial port guiding). LX200: not supported.', 'Nothing', 'none', (), False, ('DDDD',), ':Mgn(.*?)\\#', 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':MgsDDDD#', 'M', ':Mgs', 'Guide telescope South for DDDD milliseconds. LX200: not supported.', 'Nothing', 'none', (), False, ('DDDD',), ':Mgs(.*?)\\#', 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':MgeDDDD#', 'M', ':Mge', 'Guide telescope East for DDDD milliseconds. LX200: not supported.', 'Nothing', 'none', (), False, ('DDDD',), ':Mge(.*?)\\#', 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':MgwDDDD#', 'M', ':Mgw', 'Guide telescope West for DDDD milliseconds. LX200: not supported.', 'Nothing', 'none', (), False, ('DDDD',), ':Mgw(.*?)\\#', 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':MgS<x>#', 'M', ':MgS', 'StarLock enable/disable. When enabled, StarLock autoguiding and HPP pointing are active. LX200: not supported.', 'Nothing', 'none', (), False, ('x',), ':MgS(.*?)\\#', 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Me#', 'M', ':Me#', 'Move telescope East at current slew rate', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Mn#', 'M', ':Mn#', 'Move telescope North at current slew rate', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Ms#', 'M', ':Ms#', 'Move telescope South at current slew rate', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Mw#', 'M', ':Mw#', 'Move telescope West at current slew rate', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':MS#', 'M', ':MS#', 'Slew to target object', {'0': 'Slew is possible', '1<string>#': 'Object below horizon (with message)', '2<string>#': 'Object below higher limit (with message)'}, 'byte|hash', (b'0',), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'p', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':P#', 'P', ':P#', 'Toggle High Precision Pointing. When enabled, scope first centers a nearby bright star before moving to actual target.', {'HIGH PRECISION': 'High precision now active', 'LOW PRECISION': 'Low precision now active'}, 'quiet', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':$Q#', '$Q', ':$Q#', 'Toggle Smart Drive PEC on/off for both axes. Not supported on Autostar.', 'Nothing', 'none', (), False, (), None, 55, {'AutoStar': '-', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':$QA+#', '$Q', ':$QA+#', 'Enable Dec/Alt PEC. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QA-#', '$Q', ':$QA-#', 'Disable Dec/Alt PEC. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QC#', '$Q', ':$QC#', 'Query number of points in the smart mount model. Autostar II only.', 'NNNNN#', 'hash', (), True, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QGNNNNN#', '$Q', ':$QG', 'Read smart mount model point NNNNN. Autostar II only.', "<n><n># — pair of ASCII numbers separated by space, '#'-terminated", 'hash', (), True, ('NNNNN',), ':\\$QG(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QP<p><n><n>#', '$Q', ':$QP', 'Set smart mount model point <p> to values <n> <n>. All blank-terminated ASCII. Autostar II only.', 'Nothing', 'none', (), False, ('p', 'n', 'n'), ':\\$QP(.*?)(.*?)(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QS+#', '$Q', ':$QS+#', 'Enable SmartMount. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QS-#', '$Q', ':$QS-#', 'Disable SmartMount. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QU+#', '$Q', ':$QU+#', 'Enable SmartMount Update Mode. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QU-#', '$Q', ':$QU-#', 'Disable SmartMount Update Mode. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QV+#', '$Q', ':$QV+#', 'Enable Text-To-Speech output. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QV-#', '$Q', ':$QV-#', 'Disable Text-To-Speech output. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QW#', '$Q', ':$QW#', 'Write smart mount model to non-volatile memory. Autostar II only.', {'1': 'OK', '0': 'Write fault'}, 'byte', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QZ+#', '$Q', ':$QZ+#', 'Enable RA/AZ PEC compensation. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':$QZ-#', '$Q', ':$QZ-#', 'Disable RA/AZ PEC compensation. LX200gps only.', 'Nothing', 'none', (), False, (), None, 5, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': '-', 'LX200gps': 'x'}),
+    (':Q#', 'Q', ':Q#', 'Halt all current slewing', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Qe#', 'Q', ':Qe#', 'Halt eastward slews', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Qn#', 'Q', ':Qn#', 'Halt northward slews', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Qs#', 'Q', ':Qs#', 'Halt southward slews', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':Qw#', 'Q', ':Qw#', 'Halt westward slews', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':r+#', 'r', ':r+#', 'Turn on field derotator. LX16" and Autostar II.', 'Nothing', 'none', (), False, (), None, 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':r-#', 'r', ':r-#', 'Turn off field derotator, halt slew in progress. LX16" and Autostar II.', 'Nothing', 'none', (), False, (), None, 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':rn#', 'r', ':rn#', 'Orient field rotator to North Up position. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':rh#', 'r', ':rh#', 'Mark current position as North Up for future reference. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':rC#', 'r', ':rC#', 'Start fast slew field rotator clockwise. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':rc#', 'r', ':rc#', 'Start fast slew field rotator counter-clockwise. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':rq#', 'r', ':rq#', 'Halt field derotator slew. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':RC#', 'R', ':RC#', 'Set slew rate to Centering rate (2nd slowest)', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':RG#', 'R', ':RG#', 'Set slew rate to Guiding Rate (slowest)', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':RM#', 'R', ':RM#', 'Set slew rate to Find Rate (2nd fastest)', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':RS#', 'R', ':RS#', 'Set slew rate to maximum (fastest)', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':RADD.D#', 'R', ':RA', 'Set RA/Azimuth slew rate to DD.D degrees per second. Autostar II only.', 'Nothing', 'none', (), False, ('DD.D',), ':RA(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':REDD.D#', 'R', ':RE', 'Set Dec/Elevation slew rate to DD.D degrees per second. Autostar II only.', 'Nothing', 'none', (), False, ('DD.D',), ':RE(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':RgSS.S#', 'R', ':Rg', 'Set guide rate to +/- SS.S arc seconds per second, added to/subtracted from current tracking rate. Must not exceed sidereal speed (~15.0417"/sec). Autostar II only.', 'Nothing', 'none', (), False, ('SS.S',), ':Rg(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':SasDD*MM#', 'S', ':Sa', 'Set target object altitude to sDD*MM or sDD*MM\'SS. LX16", Autostar, Autostar II.', {'1': 'Object within slew range', '0': 'Object out of slew range'}, 'byte', (), False, ('sDD*MM',), ':Sa(.*?)\\#', 61, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':SbsMM.M#', 'S', ':Sb', 'Set brighter magnitude limit', {'0': 'Valid', '1': 'Invalid number'}, 'byte', (), False, ('sMM.M',), ':Sb(.*?)\\#', 63, {}),
+    (':SBn#', 'S', ':SB', 'Set baud rate', '1 (at current baud rate, then switches to new rate)', 'byte', (), False, ('n',), ':SB(.*?)\\#', 63, {}),
+    (':SCMM/DD/YY#', 'S', ':SC', 'Change handbox date. For Autostar II this is UTC date.', {'0': 'Invalid date (null string)', '1<string>#': "Valid date — 'Updating Planetary Data# #'"}, 'byte|hash', (b'0',), False, ('MM/DD/YY',), ':SC(.*?)\\#', 63, {}),
+    (':SdsDD*MM#', 'S', ':Sd', 'Set target object declination to sDD*MM or sDD*MM:SS depending on precision setting', {'1': 'Dec accepted', '0': 'Dec invalid'}, 'byte', (), False, ('sDD*MM',), ':Sd(.*?)\\#', 63, {}),
+    (':SEsDD*MM#', 'S', ':SE', 'Set target object to specified selenographic latitude on the Moon', {'1': 'Moon is up and coordinates accepted', '0': 'Coordinates invalid'}, 'byte', (), False, ('sDD*MM',), ':SE(.*?)\\#', 63, {}),
+    (':SesDDD*MM#', 'S', ':Se', 'Set target object to specified selenographic longitude on the Moon', {'1': 'Moon is up and coordinates accepted', '0': 'Coordinates invalid'}, 'byte', (), False, ('sDDD*MM',), ':Se(.*?)\\#', 63, {}),
+    (':SfsMM.M#', 'S', ':Sf', 'Set faint magnitude limit', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('sMM.M',), ':Sf(.*?)\\#', 63, {}),
+    (':SFNNN#', 'S', ':SF', 'Set FIELD/IDENTIFY field diameter', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('NNN',), ':SF(.*?)\\#', 63, {}),
+    (':SgDDD*MM#', 'S', ':Sg', 'Set current site longitude. East longitudes expressed as negative.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('DDD*MM',), ':Sg(.*?)\\#', 63, {}),
+    (':SGsHH.H#', 'S', ':SG', 'Set hours added to local time to yield UTC', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('sHH.H',), ':SG(.*?)\\#', 63, {}),
+    (':SHD#', 'S', ':SH', 'Set daylight savings time parameter. Autostar II only.', 'Nothing', 'none', (), False, ('D',), ':SH(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':ShDD#', 'S', ':Sh', 'Set maximum object elevation limit', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('DD',), ':Sh(.*?)\\#', 63, {}),
+    (':SlNNN#', 'S', ':Sl', 'Set size of smallest object returned by FIND/BROWSE', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('NNN',), ':Sl(.*?)\\#', 63, {}),
+    (':SLHH:MM:SS#', 'S', ':SL', 'Set local time', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('HH:MM:SS',), ':SL(.*?)\\#', 63, {}),
+    (':Sm+#', 'S', ':Sm+#', 'Enable smart mount flexure correction. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':Sm-#', 'S', ':Sm-#', 'Disable smart mount flexure correction. Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':SM<string>#', 'S', ':SM', 'Set site 1 name. LX200s: 3 chars max. Others: up to 15 chars.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('string',), ':SM(.*?)\\#', 63, {}),
+    (':SN<string>#', 'S', ':SN', 'Set site 2 name. LX200s: 3 chars max. Others: up to 15 chars.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('string',), ':SN(.*?)\\#', 63, {}),
+    (':SO<string>#', 'S', ':SO', 'Set site 3 name. LX200s: 3 chars max. Others: up to 15 chars.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('string',), ':SO(.*?)\\#', 63, {}),
+    (':SoDD*#', 'S', ':So', 'Set lowest elevation to which telescope will slew', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('DD*',), ':So(.*?)\\#', 63, {}),
+    (':SP<string>#', 'S', ':SP', 'Set site 4 name. LX200s: 3 chars max. Others: up to 15 chars.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('string',), ':SP(.*?)\\#', 63, {}),
+    (':SpB<num> <num>#', 'S', ':SpB', 'Set backlash values. Autostar and Autostar II.', {'1': 'Complete', '0': 'Programming error'}, 'byte', (), False, ('num', 'num'), ':SpB(.*?)\\ (.*?)\\#', 57, {'AutoStar': 'x', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':SpH<num><num>#', 'S', ':SpH', 'Set home data. Autostar II only.', {'1': 'Complete', '0': 'Programming error'}, 'byte', (), False, ('num', 'num'), ':SpH(.*?)(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':SpS<num><num><num>#', 'S', ':SpS', 'Set sensor offsets. Autostar II only.', {'1': 'Complete', '0': 'Programming error'}, 'byte', (), False, ('num', 'num', 'num'), ':SpS(.*?)(.*?)(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':Sq#', 'S', ':Sq#', 'Step quality limit used in FIND/BROWSE through cycle VP..SU. Query with :Gq#.', 'Nothing', 'none', (), False, (), None, 63, {}),
+    (':SrHH:MM.T#', 'S', ':Sr', 'Set target object RA (low precision)', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('HH:MM.T',), ':Sr(.*?)\\#', 63, {}),
+    (':SrHH:MM:SS#', 'S', ':Sr', 'Set target object RA (high precision)', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('HH:MM:SS',), ':Sr(.*?)\\#', 63, {}),
+    (':SsNNN#', 'S', ':Ss', 'Set size of largest object FIND/BROWSE will return', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('NNN',), ':Ss(.*?)\\#', 63, {}),
+    (':SSHH:MM:SS#', 'S', ':SS', 'Set local sidereal time', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('HH:MM:SS',), ':SS(.*?)\\#', 63, {}),
+    (':StsDD*MM#', 'S', ':St', 'Set current site latitude. Positive = North.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('sDD*MM',), ':St(.*?)\\#', 63, {}),
+    (':STdddd.ddddddd#', 'S', ':ST', 'Set current tracking rate in Hz. 60.0000 Hz = one RA revolution in 24 hours. Autostar II only.', {'0': 'Invalid', '2': 'Valid'}, 'byte', (), False, ('dddd.ddddddd',), ':ST(.*?)\\#', 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':ST+#', 'S', ':ST+#', 'Increment manual rate by 0.1 Hz', 'Nothing', 'none', (), False, (), None, 63, {}),
+    (':ST-#', 'S', ':ST-#', 'Decrement manual rate by 0.1 Hz', 'Nothing', 'none', (), False, (), None, 63, {}),
+    (':STA-#', 'S', ':STA-#', 'Disable Altitude SmartDrive (PEC). Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':STA+#', 'S', ':STA+#', 'Enable Altitude SmartDrive (PEC). Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':STZ-#', 'S', ':STZ-#', 'Disable RA/Azimuth SmartDrive (PEC). Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':STZ+#', 'S', ':STZ+#', 'Enable RA/Azimuth SmartDrive (PEC). Autostar II only.', 'Nothing', 'none', (), False, (), None, 49, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': '-', 'AutoStarII': 'x'}),
+    (':SwN#', 'S', ':Sw', 'Set maximum slew rate to N degrees per second', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('N',), ':Sw(.*?)\\#', 63, {}),
+    (':SyGPDCO#', 'S', ':Sy', 'Set object selection string for FIND/BROWSE. Uppercase=include class, lowercase=exclude.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('GPDCO',), ':Sy(.*?)\\#', 63, {}),
+    (':SzDDD*MM#', 'S', ':Sz', 'Set target object azimuth. LX16" and Autostar II only.', {'0': 'Invalid', '1': 'Valid'}, 'byte', (), False, ('DDD*MM',), ':Sz(.*?)\\#', 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':T+#', 'T', ':T+#', 'Increment manual tracking rate by 0.1 Hz', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':T-#', 'T', ':T-#', 'Decrement manual tracking rate by 0.1 Hz', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':TL#', 'T', ':TL#', 'Set Lunar tracking rate', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':TM#', 'T', ':TM#', 'Select custom tracking rate (no-op in Autostar II)', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':TQ#', 'T', ':TQ#', 'Select sidereal tracking rate', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':TS#', 'T', ':TS#', 'Select Solar tracking rate. LS only.', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'p', 'LX200_16': 'p', 'AutoStarII': 'x'}),
+    (':U#', 'U', ':U#', 'Toggle between low and high precision positions. Low: HH:MM.T / sDD*MM. High: HH:MM:SS / sDD*MM:SS.', 'Nothing', 'none', (), False, (), None, 63, {'AutoStar': 'p', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':VDNNNN#', 'V', ':VD', 'Read Dec PEC Table Entry NNNN. Autostar II and Classic 16" only. PecRate = TheoreticalRate * sD.DDD for this segment.', 'D.DDDD (rate adjustment factor)', 'quiet', (), True, ('NNNN',), ':VD(.*?)\\#', 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':VRNNNN#', 'V', ':VR', 'Read RA PEC Table Entry NNNN. Autostar II and Classic 16" only. PecRate = TheoreticalRate * sD.DDD for this segment.', 'D.DDDD (rate adjustment factor)', 'quiet', (), True, ('NNNN',), ':VR(.*?)\\#', 53, {'AutoStar': '-', 'LX200_lt16': '-', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':W<n>#', 'W', ':W', 'Set current site', 'Nothing', 'none', (), False, ('n',), ':W(.*?)\\#', 63, {'AutoStar': 'x', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': 'x'}),
+    (':??#', '?', ':??#', 'Set help text cursor to start of first line', '<string># — first string of general handbox help file', 'hash', (), False, (), None, 6, {'AutoStar': '-', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': '-'}),
+    (':?+#', '?', ':?+#', 'Retrieve next line of help text', '<string># — next string of general handbox help file', 'hash', (), False, (), None, 6, {'AutoStar': '-', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': '-'}),
+    (':?-#', '?', ':?-#', 'Retrieve previous line of help text', '<string># — previous string of general handbox help file', 'hash', (), False, (), None, 6, {'AutoStar': '-', 'LX200_lt16': 'x', 'LX200_16': 'x', 'AutoStarII': '-'}),
+)
+
+SUPPORT = (
+    63,   # '\x06'
+    57,   # '\x04'
+    49,   # ':Aa#'
+    63,   # ':AL#'
+    63,   # ':AP#'
+    63,   # ':AA#'
+    49,   # ':$BAdd#'
+    49,   # ':$BZdd#'
+    63,   # ':B+#'
+    63,   # ':B-#'
+    63,   # ':B<n>#'
+    2,   # ':BDn#'
+    49,   # ':CL#'
+    63,   # ':CM#'
+    63,   # ':D#'
+    53,   # ':f+#'
+    53,   # ':f-#'
+    32,   # ':fH<ddd>#'
+    32,   # ':fp+#'
+    32,   # ':fp-#'
+    49,   # ':fT#'
+    32,   # ':fC#'
+    63,   # ':F+#'
+    63,   # ':F-#'
+    32,   # ':FB#'
+    32,   # ':FC<n/s/e/w>#'
+    32,   # ':FLD<n>#'
+    32,   # ':FLN<n><name>#'
+    32,   # ':FLS<n>#'
+    49,   # ':FPsDDDDD.DDDD#'
+    32,   # ':Fp#'
+    63,   # ':FQ#'
+    63,   # ':FF#'
+    63,   # ':FS#'
+    57,   # ':F<n>#'
+    49,   # ':g+#'
+    49,   # ':g-#'
+    49,   # ':gps#'
+    49,   # ':gT#'
+    63,   # ':G0#'
+    63,   # ':G1#'
+    63,   # ':G2#'
+    63,   # ':Ga#'
+    63,   # ':GA#'
+    63,   # ':Gb#'
+    63,   # ':GC#'
+    63,   # ':Gc#'
+    63,   # ':GD#'
+    63,   # ':Gd#'
+    49,   # ':GE#'
+    49,   # ':Ge#'
+    63,   # ':GF#'
+    63,   # ':Gf#'
+    63,   # ':GG#'
+    63,   # ':Gg#'
+    49,   # ':GH#'
+    63,   # ':Gh#'
+    63,   # ':GL#'
+    49,   # ':Gm#'
+    63,   # ':Gl#'
+    63,   # ':GM#'
+    63,   # ':GN#'
+    63,   # ':GO#'
+    63,   # ':GP#'
+    57,   # ':GpB#'
+    49,   # ':GpH#'
+    49,   # ':GpS#'
+    63,   # ':Go#'
+    63,   # ':Gq#'
+    63,   # ':GR#'
+    63,   # ':Gr#'
+    63,   # ':GS#'
+    63,   # ':Gs#'
+    63,   # ':GT#'
+    63,   # ':Gt#'
+    63,   # ':GVD#'
+    63,   # ':GVN#'
+    63,   # ':GVO#'
+    63,   # ':GVP#'
+    63,   # ':GVT#'
+    63,   # ':GW#'
+    63,   # ':Gy#'
+    63,   # ':GZ#'
+    49,   # ':hC#'
+    61,   # ':hF#'
+    49,   # ':hIYYMMDDHHMMSS#'
+    49,   # ':hN#'
+    61,   # ':hP#'
+    53,   # ':hS#'
+    49,   # ':hW#'
+    61,   # ':h?#'
+    63,   # ':H#'
+    49,   # ':I#'
+    63,   # ':LB#'
+    63,   # ':LCNNNN#'
+    63,   # ':LF#'
+    63,   # ':Lf#'
+    63,   # ':LI#'
+    63,   # ':LMNNNN#'
+    63,   # ':LN#'
+    63,   # ':LoD#'
+    63,   # ':LsD#'
+    63,   # ':LSNNNN#'
+    61,   # ':MA#'
+    61,   # ':MgnDDDD#'
+    61,   # ':MgsDDDD#'
+    61,   # ':MgeDDDD#'
+    61,   # ':MgwDDDD#'
+    61,   # ':MgS<x>#'
+    63,   # ':Me#'
+    63,   # ':Mn#'
+    63,   # ':Ms#'
+    63,   # ':Mw#'
+    63,   # ':MS#'
+    63,   # ':P#'
+    55,   # ':$Q#'
+    49,   # ':$QA+#'
+    49,   # ':$QA-#'
+    49,   # ':$QC#'
+    49,   # ':$QGNNNNN#'
+    49,   # ':$QP<p><n><n>#'
+    49,   # ':$QS+#'
+    49,   # ':$QS-#'
+    49,   # ':$QU+#'
+    49,   # ':$QU-#'
+    49,   # ':$QV+#'
+    49,   # ':$QV-#'
+    49,   # ':$QW#'
+    49,   # ':$QZ+#'
+    5,   # ':$QZ-#'
+    63,   # ':Q#'
+    63,   # ':Qe#'
+    63,   # ':Qn#'
+    63,   # ':Qs#'
+    63,   # ':Qw#'
+    53,   # ':r+#'
+    53,   # ':r-#'
+    49,   # ':rn#'
+    49,   # ':rh#'
+    49,   # ':rC#'
+    49,   # ':rc#'
+    49,   # ':rq#'
+    63,   # ':RC#'
+    63,   # ':RG#'
+    63,   # ':RM#'
+    63,   # ':RS#'
+    49,   # ':RADD.D#'
+    49,   # ':REDD.D#'
+    49,   # ':RgSS.S#'
+    61,   # ':SasDD*MM#'
+    63,   # ':SbsMM.M#'
+    63,   # ':SBn#'
+    63,   # ':SCMM/DD/YY#'
+    63,   # ':SdsDD*MM#'
+    63,   # ':SEsDD*MM#'
+    63,   # ':SesDDD*MM#'
+    63,   # ':SfsMM.M#'
+    63,   # ':SFNNN#'
+    63,   # ':SgDDD*MM#'
+    63,   # ':SGsHH.H#'
+    49,   # ':SHD#'
+    63,   # ':ShDD#'
+    63,   # ':SlNNN#'
+    63,   # ':SLHH:MM:SS#'
+    49,   # ':Sm+#'
+    49,   # ':Sm-#'
+    63,   # ':SM<string>#'
+    63,   # ':SN<string>#'
+    63,   # ':SO<string>#'
+    63,   # ':SoDD*#'
+    63,   # ':SP<string>#'
+    57,   # ':SpB<num> <num>#'
+    49,   # ':SpH<num><num>#'
+    49,   # ':SpS<num><num><num>#'
+    63,   # ':Sq#'
+    63,   # ':SrHH:MM.T#'
+    63,   # ':SrHH:MM:SS#'
+    63,   # ':SsNNN#'
+    63,   # ':SSHH:MM:SS#'
+    63,   # ':StsDD*MM#'
+    49,   # ':STdddd.ddddddd#'
+    63,   # ':ST+#'
+    63,   # ':ST-#'
+    49,   # ':STA-#'
+    49,   # ':STA+#'
+    49,   # ':STZ-#'
+    49,   # ':STZ+#'
+    63,   # ':SwN#'
+    63,   # ':SyGPDCO#'
+    53,   # ':SzDDD*MM#'
+    63,   # ':T+#'
+    63,   # ':T-#'
+    63,   # ':TL#'
+    63,   # ':TM#'
+    63,   # ':TQ#'
+    63,   # ':TS#'
+    63,   # ':U#'
+    53,   # ':VDNNNN#'
+    53,   # ':VRNNNN#'
+    63,   # ':W<n>#'
+    6,   # ':??#'
+    6,   # ':?+#'
+    6,   # ':?-#'
+)
+
+EXACT = {
+    '\x06': 0,
+    '\x04': 1,
+    ':Aa#': 2,
+    ':AL#': 3,
+    ':AP#': 4,
+    ':AA#': 5,
+    ':B+#': 8,
+    ':B-#': 9,
+    ':CL#': 12,
+    ':CM#': 13,
+    ':D#': 14,
+    ':f+#': 15,
+    ':f-#': 16,
+    ':fp+#': 18,
+    ':fp-#': 19,
+    ':fT#': 20,
+    ':fC#': 21,
+    ':F+#': 22,
+    ':F-#': 23,
+    ':FB#': 24,
+    ':Fp#': 30,
+    ':FQ#': 31,
+    ':FF#': 32,
+    ':FS#': 33,
+    ':g+#': 35,
+    ':g-#': 36,
+    ':gps#': 37,
+    ':gT#': 38,
+    ':G0#': 39,
+    ':G1#': 40,
+    ':G2#': 41,
+    ':Ga#': 42,
+    ':GA#': 43,
+    ':Gb#': 44,
+    ':GC#': 45,
+    ':Gc#': 46,
+    ':GD#': 47,
+    ':Gd#': 48,
+    ':GE#': 49,
+    ':Ge#': 50,
+    ':GF#': 51,
+    ':Gf#': 52,
+    ':GG#': 53,
+    ':Gg#': 54,
+    ':GH#': 55,
+    ':Gh#': 56,
+    ':GL#': 57,
+    ':Gm#': 58,
+    ':Gl#': 59,
+    ':GM#': 60,
+    ':GN#': 61,
+    ':GO#': 62,
+    ':GP#': 63,
+    ':GpB#': 64,
+    ':GpH#': 65,
+    ':GpS#': 66,
+    ':Go#': 67,
+    ':Gq#': 68,
+    ':GR#': 69,
+    ':Gr#': 70,
+    ':GS#': 71,
+    ':Gs#': 72,
+    ':GT#': 73,
+    ':Gt#': 74,
+    ':GVD#': 75,
+    ':GVN#': 76,
+    ':GVO#': 77,
+    ':GVP#': 78,
+    ':GVT#': 79,
+    ':GW#': 80,
+    ':Gy#': 81,
+    ':GZ#': 82,
+    ':hC#': 83,
+    ':hF#': 84,
+    ':hN#': 86,
+    ':hP#': 87,
+    ':hS#': 88,
+    ':hW#': 89,
+    ':h?#': 90,
+    ':H#': 91,
+    ':I#': 92,
+    ':LB#': 93,
+    ':LF#': 95,
+    ':Lf#': 96,
+    ':LI#': 97,
+    ':LN#': 99,
+    ':MA#': 103,
+    ':Me#': 109,
+    ':Mn#': 110,
+    ':Ms#': 111,
+    ':Mw#': 112,
+    ':MS#': 113,
+    ':P#': 114,
+    ':$Q#': 115,
+    ':$QA+#': 116,
+    ':$QA-#': 117,
+    ':$QC#': 118,
+    ':$QS+#': 121,
+    ':$QS-#': 122,
+    ':$QU+#': 123,
+    ':$QU-#': 124,
+    ':$QV+#': 125,
+    ':$QV-#': 126,
+    ':$QW#': 127,
+    ':$QZ+#': 128,
+    ':$QZ-#': 129,
+    ':Q#': 130,
+    ':Qe#': 131,
+    ':Qn#': 132,
+    ':Qs#': 133,
+    ':Qw#': 134,
+    ':r+#': 135,
+    ':r-#': 136,
+    ':rn#': 137,
+    ':rh#': 138,
+    ':rC#': 139,
+    ':rc#': 140,
+    ':rq#': 141,
+    ':RC#': 142,
+    ':RG#': 143,
+    ':RM#': 144,
+    ':RS#': 145,
+    ':Sm+#': 164,
+    ':Sm-#': 165,
+    ':Sq#': 174,
+    ':ST+#': 181,
+    ':ST-#': 182,
+    ':STA-#': 183,
+    ':STA+#': 184,
+    ':STZ-#': 185,
+    ':STZ+#': 186,
+    ':T+#': 190,
+    ':T-#': 191,
+    ':TL#': 192,
+    ':TM#': 193,
+    ':TQ#': 194,
+    ':TS#': 195,
+    ':U#': 196,
+    ':??#': 200,
+    ':?+#': 201,
+    ':?-#': 202,
+}
+
+HEADS = (
+    (4, {
+        ':$BA': 6,
+        ':$BZ': 7,
+        ':FLD': 26,
+        ':FLN': 27,
+        ':FLS': 28,
+        ':Mgn': 104,
+        ':Mgs': 105,
+        ':Mge': 106,
+        ':Mgw': 107,
+        ':MgS': 108,
+        ':$QG': 119,
+        ':$QP': 120,
+        ':SpB': 171,
+        ':SpH': 172,
+        ':SpS': 173,
+    }),
+    (3, {
+        ':BD': 11,
+        ':fH': 17,
+        ':FC': 25,
+        ':FP': 29,
+        ':hI': 85,
+        ':LC': 94,
+        ':LM': 98,
+        ':Lo': 100,
+        ':Ls': 101,
+        ':LS': 102,
+        ':RA': 146,
+        ':RE': 147,
+        ':Rg': 148,
+        ':Sa': 149,
+        ':Sb': 150,
+        ':SB': 151,
+        ':SC': 152,
+        ':Sd': 153,
+        ':SE': 154,
+        ':Se': 155,
+        ':Sf': 156,
+        ':SF': 157,
+        ':Sg': 158,
+        ':SG': 159,
+        ':SH': 160,
+        ':Sh': 161,
+        ':Sl': 162,
+        ':SL': 163,
+        ':SM': 166,
+        ':SN': 167,
+        ':SO': 168,
+        ':So': 169,
+        ':SP': 170,
+        ':Sr': 175,
+        ':Ss': 177,
+        ':SS': 178,
+        ':St': 179,
+        ':ST': 180,
+        ':Sw': 187,
+        ':Sy': 188,
+        ':Sz': 189,
+        ':VD': 197,
+        ':VR': 198,
+    }),
+    (2, {
+        ':B': 10,
+        ':F': 34,
+        ':W': 199,
+    }),
+)
+
+
+def match(frame: str) -> int:
+    """ENTRIES row of a command frame (text including '#', or the ACK byte); -1 if unknown."""
+    i = EXACT.get(frame, -1)
+    if i < 0 and frame[-1:] == "#":
+        for n, heads in HEADS:
+            i = heads.get(frame[:n], -1)
+            if i >= 0:
+                break
+    return i
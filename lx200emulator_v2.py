@@ -22,6 +22,17 @@ import sys
 import math
 import threading
 import re
+import selectors
+import collections
+import heapq
+
+from buffered_log import BufferedLog, INFO, parse_levels
+from lx200_protocol_table import PROFILE_BITS, SUPPORT as SPEC_SUPPORT, match as spec_match
+
+try:
+    import numpy as np   # optional: vectorised array conversions
+except ImportError:
+    np = None
 
 
 # ---------------------------------------------------------------------------
@@ -59,6 +70,12 @@ EMULATOR_PROFILES = {
         'mount_default':   'A',
         'description':     'Meade Autostar II (LX200ACF / RCX)',
     },
+    'maxrcx': {
+        'product_name':    'RCX400',
+        'firmware':        '4.2g',
+        'mount_default':   'A',
+        'description':     'Meade RCX400 / LX200GPS-RCX (Autostar II + focuser/collimation)',
+    },
 }
 
 
@@ -66,9 +83,14 @@ EMULATOR_PROFILES = {
 # Logging
 # ---------------------------------------------------------------------------
 
-def plog(msg: str):
-    ts = datetime.datetime.now().strftime('%Y-%m-%d@%H:%M:%S')
-    print(f'[{ts}] {msg}')
+# Records go through a bounded queue to a background writer (buffered_log).
+# Categories: commands, tx (RX/TX traffic), display, motion, server.
+LOG = BufferedLog()
+
+
+def plog(msg: str, *args, category: str = 'server', level: int = INFO):
+    """Queue a log line; msg % args is only formatted if the category is enabled."""
+    LOG.log(category, msg, *args, level=level)
 
 
 # ---------------------------------------------------------------------------
@@ -96,6 +118,11 @@ def gmst_hours(dt: datetime.datetime) -> float:
     return gmst % 24.0
 
 
+def lst_hours(lon_deg: float, utc_dt: datetime.datetime) -> float:
+    """Local Sidereal Time in hours."""
+    return (gmst_hours(utc_dt) + lon_deg / 15.0) % 24.0
+
+
 def radec_to_altaz(ra_h: float, dec_deg: float,
                    lat_deg: float, lon_deg: float,
                    utc_dt: datetime.datetime) -> tuple:
@@ -103,8 +130,11 @@ def radec_to_altaz(ra_h: float, dec_deg: float,
     Convert RA/Dec (hours/degrees J2000) to Alt/Az for a given site and time.
     Returns (alt_deg, az_deg) — az measured N through E.
     """
-    gmst = gmst_hours(utc_dt)
-    lst = (gmst + lon_deg / 15.0) % 24.0
+    return _radec_to_altaz_lst(ra_h, dec_deg, lat_deg, lst_hours(lon_deg, utc_dt))
+
+
+def _radec_to_altaz_lst(ra_h: float, dec_deg: float,
+                        lat_deg: float, lst: float) -> tuple:
     ha_deg = ((lst - ra_h) % 24.0) * 15.0      # hour angle in degrees
 
     ha_r  = math.radians(ha_deg)
@@ -132,9 +162,11 @@ def altaz_to_radec(alt_deg: float, az_deg: float,
                    lat_deg: float, lon_deg: float,
                    utc_dt: datetime.datetime) -> tuple:
     """Convert Alt/Az to RA/Dec (hours/degrees). Returns (ra_h, dec_deg)."""
-    gmst = gmst_hours(utc_dt)
-    lst  = (gmst + lon_deg / 15.0) % 24.0
+    return _altaz_to_radec_lst(alt_deg, az_deg, lat_deg, lst_hours(lon_deg, utc_dt))
+
 
+def _altaz_to_radec_lst(alt_deg: float, az_deg: float,
+                        lat_deg: float, lst: float) -> tuple:
     alt_r = math.radians(alt_deg)
     az_r  = math.radians(az_deg)
     lat_r = math.radians(lat_deg)
@@ -158,6 +190,116 @@ def altaz_to_radec(alt_deg: float, az_deg: float,
     return ra_h, dec_deg
 
 
+# ---------------------------------------------------------------------------
+# Array conversions (catalogue visibility tables, trajectories)
+# ---------------------------------------------------------------------------
+#
+# Inputs broadcast against each other: scalars, sequences or NumPy arrays of
+# RA/Dec (or Alt/Az) and of times. A time is a UTC datetime or a Julian date
+# (float). With NumPy installed (and use_numpy not False) the conversion is one
+# vectorised pass and returns arrays; otherwise it loops over the scalar math
+# and returns lists. Both give the same results as the scalar functions.
+
+def _as_list(x) -> list:
+    if isinstance(x, (str, bytes)) or not hasattr(x, '__len__'):
+        return [x]
+    return list(x)
+
+
+def _broadcast(*cols) -> list:
+    """Pure-Python broadcasting of length-1 / length-n columns."""
+    cols = [_as_list(c) for c in cols]
+    n = max(len(c) for c in cols)
+    for c in cols:
+        if len(c) not in (1, n):
+            raise ValueError(f'cannot broadcast lengths {[len(c) for c in cols]}')
+    return [c * n if len(c) == 1 else c for c in cols]
+
+
+def julian_dates(times) -> list:
+    """Julian dates for a datetime / float or a sequence of them."""
+    return [julian_date(t) if isinstance(t, datetime.datetime) else float(t)
+            for t in _as_list(times)]
+
+
+def _gmst_from_jd(jd):
+    """GMST hours for Julian date(s); same polynomial as gmst_hours."""
+    t = (jd - 2451545.0) / 36525.0
+    return (6.697374558
+            + 2400.0513369 * t
+            + 0.0000258622 * t ** 2
+            - 1.7222e-9 * t ** 3) % 24.0
+
+
+def _use_numpy(use_numpy) -> bool:
+    if use_numpy and np is None:
+        raise RuntimeError('NumPy is not installed')
+    return np is not None if use_numpy is None else bool(use_numpy)
+
+
+def radec_to_altaz_array(ra_h, dec_deg, lat_deg: float, lon_deg: float,
+                         times, use_numpy: bool | None = None) -> tuple:
+    """Vectorised radec_to_altaz. Returns (alt_deg, az_deg) arrays (lists without NumPy)."""
+    if not _use_numpy(use_numpy):
+        ra, dec, jd = _broadcast(ra_h, dec_deg, julian_dates(times))
+        out = [_radec_to_altaz_lst(r, d, lat_deg, (_gmst_from_jd(j) + lon_deg / 15.0) % 24.0)
+               for r, d, j in zip(ra, dec, jd)]
+        return [a for a, _ in out], [z for _, z in out]
+
+    ra  = np.asarray(ra_h, dtype=float)
+    dec = np.radians(np.asarray(dec_deg, dtype=float))
+    lst = (_gmst_from_jd(np.asarray(julian_dates(times) if _has_datetimes(times) else times,
+                                    dtype=float)) + lon_deg / 15.0) % 24.0
+    lat = math.radians(lat_deg)
+
+    ha = np.radians(((lst - ra) % 24.0) * 15.0)
+    sin_alt = np.sin(dec) * math.sin(lat) + np.cos(dec) * math.cos(lat) * np.cos(ha)
+    alt = np.arcsin(np.clip(sin_alt, -1.0, 1.0))
+    cos_alt = np.cos(alt)
+    pole = np.abs(cos_alt) < 1e-10
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_az = (np.sin(dec) - np.sin(alt) * math.sin(lat)) / (cos_alt * math.cos(lat))
+    az = np.degrees(np.arccos(np.clip(cos_az, -1.0, 1.0)))
+    az = np.where(np.sin(ha) > 0, 360.0 - az, az)
+    az = np.where(pole, 0.0, az)
+    return np.degrees(alt), az
+
+
+def altaz_to_radec_array(alt_deg, az_deg, lat_deg: float, lon_deg: float,
+                         times, use_numpy: bool | None = None) -> tuple:
+    """Vectorised altaz_to_radec. Returns (ra_h, dec_deg) arrays (lists without NumPy)."""
+    if not _use_numpy(use_numpy):
+        alt, az, jd = _broadcast(alt_deg, az_deg, julian_dates(times))
+        out = [_altaz_to_radec_lst(a, z, lat_deg, (_gmst_from_jd(j) + lon_deg / 15.0) % 24.0)
+               for a, z, j in zip(alt, az, jd)]
+        return [r for r, _ in out], [d for _, d in out]
+
+    alt = np.radians(np.asarray(alt_deg, dtype=float))
+    az  = np.radians(np.asarray(az_deg, dtype=float))
+    lst = (_gmst_from_jd(np.asarray(julian_dates(times) if _has_datetimes(times) else times,
+                                    dtype=float)) + lon_deg / 15.0) % 24.0
+    lat = math.radians(lat_deg)
+
+    sin_dec = np.sin(alt) * math.sin(lat) + np.cos(alt) * math.cos(lat) * np.cos(az)
+    dec = np.arcsin(np.clip(sin_dec, -1.0, 1.0))
+    cos_dec = np.cos(dec)
+    pole = np.abs(cos_dec) < 1e-10
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_ha = (np.sin(alt) - np.sin(dec) * math.sin(lat)) / (cos_dec * math.cos(lat))
+    ha = np.degrees(np.arccos(np.clip(cos_ha, -1.0, 1.0)))
+    ha = np.where(np.sin(az) > 0, 360.0 - ha, ha)
+    ra = np.where(pole, lst % 24.0, (lst - ha / 15.0) % 24.0)
+    return ra, np.degrees(dec)
+
+
+def _has_datetimes(times) -> bool:
+    if isinstance(times, datetime.datetime):
+        return True
+    if np is not None and isinstance(times, np.ndarray):
+        return times.dtype == object
+    return any(isinstance(t, datetime.datetime) for t in _as_list(times))
+
+
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
@@ -263,10 +405,422 @@ def parse_dec(s: str) -> float | None:
         return None
 
 
+# ===========================================================================
+# Reply queue
+# ===========================================================================
+
+class ReplyQueue:
+    """
+    Pending reply bytes: a deque of encoded chunks plus a read offset into the
+    head chunk. push and pop cost only the bytes they move, so draining a long
+    reply in 16-byte pieces stays linear. Not locked; owners lock if shared.
+    """
+    __slots__ = ('_chunks', '_offset', '_size')
+
+    def __init__(self):
+        self._chunks = collections.deque()
+        self._offset = 0     # bytes of _chunks[0] already consumed
+        self._size   = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, data: bytes):
+        if data:
+            self._chunks.append(data)
+            self._size += len(data)
+
+    def pop(self, n: int) -> bytes:
+        """Remove and return up to n bytes (serial-timing chunking)."""
+        out = bytearray()
+        while self._chunks and len(out) < n:
+            head = self._chunks[0]
+            take = min(n - len(out), len(head) - self._offset)
+            out += head[self._offset:self._offset + take]
+            self._offset += take
+            if self._offset == len(head):
+                self._chunks.popleft()
+                self._offset = 0
+        self._size -= len(out)
+        return bytes(out)
+
+    def drain(self) -> list:
+        """Remove and return every pending chunk, for one gather write."""
+        parts = self.pending()
+        self._chunks.clear()
+        self._offset = 0
+        self._size   = 0
+        return parts
+
+    def pending(self) -> list:
+        """Pending chunks without consuming them (first one trimmed to the offset)."""
+        parts = list(self._chunks)
+        if parts and self._offset:
+            parts[0] = parts[0][self._offset:]
+        return parts
+
+    def consume(self, n: int):
+        """Discard the first n pending bytes (after a partial send)."""
+        self._size -= n
+        while n:
+            left = len(self._chunks[0]) - self._offset
+            if n < left:
+                self._offset += n
+                return
+            n -= left
+            self._chunks.popleft()
+            self._offset = 0
+
+    def peek(self, n: int = -1) -> bytes:
+        """Up to n pending bytes (all if n < 0), without consuming them."""
+        data = b''.join(self.pending())
+        return data if n < 0 else data[:n]
+
+    def clear(self):
+        self.drain()
+
+
+HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')   # writev; not on Windows
+
+
+def send_gather(sock: socket.socket, parts: list):
+    """Send every part with one writev (sendmsg) per pass instead of one send each."""
+    if not HAS_SENDMSG:
+        sock.sendall(b''.join(parts))
+        return
+    parts = list(parts)
+    while parts:
+        n = sock.sendmsg(parts[:1024])   # IOV_MAX
+        while parts and n >= len(parts[0]):
+            n -= len(parts.pop(0))
+        if n:
+            parts[0] = parts[0][n:]
+
+
+# ===========================================================================
+# Motion engine
+# ===========================================================================
+
+class VirtualClock:
+    """
+    Emulator motion time in seconds. Runs time_scale x wall time; a manual
+    clock only moves when advance() is called (deterministic tests).
+    """
+
+    def __init__(self, time_scale: float = 1.0, manual: bool = False):
+        if time_scale <= 0:
+            raise ValueError(f'time_scale must be > 0, got {time_scale}')
+        self.time_scale = time_scale
+        self.manual     = manual
+        self._t0        = time.monotonic()
+        self._offset    = 0.0
+
+    def now(self) -> float:
+        if self.manual:
+            return self._offset
+        return (time.monotonic() - self._t0) * self.time_scale + self._offset
+
+    def advance(self, dt: float):
+        """Move the clock forward by dt seconds (manual clocks; skips ahead otherwise)."""
+        self._offset += dt
+
+    def wall_seconds(self, dt: float) -> float:
+        """Wall-clock seconds until dt seconds of emulator time have passed."""
+        return dt / self.time_scale
+
+
+class SlewProfile:
+    """
+    Straight-line slew from (ra, dec) to (target_ra, target_dec), the short way
+    round in RA. Starts at speed v0, accelerates at accel up to max_rate,
+    cruises and brakes to rest exactly on the target; a slew too short to brake
+    at accel brakes harder. Distances in degrees, times in seconds.
+    """
+
+    def __init__(self, ra: float, dec: float, target_ra: float, target_dec: float,
+                 max_rate: float, accel: float, v0: float = 0.0):
+        self.target_ra  = target_ra
+        self.target_dec = target_dec
+        self.max_rate   = max_rate
+        self.d_ra_h     = (target_ra - ra + 12.0) % 24.0 - 12.0
+        self.d_dec      = target_dec - dec
+        self.length     = math.hypot(self.d_ra_h * 15.0, self.d_dec)
+        self.accel      = accel
+        self.v0         = v0 = min(v0, max_rate)
+        dist = self.length
+        if dist <= 0.0:
+            self.v_peak, self.brake = v0, accel
+            self.t_acc = self.t_cruise = self.t_brake = 0.0
+        elif v0 * v0 / (2.0 * accel) >= dist:           # already braking
+            self.v_peak, self.brake = v0, v0 * v0 / (2.0 * dist)
+            self.t_acc = self.t_cruise = 0.0
+            self.t_brake = v0 / self.brake
+        else:                                           # trapezoid, or triangle if short
+            v_peak = min(max_rate, math.sqrt(accel * dist + v0 * v0 / 2.0))
+            d_acc  = (v_peak * v_peak - v0 * v0) / (2.0 * accel)
+            d_brk  = v_peak * v_peak / (2.0 * accel)
+            self.v_peak, self.brake = v_peak, accel
+            self.t_acc    = (v_peak - v0) / accel
+            self.t_cruise = max(0.0, dist - d_acc - d_brk) / v_peak
+            self.t_brake  = v_peak / accel
+        self.duration = self.t_acc + self.t_cruise + self.t_brake
+
+    def distance(self, tau: float) -> float:
+        """Degrees travelled tau seconds after the start."""
+        if tau >= self.duration:
+            return self.length
+        if tau <= 0.0:
+            return 0.0
+        if tau < self.t_acc:
+            return self.v0 * tau + 0.5 * self.accel * tau * tau
+        d = self.v0 * self.t_acc + 0.5 * self.accel * self.t_acc * self.t_acc
+        tau -= self.t_acc
+        if tau < self.t_cruise:
+            return d + self.v_peak * tau
+        tau -= self.t_cruise
+        d += self.v_peak * self.t_cruise
+        return min(self.length, d + self.v_peak * tau - 0.5 * self.brake * tau * tau)
+
+    def speed(self, tau: float) -> float:
+        if tau >= self.duration:
+            return 0.0
+        if tau < self.t_acc:
+            return self.v0 + self.accel * max(0.0, tau)
+        tau -= self.t_acc
+        if tau < self.t_cruise:
+            return self.v_peak
+        return max(0.0, self.v_peak - self.brake * (tau - self.t_cruise))
+
+    def offset(self, tau: float) -> tuple:
+        """(dra_h, ddec) from the start position tau seconds after the start."""
+        if self.length <= 0.0:
+            return 0.0, 0.0
+        frac = self.distance(tau) / self.length
+        return frac * self.d_ra_h, frac * self.d_dec
+
+
+class MotionEngine:
+    """
+    The one place RA/Dec change: directional moves (:Mn/s/e/w), accelerated
+    slews (:MS) and timed events (e.g. :hC home completion), on one clock.
+
+    Motion is stored as a segment, not integrated: the position and time of
+    the last command, the rate vector of the directional moves and at most one
+    SlewProfile whose end condition is its arrival time. position() evaluates
+    the segment analytically at the moment of the query, so the answer does
+    not depend on how often, or from which thread, it is read, and queries do
+    not write state. Dec stops at the poles.
+
+    A scheduler thread is started only when something is due (slew arrival,
+    scheduled events) and sleeps until then; an idle or manually clocked
+    engine has no thread at all.
+    """
+
+    DIRECTIONS = ('n', 's', 'e', 'w')
+
+    def __init__(self, ra: float, dec: float, clock: VirtualClock | None = None,
+                 accel_deg_s2: float = 2.0):
+        self.clock        = clock or VirtualClock()
+        self.accel_deg_s2 = accel_deg_s2
+        self._cond        = threading.Condition()
+        self._t0          = self.clock.now()   # segment start
+        self._ra0         = ra
+        self._dec0        = dec
+        self._rate        = (0.0, 0.0)         # (h/s, deg/s) from the directional moves
+        self._dirs        = dict.fromkeys(self.DIRECTIONS, False)
+        self._move_rate   = 1.0                # deg/s for directional moves
+        self._slew        = None               # SlewProfile starting at _t0
+        self._on_done     = None
+        self._events      = []                 # heap of (time, seq, fn)
+        self._seq         = 0
+        self._thread      = None
+        self._running     = True
+        self.wakeups      = 0                  # scheduler thread wake-ups
+
+    # ---- Queries -----------------------------------------------------------
+
+    def position(self) -> tuple:
+        """(ra, dec) at the current clock time."""
+        done = []
+        with self._cond:
+            now = self.clock.now()
+            self._advance(now, done)
+            ra, dec = self._at(now)
+        self._run_callbacks(done)
+        return ra, dec
+
+    @property
+    def slewing(self) -> bool:
+        self.poll()
+        return self._slew is not None
+
+    def moving(self, direction: str) -> bool:
+        return self._dirs[direction]
+
+    def poll(self):
+        """Finish a slew that has arrived and fire events that are due."""
+        done = []
+        with self._cond:
+            self._advance(self.clock.now(), done)
+        self._run_callbacks(done)
+
+    # ---- Commands ----------------------------------------------------------
+
+    def set_position(self, ra: float, dec: float):
+        def apply():
+            self._ra0, self._dec0 = ra, dec
+            if self._slew is not None:   # carry on towards the target from here
+                self._retarget(self._slew.target_ra, self._slew.target_dec, self._slew.max_rate)
+        self._command(apply)
+
+    def start_move(self, direction: str, rate: float):
+        def apply():
+            self._dirs[direction] = True
+            self._move_rate = rate
+        self._command(apply)
+
+    def set_move_rate(self, rate: float):
+        def apply():
+            self._move_rate = rate
+        self._command(apply)
+
+    def stop(self, direction: str | None = None):
+        """Stop one direction, or everything including a slew (direction None)."""
+        def apply():
+            if direction is None:
+                self._dirs = dict.fromkeys(self.DIRECTIONS, False)
+                self._slew = self._on_done = None
+            else:
+                self._dirs[direction] = False
+        self._command(apply)
+
+    def slew_to(self, ra: float, dec: float, max_rate: float, on_done=None):
+        """Slew to (ra, dec); keeps the current speed if a slew is already running."""
+        def apply():
+            self._retarget(ra, dec, max_rate)
+            self._on_done = on_done
+        self._command(apply)
+
+    def schedule(self, delay_s: float, fn):
+        """Run fn (without arguments) once delay_s of emulator time has passed."""
+        def apply():
+            self._seq += 1
+            heapq.heappush(self._events, (self._t0 + delay_s, self._seq, fn))
+        self._command(apply)
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    # ---- Internals ---------------------------------------------------------
+
+    def _command(self, apply):
+        """Start a new segment at now, apply the change to it, wake the scheduler."""
+        done = []
+        with self._cond:
+            now = self.clock.now()
+            self._advance(now, done)
+            self._reanchor(now, done)
+            apply()
+            d = self._dirs
+            self._rate = (self._move_rate / 15.0 * (d['e'] - d['w']),   # East → RA increases
+                          self._move_rate * (d['n'] - d['s']))
+            self._wake()
+        self._run_callbacks(done)
+
+    def _at(self, t: float) -> tuple:
+        """Evaluate the current segment at time t."""
+        tau = t - self._t0
+        ra  = self._ra0 + self._rate[0] * tau
+        dec = self._dec0 + self._rate[1] * tau
+        if self._slew is not None:
+            d_ra, d_dec = self._slew.offset(tau)
+            ra  += d_ra
+            dec += d_dec
+        return ra % 24.0, max(-90.0, min(90.0, dec))
+
+    def _retarget(self, ra: float, dec: float, max_rate: float):
+        v0 = self._slew.speed(0.0) if self._slew is not None else 0.0
+        self._slew = SlewProfile(self._ra0, self._dec0, ra, dec,
+                                 max_rate, self.accel_deg_s2, v0)
+
+    def _reanchor(self, t: float, done: list):
+        """Make the position at t the start of a new segment."""
+        ra, dec = self._at(t)
+        slew = self._slew
+        if slew is not None:
+            tau = t - self._t0
+            if t >= self._t0 + slew.duration:   # same test as _next_due()
+                if self._rate == (0.0, 0.0):
+                    ra, dec = slew.target_ra, slew.target_dec
+                self._slew = None
+                if self._on_done is not None:
+                    done.append(self._on_done)
+                    self._on_done = None
+            else:
+                self._slew = SlewProfile(ra, dec, slew.target_ra, slew.target_dec,
+                                         slew.max_rate, self.accel_deg_s2, slew.speed(tau))
+        self._t0, self._ra0, self._dec0 = t, ra, dec
+
+    def _next_due(self) -> float | None:
+        t_arrive = self._t0 + self._slew.duration if self._slew is not None else None
+        t_event  = self._events[0][0] if self._events else None
+        if t_arrive is None or (t_event is not None and t_event < t_arrive):
+            return t_event
+        return t_arrive
+
+    def _advance(self, now: float, done: list):
+        """Finish an arrived slew and pop due events, in time order, up to now."""
+        while True:
+            t_next = self._next_due()
+            if t_next is None or t_next > now:
+                return
+            if self._events and self._events[0][0] == t_next:
+                _, _, fn = heapq.heappop(self._events)
+                done.append(fn)
+            else:
+                self._reanchor(t_next, done)
+
+    def _run_callbacks(self, done: list):
+        for fn in done:
+            fn()
+
+    def _wake(self):
+        if self.clock.manual:
+            return    # nothing to wait for; queries catch up with advance()
+        if self._thread is None:
+            if self._next_due() is None:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True, name='motion')
+            self._thread.start()
+        self._cond.notify()
+
+    def _run(self):
+        """Scheduler thread: sleep until the next arrival or event, then fire it."""
+        while True:
+            done = []
+            with self._cond:
+                if not self._running:
+                    return
+                self.wakeups += 1
+                now = self.clock.now()
+                self._advance(now, done)
+                t_next = self._next_due()
+                if not done:
+                    self._cond.wait(None if t_next is None
+                                    else max(0.0, self.clock.wall_seconds(t_next - now)))
+            self._run_callbacks(done)
+
+
 # ===========================================================================
 # Telescope State Machine
 # ===========================================================================
 
+# Returned by a command-family handler for a body it does not recognise (→ NAK)
+UNKNOWN = object()
+
+
 class TelescopeStateMachine:
     """
     Full LX200 GPS telescope emulator.
@@ -288,6 +842,7 @@ class TelescopeStateMachine:
         'M': 1.0,     # Find   (~1°/s)
         'S': 4.0,     # Slew   (max ~4°/s)
     }
+    SLEW_ACCEL_DEG_S2 = 2.0   # slew acceleration / deceleration
 
     # Handset menu structure (navigation via :EK## keypress commands)
     menu_structure = {
@@ -362,16 +917,21 @@ class TelescopeStateMachine:
     }
 
     # -----------------------------------------------------------------------
-    def __init__(self, mode: str = 'lx200gps'):
+    def __init__(self, mode: str = 'lx200gps', sky_cache_ms: int = 100,
+                 clock: VirtualClock | None = None):
         # ---- Emulator profile ----
         profile = EMULATOR_PROFILES.get(mode, EMULATOR_PROFILES['lx200gps'])
         self.emulator_mode    = mode
         self.product_name     = profile['product_name']
         self.firmware_version = profile['firmware']
+        # Support-mask bit of this model in the compiled protocol table
+        self._spec_bit        = PROFILE_BITS.get(mode, PROFILE_BITS['lx200gps'])
 
         # ---- Pointing (J2000 RA hours / Dec degrees) ----
-        self.ra  = 5.5139    # Orion Nebula area
-        self.dec = -5.3911
+        # ra/dec are properties: the motion engine owns the position.
+        self._motion = MotionEngine(
+            5.5139, -5.3911,     # Orion Nebula area
+            clock=clock, accel_deg_s2=self.SLEW_ACCEL_DEG_S2)
 
         # ---- Slew target ----
         self.target_ra  = self.ra
@@ -399,22 +959,15 @@ class TelescopeStateMachine:
         self.high_limit    = 85     # max altitude for slewing (degrees)
         self.low_limit     = 5      # min altitude for slewing (degrees)
 
-        # ---- Continuous directional motion (:Mn/s/e/w# — :Q# stops) ----
-        self.moving_n = False
-        self.moving_s = False
-        self.moving_e = False
-        self.moving_w = False
+        # ---- Directional motion (:Mn/s/e/w# — :Q# stops) and slews (:MS#) ----
+        # live in self._motion; moving_n/s/e/w and slewing are read-only views.
 
-        # ---- Slew-to-target state ----
-        self.slewing      = False
-        self._slew_thread = None
-        self._slew_lock   = threading.Lock()
-
-        # ---- Background motion thread ----
-        self._motion_running = True
-        self._motion_thread  = threading.Thread(
-            target=self._motion_loop, daemon=True, name='motion')
-        self._motion_thread.start()
+        # ---- Lock for a mount shared by many clients ----
+        # _cmd_lock serialises dispatch so concurrent clients see whole commands,
+        # and the motion callbacks (slew/home completion) take it too; the
+        # motion engine runs callbacks outside its own lock, so it never holds
+        # that lock while waiting behind dispatch.
+        self._cmd_lock = threading.RLock()
 
         # ---- Object search / browse filters ----
         self.find_field_diameter = 15    # arcminutes
@@ -462,13 +1015,20 @@ class TelescopeStateMachine:
         self.custom_dec_rate = None
         self.guide_rate_arcsec = 15.0
 
-        # ---- Send buffer + lock ----
-        self.send_buffer  = ''
+        # ---- Send buffer (latin-1 bytes) + lock ----
+        self._replies     = ReplyQueue()
         self._buf_lock    = threading.Lock()
 
         # ---- Menu navigation ----
         self.current_menu_keys = [list(self.menu_structure.keys())[0]]
 
+        # ---- LST / AltAz memo (0 ms = off) ----
+        # Keyed on the inputs plus a wall-clock bucket, so :Sr/:Sd/:St/:Sg,
+        # syncs and motion miss the cache as soon as they change ra/dec/site.
+        self.sky_cache_ms = sky_cache_ms
+        self._lst_cache   = (None, None, 0.0)   # (bucket, longitude, lst)
+        self._altaz_cache = (None, (0.0, 0.0))  # (key, (alt, az))
+
     # =======================================================================
     # Internal helpers
     # =======================================================================
@@ -480,17 +1040,68 @@ class TelescopeStateMachine:
         offset = self.utc_offset + (1.0 if self.dst else 0.0)
         return self._utc_now() + datetime.timedelta(hours=offset)
 
+    def _time_bucket(self) -> int | None:
+        """Index of the current sky_cache_ms wall-clock bucket (None: caching off)."""
+        if self.sky_cache_ms <= 0:
+            return None
+        return int(time.time() * 1000.0) // self.sky_cache_ms
+
     def _lst(self) -> float:
-        """Local Sidereal Time in hours."""
+        """Local Sidereal Time in hours (memoised per time bucket)."""
+        bucket = self._time_bucket()
+        b, lon, lst = self._lst_cache
+        if bucket is not None and b == bucket and lon == self.site_longitude:
+            return lst
         gmst = gmst_hours(self._utc_now())
-        return (gmst + self.site_longitude / 15.0) % 24.0
+        lst  = (gmst + self.site_longitude / 15.0) % 24.0
+        self._lst_cache = (bucket, self.site_longitude, lst)
+        return lst
 
     def _altaz(self) -> tuple:
-        """Current Alt/Az for present RA/Dec, site, and UTC time."""
-        return radec_to_altaz(
-            self.ra, self.dec,
+        """
+        Current Alt/Az for present RA/Dec, site, and UTC time. Memoised on
+        (ra, dec, site, time bucket): a :GA#/:GZ# pair does the trig once.
+        """
+        ra, dec = self.position()
+        key = (ra, dec, self.site_latitude, self.site_longitude, self._time_bucket())
+        cached_key, altaz = self._altaz_cache
+        if key[4] is not None and cached_key == key:
+            return altaz
+        altaz = radec_to_altaz(
+            ra, dec,
             self.site_latitude, self.site_longitude,
             self._utc_now())
+        self._altaz_cache = (key, altaz)
+        return altaz
+
+    def position(self) -> tuple:
+        """Consistent (ra, dec) snapshot at the current motion-clock time."""
+        return self._motion.position()
+
+    @property
+    def ra(self) -> float:
+        return self._motion.position()[0]
+
+    @ra.setter
+    def ra(self, value: float):
+        self._motion.set_position(value, self.dec)
+
+    @property
+    def dec(self) -> float:
+        return self._motion.position()[1]
+
+    @dec.setter
+    def dec(self, value: float):
+        self._motion.set_position(self.ra, value)
+
+    @property
+    def slewing(self) -> bool:
+        return self._motion.slewing
+
+    moving_n = property(lambda self: self._motion.moving('n'))
+    moving_s = property(lambda self: self._motion.moving('s'))
+    moving_e = property(lambda self: self._motion.moving('e'))
+    moving_w = property(lambda self: self._motion.moving('w'))
 
     # ---- Formatters --------------------------------------------------------
 
@@ -510,7 +1121,7 @@ class TelescopeStateMachine:
 
     def _set_display(self, line: str):
         self.display_line1 = f'{line:16}'
-        plog(f'Display: [{self.display_line1}]')
+        plog('Display: [%s]', self.display_line1, category='display')
 
     def _basic_display(self) -> str:
         return f'\x97{self.display_line0}{self.display_line1}#'
@@ -520,78 +1131,58 @@ class TelescopeStateMachine:
     def _push(self, s: str):
         if s is None:
             return
+        data = s.encode('latin-1')
         with self._buf_lock:
-            self.send_buffer += s
+            self._replies.push(data)
 
     def add_to_send_buffer(self, s: str):
         self._push(s)
 
+    @property
+    def send_buffer(self) -> str:
+        """Pending replies as text (read-only view of the reply queue)."""
+        with self._buf_lock:
+            return self._replies.peek().decode('latin-1')
+
     def pop_from_send_buffer(self, length: int = 16) -> str:
+        return self.pop_send_bytes(length).decode('latin-1')
+
+    def pop_send_bytes(self, length: int = 16) -> bytes:
+        """Up to length pending reply bytes (serial-timing emulation)."""
         with self._buf_lock:
-            chunk = self.send_buffer[:length]
-            self.send_buffer = self.send_buffer[length:]
-        return chunk
+            return self._replies.pop(length)
+
+    def drain_send_parts(self) -> list:
+        """Every pending reply chunk, for a single gather write."""
+        with self._buf_lock:
+            return self._replies.drain()
 
     def has_data(self) -> bool:
-        return len(self.send_buffer) > 0
+        return len(self._replies) > 0
 
     def clear_send_buffer(self):
         with self._buf_lock:
-            self.send_buffer = ''
+            self._replies.clear()
 
     def nack(self) -> str:
         return '\x15'
 
     # =======================================================================
-    # Background threads
+    # Motion callbacks
     # =======================================================================
 
-    def _motion_loop(self):
-        """Update RA/Dec continuously while any directional motion flag is set."""
-        dt = 0.1   # 100 ms tick
-        while self._motion_running:
-            time.sleep(dt)
-            if not (self.moving_n or self.moving_s
-                    or self.moving_e or self.moving_w):
-                continue
-            rate  = self.SLEW_RATE_DEG_S.get(self.slew_rate, 1.0)
-            delta = rate * dt
-            if self.moving_n:
-                self.dec = min(90.0, self.dec + delta)
-            if self.moving_s:
-                self.dec = max(-90.0, self.dec - delta)
-            if self.moving_e:   # East → RA increases (objects rise from east)
-                self.ra = (self.ra + delta / 15.0) % 24.0
-            if self.moving_w:
-                self.ra = (self.ra - delta / 15.0) % 24.0
-
-    def _slew_to_target(self):
-        """Background thread: move RA/Dec toward target at current slew speed."""
-        rate = min(
-            self.SLEW_RATE_DEG_S.get(self.slew_rate, 4.0),
-            float(self.max_slew_rate))
-        dt = 0.05
-        while True:
-            d_ra_h  = (self.target_ra  - self.ra  + 12.0) % 24.0 - 12.0
-            d_dec   = self.target_dec - self.dec
-            d_ra_deg = d_ra_h * 15.0
-            dist    = math.hypot(d_ra_deg, d_dec)
-            if dist < 0.0005:
-                self.ra  = self.target_ra
-                self.dec = self.target_dec
-                break
-            step = rate * dt
-            if step >= dist:
-                self.ra  = self.target_ra
-                self.dec = self.target_dec
-                break
-            frac     = step / dist
-            self.ra  = (self.ra  + frac * d_ra_h) % 24.0
-            self.dec =  self.dec + frac * d_dec
-            time.sleep(dt)
-        self.slewing = False
-        self._set_display('Slew complete')
-        plog(f'Slew complete  RA={self.ra:.4f}h  Dec={self.dec:.4f}°')
+    # They run on the motion thread or a querying thread, so they take
+    # _cmd_lock like a command would.
+
+    def _slew_complete(self):
+        with self._cmd_lock:
+            self._set_display('Slew complete')
+            ra, dec = self.position()
+        plog('Slew complete  RA=%.4fh  Dec=%.4f°', ra, dec, category='motion')
+
+    def _home_complete(self):
+        with self._cmd_lock:
+            self.home_status = 1
 
     # =======================================================================
     # Command entry point
@@ -602,17 +1193,29 @@ class TelescopeStateMachine:
         Dispatch one command.  cmd includes the leading ':' but NOT the '#'.
         The ACK byte (\\x06) is passed without the colon.
         """
-        plog(f'CMD [{cmd}]')
-        result = self._dispatch(cmd)
-        if result is not None:
-            self._push(result)
+        self._push(self.handle(cmd))
+
+    def handle(self, cmd: str) -> str | None:
+        """
+        Dispatch one command and return its reply instead of queueing it on the
+        shared send_buffer, so a server can route it to the client that asked.
+        Safe to call from several client threads at once.
+        """
+        plog('CMD [%s]', cmd, category='commands')
+        with self._cmd_lock:
+            return self._dispatch(cmd)
 
     # =======================================================================
     # Main dispatcher
     # =======================================================================
 
     def _dispatch(self, cmd: str) -> str | None:
-
+        """
+        Table-driven: the exact command bodies in _EXACT_COMMANDS first, then
+        the family handler keyed on the first character (_COMMAND_FAMILIES).
+        A family handler returns UNKNOWN for bodies it does not recognise.
+        Commands the protocol spec marks unsupported on this model are NAKed.
+        """
         # ACK byte — query alignment mode
         if cmd == '\x06':
             return self.mount_mode
@@ -620,528 +1223,316 @@ class TelescopeStateMachine:
         if not cmd.startswith(':'):
             return None
 
+        i = spec_match(cmd + '#')
+        if i >= 0 and not SPEC_SUPPORT[i] & self._spec_bit:
+            plog('Unsupported on %s: [%s]', self.emulator_mode, cmd, category='commands')
+            return self.nack()
+
         body = cmd[1:]   # strip ':'
 
-        # ----------------------------------------------------------------
-        # Single-character / fixed commands (checked before prefix tests)
-        # ----------------------------------------------------------------
-        if body == 'H':
-            self.time_format_24h = not self.time_format_24h
-            return None
+        handler = self._EXACT_COMMANDS.get(body)
+        if handler is not None:
+            return handler(self)
 
-        if body == 'I':
-            self._set_display('Initializing...')
-            return None
+        family = self._COMMAND_FAMILIES.get(body[:1])
+        if family is not None:
+            result = family(self, body[1:])
+            if result is not UNKNOWN:
+                return result
 
-        if body == 'P':
-            self.high_precision = not self.high_precision
-            return 'HIGH PRECISION' if self.high_precision else 'LOW PRECISION'
+        plog('Unknown command body: [%s]', body, category='commands')
+        return self.nack()
 
-        if body == 'U':
-            self.high_precision = not self.high_precision
-            return None
+    # ---- Fixed commands ----------------------------------------------------
 
-        if body == 'D':
-            return '|#' if self.slewing else '#'
+    def _toggle_time_format(self) -> None:            # :H
+        self.time_format_24h = not self.time_format_24h
 
-        # ----------------------------------------------------------------
-        # Alignment :A
-        # ----------------------------------------------------------------
-        if body == 'Aa': return self._do_auto_align()
-        if body == 'AL': self.mount_mode = 'L'; self.tracking = False;  return None
-        if body == 'AP': self.mount_mode = 'P'; self.tracking = True;   return None
-        if body == 'AA': self.mount_mode = 'A'; self.tracking = True;   return None
-
-        # ----------------------------------------------------------------
-        # Backlash :$B
-        # ----------------------------------------------------------------
-        if body.startswith('$BA'):
-            try: self.backlash_alt = int(body[3:])
+    def _toggle_precision(self) -> None:              # :U
+        self.high_precision = not self.high_precision
+
+    def _toggle_precision_verbose(self) -> str:       # :P
+        self.high_precision = not self.high_precision
+        return 'HIGH PRECISION' if self.high_precision else 'LOW PRECISION'
+
+    def _set_alignment(self, mode: str, tracking: bool) -> None:   # :AL :AP :AA
+        self.mount_mode = mode
+        self.tracking   = tracking
+
+    def _step_reticule(self, step: int) -> None:      # :B+ :B-
+        self.reticule_brightness = max(0, min(9, self.reticule_brightness + step))
+
+    def _set_focuser_moving(self, moving: bool) -> None:   # :F+ :F- :FQ
+        self.focuser_moving = moving
+
+    def _set_focuser_speed(self, speed: int) -> None:      # :FF :FS :F<n>
+        self.focuser_speed = speed
+
+    def _set_gps(self, enabled: bool) -> None:        # :g+ :g-
+        self.gps_enabled = enabled  # type: ignore[attr-defined]
+
+    # ---- Command families (sub = body after the family character) ----------
+
+    def _cmd_dollar(self, sub: str):
+        # Backlash :$BA / :$BZ
+        if sub.startswith('BA'):
+            try: self.backlash_alt = int(sub[2:])
             except ValueError: pass
             return None
-        if body.startswith('$BZ'):
-            try: self.backlash_az = int(body[3:])
+        if sub.startswith('BZ'):
+            try: self.backlash_az = int(sub[2:])
             except ValueError: pass
             return None
+        # Smart drive :$Q
+        if sub.startswith('Q'):
+            return self._cmd_smart_drive(sub[1:])
+        return UNKNOWN
 
-        # ----------------------------------------------------------------
-        # Reticule :B
-        # ----------------------------------------------------------------
-        if body == 'B+':
-            self.reticule_brightness = min(9, self.reticule_brightness + 1); return None
-        if body == 'B-':
-            self.reticule_brightness = max(0, self.reticule_brightness - 1); return None
-        if body.startswith('BD'):
-            try: self.reticule_flash_rate = int(body[2:])
+    def _cmd_reticule(self, sub: str):
+        if sub.startswith('D'):
+            try: self.reticule_flash_rate = int(sub[1:])
             except ValueError: pass
             return None
-        if len(body) == 2 and body[0] == 'B' and body[1].isdigit():
-            self.reticule_flash_rate = int(body[1]); return None
-
-        # ----------------------------------------------------------------
-        # Sync :C
-        # ----------------------------------------------------------------
-        if body == 'CL': return None   # lunar sync — ignored
-        if body == 'CM': return self._do_sync()
-
-        # ----------------------------------------------------------------
-        # Fan / heater :f (lowercase)
-        # ----------------------------------------------------------------
-        if body in ('f+', 'f-', 'fp+', 'fp-'): return None
-        if body == 'fT': return '+20.000#'
-        if body == 'fC': return '+18.000#'
-        if body.startswith('fH'): return None
-
-        # ----------------------------------------------------------------
-        # Focuser :F (uppercase)
-        # ----------------------------------------------------------------
-        if body == 'F+':  self.focuser_moving = True;  return None
-        if body == 'F-':  self.focuser_moving = True;  return None
-        if body == 'FQ':  self.focuser_moving = False; return None
-        if body == 'FB':  return '1' if self.focuser_moving else '0'
-        if body == 'FF':  self.focuser_speed = 4; return None
-        if body == 'FS':  self.focuser_speed = 1; return None
-        if body == 'Fp':  return f'{self.focuser_position}#'
-        if body.startswith('FC'): return None
-        if body.startswith('FL'): return None
-        if body.startswith('FP'): return None
-        if len(body) == 2 and body[0] == 'F' and body[1].isdigit():
-            self.focuser_speed = int(body[1]); return None
-
-        # ----------------------------------------------------------------
-        # GPS :g (lowercase)
-        # ----------------------------------------------------------------
-        if body == 'g+':  self.gps_enabled = True;  return None  # type: ignore[attr-defined]
-        if body == 'g-':  self.gps_enabled = False; return None  # type: ignore[attr-defined]
-        if body == 'gT':  return '1'
-        if body == 'gps': return '$GPGGA,000000.00,0000.0000,N,00000.0000,W,0,00,,0.0,M,,,,0000*00#'
-
-        # ----------------------------------------------------------------
-        # Get telescope info :G
-        # ----------------------------------------------------------------
-        if body.startswith('G'):
-            return self._cmd_get(body[1:])
-
-        # ----------------------------------------------------------------
-        # Home commands :h (lowercase)
-        # ----------------------------------------------------------------
-        if body.startswith('h'):
-            return self._cmd_home(body[1:])
-
-        # ----------------------------------------------------------------
-        # Object library :L
-        # ----------------------------------------------------------------
-        if body.startswith('L'):
-            return self._cmd_library(body[1:])
-
-        # ----------------------------------------------------------------
-        # Movement :M
-        # ----------------------------------------------------------------
-        if body.startswith('M'):
-            return self._cmd_move(body[1:])
-
-        # ----------------------------------------------------------------
-        # Smart drive :$Q
-        # ----------------------------------------------------------------
-        if body.startswith('$Q'):
-            return self._cmd_smart_drive(body[2:])
-
-        # ----------------------------------------------------------------
-        # Halt :Q
-        # ----------------------------------------------------------------
-        if body.startswith('Q'):
-            return self._cmd_halt(body[1:])
-
-        # ----------------------------------------------------------------
-        # Field derotator :r (lowercase) — accept, no response
-        # ----------------------------------------------------------------
-        if body.startswith('r'):
-            return None
-
-        # ----------------------------------------------------------------
-        # Slew rate :R
-        # ----------------------------------------------------------------
-        if body.startswith('R'):
-            return self._cmd_slew_rate(body[1:])
-
-        # ----------------------------------------------------------------
-        # Set commands :S
-        # ----------------------------------------------------------------
-        if body.startswith('S'):
-            return self._cmd_set(body[1:])
-
-        # ----------------------------------------------------------------
-        # Tracking :T
-        # ----------------------------------------------------------------
-        if body.startswith('T'):
-            return self._cmd_tracking(body[1:])
-
-        # ----------------------------------------------------------------
-        # PEC readout :V
-        # ----------------------------------------------------------------
-        if body.startswith('VD') or body.startswith('VR'):
+        if len(sub) == 1 and sub.isdigit():
+            self.reticule_flash_rate = int(sub); return None
+        return UNKNOWN
+
+    def _cmd_fan(self, sub: str):
+        if sub.startswith('H'): return None
+        return UNKNOWN
+
+    def _cmd_focuser(self, sub: str):
+        if sub.startswith(('C', 'L', 'P')): return None
+        if len(sub) == 1 and sub.isdigit():
+            self.focuser_speed = int(sub); return None
+        return UNKNOWN
+
+    def _cmd_pec_readout(self, sub: str):
+        if sub.startswith(('D', 'R')):
             return '1.0000'
+        return UNKNOWN
 
-        # ----------------------------------------------------------------
-        # Site select :W
-        # ----------------------------------------------------------------
-        if len(body) == 2 and body[0] == 'W' and body[1].isdigit():
-            n = int(body[1]) - 1
+    def _cmd_site_select(self, sub: str):
+        if len(sub) == 1 and sub.isdigit():
+            n = int(sub) - 1
             if 0 <= n <= 3:
                 self.current_site = n
             return None
+        return UNKNOWN
 
-        # ----------------------------------------------------------------
-        # Help text :?
-        # ----------------------------------------------------------------
-        if body.startswith('?'):
-            return 'No help available#'
-
-        # ----------------------------------------------------------------
-        # Handset display :E
-        # ----------------------------------------------------------------
-        if body.startswith('E'):
-            return self._cmd_handset(body[1:])
+    # =======================================================================
+    # :G — get telescope information
+    # =======================================================================
 
-        plog(f'Unknown command body: [{body}]')
+    def _cmd_get(self, sub: str) -> str | None:
+        getter = self._GET_COMMANDS.get(sub)
+        if getter is not None:
+            return getter(self)
+        plog(':G unknown sub [%s]', sub, category='commands')
         return self.nack()
 
+    # --- Time / date ---
+
+    def _get_local_time_12h(self) -> str:             # :Ga
+        lt = self._local_now()
+        h  = lt.hour % 12 or 12
+        return f'{h:02d}:{lt.minute:02d}:{lt.second:02d}#'
+
+    def _get_utc_offset(self) -> str:                 # :GG
+        sign = '+' if self.utc_offset >= 0 else ''
+        return f'{sign}{int(self.utc_offset)}#'
+
+    def _get_longitude(self) -> str:                  # :Gg  sDDD*MM
+        lon  = self.site_longitude
+        sign = '+' if lon >= 0 else '-'
+        d    = int(abs(lon))
+        m    = int((abs(lon) - d) * 60.0)
+        return f'{sign}{d:03d}*{m:02d}#'
+
+    def _get_sidereal_time(self) -> str:              # :GS
+        lst = self._lst()
+        h   = int(lst)
+        mf  = (lst - h) * 60.0
+        mn  = int(mf)
+        sc  = int((mf - mn) * 60.0)
+        return f'{h:02d}:{mn:02d}:{sc:02d}#'
+
+    def _get_latitude(self) -> str:                   # :Gt  sDD*MM
+        lat  = self.site_latitude
+        sign = '+' if lat >= 0 else '-'
+        d    = int(abs(lat))
+        m    = int((abs(lat) - d) * 60.0)
+        return f'{sign}{d:02d}*{m:02d}#'
+
+    # --- Coordinates ---
+
+    def _get_altitude(self) -> str:                   # :GA
+        alt, _ = self._altaz()
+        return self._fmt_alt(alt)
+
+    def _get_azimuth(self) -> str:                    # :GZ
+        _, az = self._altaz()
+        return self._fmt_az(az)
+
+    # --- Scope status ---
+
+    def _get_status(self) -> str:                     # :GW
+        tracking = 'T' if self.tracking else 'N'
+        return f'{self.mount_mode}{tracking}{self.alignment_stars}#'
+
+    # --- Meridian distance ---
+
+    def _get_meridian_distance(self) -> str:          # :Gm
+        lst  = self._lst()
+        dist = (lst - self.ra) % 24.0
+        if dist > 12.0:
+            dist -= 24.0
+        sign = '+' if dist >= 0 else '-'
+        d    = int(abs(dist) * 15.0)
+        return f'{sign}{d:02d}*00#'
+
     # =======================================================================
-    # :G — get telescope information
+    # :S — set telescope parameters
     # =======================================================================
 
-    def _cmd_get(self, sub: str) -> str | None:
+    def _cmd_set(self, sub: str) -> str | None:
+        for pattern, setter in self._SET_COMMANDS.get(sub[:1], ()):
+            m = pattern.match(sub)
+            if m:
+                return setter(self, m)
+        plog(':S unknown sub [%s]', sub, category='commands')
+        return self.nack()
 
-        # --- Alignment menu entries ---
-        if sub in ('0', '1', '2'):
-            return '#'
-
-        # --- Time / date ---
-        if sub == 'a':   # local time 12-hour
-            lt = self._local_now()
-            h  = lt.hour % 12 or 12
-            return f'{h:02d}:{lt.minute:02d}:{lt.second:02d}#'
-
-        if sub == 'C':   # calendar date
-            return self._local_now().strftime('%m/%d/%y') + '#'
-
-        if sub == 'c':   # clock format
-            return '24#' if self.time_format_24h else '12#'
-
-        if sub == 'G':   # UTC offset
-            sign = '+' if self.utc_offset >= 0 else ''
-            return f'{sign}{int(self.utc_offset)}#'
-
-        if sub == 'g':   # site longitude sDDD*MM
-            lon  = self.site_longitude
-            sign = '+' if lon >= 0 else '-'
-            d    = int(abs(lon))
-            m    = int((abs(lon) - d) * 60.0)
-            return f'{sign}{d:03d}*{m:02d}#'
-
-        if sub == 'H':   # DST
-            return '1#' if self.dst else '0#'
-
-        if sub == 'h':   # high limit
-            return f'+{self.high_limit:02d}*#'
-
-        if sub == 'L':   # local time 24-hour
-            return self._local_now().strftime('%H:%M:%S') + '#'
-
-        if sub == 'o':   # lower limit
-            return f'{self.low_limit:02d}*#'
-
-        if sub == 'S':   # sidereal time
-            lst = self._lst()
-            h   = int(lst)
-            mf  = (lst - h) * 60.0
-            mn  = int(mf)
-            sc  = int((mf - mn) * 60.0)
-            return f'{h:02d}:{mn:02d}:{sc:02d}#'
-
-        if sub == 't':   # site latitude sDD*MM
-            lat  = self.site_latitude
-            sign = '+' if lat >= 0 else '-'
-            d    = int(abs(lat))
-            m    = int((abs(lat) - d) * 60.0)
-            return f'{sign}{d:02d}*{m:02d}#'
-
-        if sub == 'T':   # tracking rate Hz
-            return f'{self.tracking_rate_hz:.1f}#'
-
-        # --- Coordinates ---
-        if sub == 'A':                       # telescope altitude
-            alt, _ = self._altaz()
-            return self._fmt_alt(alt)
+    def _set_target_alt(self, m) -> str:              # :Sa sDD*MM
+        val = parse_dec(m.group(1))
+        if val is not None:
+            ra, dec = altaz_to_radec(
+                val, 0.0,
+                self.site_latitude, self.site_longitude, self._utc_now())
+            self.target_ra  = ra
+            self.target_dec = dec
+            return '1' if self.low_limit <= val <= self.high_limit else '0'
+        return '0'
 
-        if sub == 'D':                       # telescope Dec
-            return self._fmt_dec(self.dec)
+    def _set_brighter_limit(self, m) -> str:          # :Sb sMM.M
+        self.brighter_limit = float(m.group(1)); return '0'
 
-        if sub == 'd':                       # target Dec
-            return self._fmt_dec(self.target_dec)
+    def _set_target_dec(self, m) -> str:              # :Sd sDD*MM[:SS]
+        val = parse_dec(m.group(1))
+        if val is not None and -90.0 <= val <= 90.0:
+            self.target_dec = val; return '1'
+        return '0'
 
-        if sub == 'R':                       # telescope RA
-            return self._fmt_ra(self.ra)
+    def _set_field_diameter(self, m) -> str:          # :SF NNN
+        d = int(m.group(1))
+        self.find_field_diameter = d
+        return '1' if 1 <= d <= 999 else '0'
 
-        if sub == 'r':                       # target RA
-            return self._fmt_ra(self.target_ra)
+    def _set_fainter_limit(self, m) -> str:           # :Sf sMM.M
+        self.fainter_limit = float(m.group(1)); return '1'
 
-        if sub == 'Z':                       # telescope azimuth
-            _, az = self._altaz()
-            return self._fmt_az(az)
+    def _set_longitude(self, m) -> str:               # :Sg DDD*MM
+        val = parse_dec(m.group(1))
+        if val is not None:
+            self.site_longitude = val; return '1'
+        return '0'
 
-        # --- Scope status ---
-        if sub == 'W':
-            tracking = 'T' if self.tracking else 'N'
-            return f'{self.mount_mode}{tracking}{self.alignment_stars}#'
-
-        # --- Firmware ---
-        if sub == 'VD':
-            return datetime.datetime.now().strftime('%b %d %Y') + '#'
-        if sub == 'VN': return f'{self.firmware_version}#'
-        if sub == 'VO': return '0#'
-        if sub == 'VP': return f'{self.product_name}#'
-        if sub == 'VT':
-            return datetime.datetime.now().strftime('%H:%M:%S') + '#'
-
-        # --- Find / browse limits ---
-        if sub == 'b':  return f'+{self.brighter_limit:.1f}#'
-        if sub == 'F':  return f'{self.find_field_diameter:03d}#'
-        if sub == 'f':  return f'+{self.fainter_limit:.1f}#'
-        if sub == 'l':  return f"{self.larger_limit:03d}'#"
-        if sub == 's':  return f"{self.smaller_limit:03d}'#"
-        if sub == 'q':  return f'{self.quality}#'
-        if sub == 'y':  return f'{self.object_filter}#'
-
-        # --- Site names ---
-        if sub == 'M':  return f'{self.site_names[0]}#'
-        if sub == 'N':  return f'{self.site_names[1]}#'
-        if sub == 'O':  return f'{self.site_names[2]}#'
-        if sub == 'P':  return f'{self.site_names[3]}#'
-
-        # --- Backlash ---
-        if sub == 'pB': return f'{self.backlash_az} {self.backlash_alt}#'
-        if sub == 'pH': return '00#'
-        if sub == 'pS': return '000#'
-
-        # --- Meridian distance ---
-        if sub == 'm':
-            lst  = self._lst()
-            dist = (lst - self.ra) % 24.0
-            if dist > 12.0:
-                dist -= 24.0
-            sign = '+' if dist >= 0 else '-'
-            d    = int(abs(dist) * 15.0)
-            return f'{sign}{d:02d}*00#'
-
-        # --- Selenographic (Moon) — not tracking Moon ---
-        if sub == 'E':  return '+99*99#'
-        if sub == 'e':  return '+999*99#'
-
-        plog(f':G unknown sub [{sub}]')
-        return self.nack()
+    def _set_utc_offset(self, m) -> str:              # :SG sHH.H
+        self.utc_offset = float(m.group(1)); return '1'
 
-    # =======================================================================
-    # :S — set telescope parameters
-    # =======================================================================
+    def _set_dst(self, m) -> None:                    # :SH D
+        self.dst = m.group(1) == '1'
 
-    def _cmd_set(self, sub: str) -> str | None:
+    def _set_high_limit(self, m) -> str:              # :Sh DD
+        self.high_limit = int(m.group(1)); return '1'
 
-        # :Sa sDD*MM[#]  — target altitude
-        m = re.match(r'^a([+-]\d+[*:]\d+(?:[:\x27]\d+)?)$', sub)
-        if m:
-            val = parse_dec(m.group(1))
-            if val is not None:
-                ra, dec = altaz_to_radec(
-                    val, 0.0,
-                    self.site_latitude, self.site_longitude, self._utc_now())
-                self.target_ra  = ra
-                self.target_dec = dec
-                return '1' if self.low_limit <= val <= self.high_limit else '0'
-            return '0'
-
-        # :Sb sMM.M  — brighter magnitude limit
-        m = re.match(r'^b([+-]?\d+\.?\d*)$', sub)
-        if m:
-            self.brighter_limit = float(m.group(1)); return '0'
-
-        # :SB n  — baud rate (no-op on TCP)
-        if len(sub) == 2 and sub[0] == 'B' and sub[1].isdigit():
-            return '1'
+    def _set_smaller_limit(self, m) -> str:           # :Sl NNN
+        self.smaller_limit = int(m.group(1)); return '1'
 
-        # :SC MM/DD/YY  — set date
-        m = re.match(r'^C(\d{2}/\d{2}/\d{2})$', sub)
-        if m:
-            return '1Updating Planetary Data#\r #'
-
-        # :Sd sDD*MM[:SS]  — target Dec
-        m = re.match(r'^d([+-]?\d+[*:]\d+(?:[:\x27]\d+)?)$', sub)
-        if m:
-            val = parse_dec(m.group(1))
-            if val is not None and -90.0 <= val <= 90.0:
-                self.target_dec = val; return '1'
-            return '0'
-
-        # :SF NNN  — find field diameter
-        m = re.match(r'^F(\d+)$', sub)
-        if m:
-            d = int(m.group(1))
-            self.find_field_diameter = d
-            return '1' if 1 <= d <= 999 else '0'
-
-        # :Sf sMM.M  — faint magnitude limit
-        m = re.match(r'^f([+-]?\d+\.?\d*)$', sub)
-        if m:
-            self.fainter_limit = float(m.group(1)); return '1'
-
-        # :Sg DDD*MM  — site longitude
-        m = re.match(r'^g(\d+\*\d+)$', sub)
-        if m:
-            val = parse_dec(m.group(1))
-            if val is not None:
-                self.site_longitude = val; return '1'
-            return '0'
-
-        # :SG sHH.H  — UTC offset
-        m = re.match(r'^G([+-]?\d+\.?\d*)$', sub)
-        if m:
-            self.utc_offset = float(m.group(1)); return '1'
-
-        # :SH D  — DST on/off
-        m = re.match(r'^H([01])$', sub)
-        if m:
-            self.dst = m.group(1) == '1'; return None
-
-        # :Sh DD  — high limit
-        m = re.match(r'^h(\d+)$', sub)
-        if m:
-            self.high_limit = int(m.group(1)); return '1'
-
-        # :Sl NNN  — smaller size limit
-        m = re.match(r'^l(\d+)$', sub)
-        if m:
-            self.smaller_limit = int(m.group(1)); return '1'
-
-        # :SL HH:MM:SS  — set local time (accepted but we use system time)
-        m = re.match(r'^L\d{2}:\d{2}:\d{2}$', sub)
-        if m:
-            return '1'
+    def _set_smart_mount(self, enabled: bool) -> None:   # :Sm+ :Sm-
+        self.smart_mount_enabled = enabled
 
-        # :Sm+/-  — smart-mount flexure
-        if sub == 'm+': self.smart_mount_enabled = True;  return None
-        if sub == 'm-': self.smart_mount_enabled = False; return None
+    def _set_site_name(self, m) -> str:               # :SM/:SN/:SO/:SP <string>
+        idx = 'MNOP'.index(m.group(1))
+        self.site_names[idx] = m.group(2)[:15]
+        return '1'
 
-        # :SM/:SN/:SO/:SP <string>  — site names
-        m = re.match(r'^([MNOP])(.+)$', sub)
-        if m:
-            idx = 'MNOP'.index(m.group(1))
-            self.site_names[idx] = m.group(2)[:15]
-            return '1'
+    def _set_low_limit(self, m) -> str:               # :So DD*
+        self.low_limit = int(m.group(1)); return '1'
 
-        # :So DD*  — lower limit
-        m = re.match(r'^o(\d+)\*?$', sub)
-        if m:
-            self.low_limit = int(m.group(1)); return '1'
+    def _set_backlash(self, m) -> str:                # :SpB num num
+        self.backlash_az  = int(m.group(1))
+        self.backlash_alt = int(m.group(2))
+        return '1'
 
-        # :SpB num num  — backlash values
-        m = re.match(r'^pB(\d+) (\d+)$', sub)
-        if m:
-            self.backlash_az  = int(m.group(1))
-            self.backlash_alt = int(m.group(2))
-            return '1'
+    def _step_quality(self, m) -> None:               # :Sq
+        cycle = ['VP', 'PR', 'FR', 'GD', 'VG', 'EX', 'SU']
+        idx   = cycle.index(self.quality) if self.quality in cycle else 3
+        self.quality = cycle[(idx + 1) % len(cycle)]
 
-        # :Sq  — step quality limit
-        if sub == 'q':
-            cycle = ['VP', 'PR', 'FR', 'GD', 'VG', 'EX', 'SU']
-            idx   = cycle.index(self.quality) if self.quality in cycle else 3
-            self.quality = cycle[(idx + 1) % len(cycle)]
-            return None
+    def _set_target_ra(self, m) -> str:               # :Sr HH:MM:SS or HH:MM.T
+        val = parse_ra(m.group(1))
+        if val is not None and 0.0 <= val < 24.0:
+            self.target_ra = val; return '1'
+        return '0'
 
-        # :Sr HH:MM:SS or HH:MM.T  — target RA
-        m = re.match(r'^r(.+)$', sub)
-        if m:
-            val = parse_ra(m.group(1))
-            if val is not None and 0.0 <= val < 24.0:
-                self.target_ra = val; return '1'
-            return '0'
-
-        # :Ss NNN  — larger size limit
-        m = re.match(r'^s(\d+)$', sub)
-        if m:
-            self.larger_limit = int(m.group(1)); return '1'
-
-        # :SS HH:MM:SS  — set sidereal time (accepted)
-        m = re.match(r'^S\d{2}:\d{2}:\d{2}$', sub)
-        if m:
-            return '1'
+    def _set_larger_limit(self, m) -> str:            # :Ss NNN
+        self.larger_limit = int(m.group(1)); return '1'
 
-        # :St sDD*MM  — site latitude
-        m = re.match(r'^t([+-]?\d+\*\d+)$', sub)
-        if m:
-            val = parse_dec(m.group(1))
-            if val is not None and -90.0 <= val <= 90.0:
-                self.site_latitude = val; return '1'
-            return '0'
-
-        # :ST dddd.ddd  — tracking rate Hz (Autostar II)
-        m = re.match(r'^T(\d+\.?\d*)$', sub)
-        if m:
-            self.tracking_rate_hz = float(m.group(1)); return '2'
-
-        # :ST+/-  — inc/dec tracking rate
-        if sub == 'T+': self.tracking_rate_hz += 0.1; return None
-        if sub == 'T-': self.tracking_rate_hz -= 0.1; return None
-
-        # PEC via :S prefix
-        if sub == 'TA+': self.pec_dec_enabled = True;  return None
-        if sub == 'TA-': self.pec_dec_enabled = False; return None
-        if sub == 'TZ+': self.pec_ra_enabled  = True;  return None
-        if sub == 'TZ-': self.pec_ra_enabled  = False; return None
-
-        # :Sw N  — max slew rate
-        m = re.match(r'^w(\d)$', sub)
-        if m:
-            n = int(m.group(1))
-            if 2 <= n <= 8:
-                self.max_slew_rate = n; return '1'
-            return '0'
-
-        # :Sy GPDCO  — object filter string
-        m = re.match(r'^y([GPDCOgpdco]{5})$', sub)
-        if m:
-            self.object_filter = m.group(1); return '1'
-
-        # :Sz DDD*MM  — target azimuth
-        m = re.match(r'^z(\d+\*\d+)$', sub)
-        if m:
-            val = parse_dec(m.group(1))
-            if val is not None:
-                alt, _ = self._altaz()
-                ra, dec = altaz_to_radec(
-                    alt, val,
-                    self.site_latitude, self.site_longitude, self._utc_now())
-                self.target_ra  = ra
-                self.target_dec = dec
-                return '1'
-            return '0'
-
-        plog(f':S unknown sub [{sub}]')
-        return self.nack()
+    def _set_latitude(self, m) -> str:                # :St sDD*MM
+        val = parse_dec(m.group(1))
+        if val is not None and -90.0 <= val <= 90.0:
+            self.site_latitude = val; return '1'
+        return '0'
+
+    def _set_tracking_rate(self, m) -> str:           # :ST dddd.ddd (Autostar II)
+        self.tracking_rate_hz = float(m.group(1)); return '2'
+
+    def _step_tracking_rate(self, delta: float) -> None:   # :ST+ :ST-
+        self.tracking_rate_hz += delta
+
+    def _set_pec(self, axis: str, enabled: bool) -> None:  # :STA+/- :STZ+/-
+        if axis == 'A':
+            self.pec_dec_enabled = enabled
+        else:
+            self.pec_ra_enabled = enabled
+
+    def _set_max_slew_rate(self, m) -> str:           # :Sw N
+        n = int(m.group(1))
+        if 2 <= n <= 8:
+            self.max_slew_rate = n; return '1'
+        return '0'
+
+    def _set_object_filter(self, m) -> str:           # :Sy GPDCO
+        self.object_filter = m.group(1); return '1'
+
+    def _set_target_az(self, m) -> str:               # :Sz DDD*MM
+        val = parse_dec(m.group(1))
+        if val is not None:
+            alt, _ = self._altaz()
+            ra, dec = altaz_to_radec(
+                alt, val,
+                self.site_latitude, self.site_longitude, self._utc_now())
+            self.target_ra  = ra
+            self.target_dec = dec
+            return '1'
+        return '0'
 
     # =======================================================================
     # :M — movement
     # =======================================================================
 
+    _GUIDE_PULSE = re.compile(r'g[nsew]\d+')   # :Mgn/s/e/wDDDD#
+
     def _cmd_move(self, sub: str) -> str | None:
-        if sub == 'n': self.moving_n = True;  return None
-        if sub == 's': self.moving_s = True;  return None
-        if sub == 'e': self.moving_e = True;  return None
-        if sub == 'w': self.moving_w = True;  return None
+        if sub in ('n', 's', 'e', 'w'):
+            self._motion.start_move(sub, self.SLEW_RATE_DEG_S.get(self.slew_rate, 1.0))
+            return None
 
         if sub in ('S', 'A'):               # :MS# or :MA# — slew to target
             return self._do_slew()
 
-        if re.match(r'^g[nsew]\d+$', sub):  # :Mgn/s/e/wDDDD# — guide pulse
+        if self._GUIDE_PULSE.fullmatch(sub):  # guide pulse
             return None
 
         if sub.startswith('gS'):             # :MgS<x># — StarLock
@@ -1159,12 +1550,11 @@ class TelescopeStateMachine:
         if alt > self.high_limit:
             return '2Object above high limit  #'
         self._set_display('Slewing...')
-        self.slewing = True
-        with self._slew_lock:
-            if self._slew_thread is None or not self._slew_thread.is_alive():
-                self._slew_thread = threading.Thread(
-                    target=self._slew_to_target, daemon=True, name='slew')
-                self._slew_thread.start()
+        rate = min(
+            self.SLEW_RATE_DEG_S.get(self.slew_rate, 4.0),
+            float(self.max_slew_rate))
+        self._motion.slew_to(self.target_ra, self.target_dec, rate,
+                             on_done=self._slew_complete)
         return '0'
 
     # =======================================================================
@@ -1172,34 +1562,29 @@ class TelescopeStateMachine:
     # =======================================================================
 
     def _cmd_halt(self, sub: str) -> None:
-        if sub in ('', 'e', 'w', 'n', 's', '#'):
-            if sub in ('', '#'):
-                self.moving_n = self.moving_s = False
-                self.moving_e = self.moving_w = False
-                self.slewing  = False
-            elif sub == 'n': self.moving_n = False
-            elif sub == 's': self.moving_s = False
-            elif sub == 'e': self.moving_e = False
-            elif sub == 'w': self.moving_w = False
+        if sub in ('', '#'):
+            self._motion.stop()              # all directions and any slew
+        elif sub in ('e', 'w', 'n', 's'):
+            self._motion.stop(sub)
         return None
 
     # =======================================================================
     # :R — slew rate
     # =======================================================================
 
+    # :RA DD.D#, :RE DD.D#, :Rg SS.S# — custom RA/Dec rates and guide rate
+    _RATE_ATTRS = {'A': 'custom_ra_rate', 'E': 'custom_dec_rate', 'g': 'guide_rate_arcsec'}
+    _RATE_VALUE = re.compile(r'\d+\.?\d*')
+
     def _cmd_slew_rate(self, sub: str) -> None:
-        if sub == 'G': self.slew_rate = 'G'; return None
-        if sub == 'C': self.slew_rate = 'C'; return None
-        if sub == 'M': self.slew_rate = 'M'; return None
-        if sub == 'S': self.slew_rate = 'S'; return None
-
-        m = re.match(r'^A(\d+\.?\d*)$', sub)   # :RA DD.D#
-        if m: self.custom_ra_rate  = float(m.group(1)); return None
-        m = re.match(r'^E(\d+\.?\d*)$', sub)   # :RE DD.D#
-        if m: self.custom_dec_rate = float(m.group(1)); return None
-        m = re.match(r'^g(\d+\.?\d*)$', sub)   # :Rg SS.S#
-        if m: self.guide_rate_arcsec = float(m.group(1)); return None
+        if sub in ('G', 'C', 'M', 'S'):
+            self.slew_rate = sub
+            self._motion.set_move_rate(self.SLEW_RATE_DEG_S[sub])
+            return None
 
+        attr = self._RATE_ATTRS.get(sub[:1])
+        if attr is not None and self._RATE_VALUE.fullmatch(sub, 1):
+            setattr(self, attr, float(sub[1:]))
         return None
 
     # =======================================================================
@@ -1222,7 +1607,7 @@ class TelescopeStateMachine:
     def _cmd_home(self, sub: str) -> str | None:
         if sub == 'C':
             self.home_status = 2
-            threading.Timer(2.0, lambda: setattr(self, 'home_status', 1)).start()
+            self._motion.schedule(2.0, self._home_complete)
             return None
         if sub == 'F': return None
         if sub.startswith('I') and len(sub) >= 13: return '1'
@@ -1237,6 +1622,7 @@ class TelescopeStateMachine:
             self._set_display('Waking up...')
             return None
         if sub == '?':
+            self._motion.poll()               # fire a due home completion
             return str(self.home_status)
         return None
 
@@ -1281,11 +1667,10 @@ class TelescopeStateMachine:
     # =======================================================================
 
     def _do_sync(self) -> str:
-        self.ra  = self.target_ra
-        self.dec = self.target_dec
+        self._motion.set_position(self.target_ra, self.target_dec)
         self.alignment_stars = min(3, self.alignment_stars + 1)
         self._set_display('Sync complete')
-        plog(f'Sync  RA={self.ra:.4f}h  Dec={self.dec:.4f}°')
+        plog('Sync  RA=%.4fh  Dec=%.4f°', self.ra, self.dec, category='motion')
         return 'Coordinates     matched.       #'
 
     # =======================================================================
@@ -1377,14 +1762,206 @@ class TelescopeStateMachine:
         idx    = fields.index(item) if item in fields else 0
         return fields[(idx + 1) % len(fields)]
 
+    # =======================================================================
+    # Dispatch tables (built once, at class creation)
+    # =======================================================================
+
+    # :<body> matched exactly, checked before the families
+    _EXACT_COMMANDS = {
+        'H':   _toggle_time_format,
+        'I':   lambda self: self._set_display('Initializing...'),
+        'P':   _toggle_precision_verbose,
+        'U':   _toggle_precision,
+        'D':   lambda self: '|#' if self.slewing else '#',
+        # Alignment :A
+        'Aa':  lambda self: self._do_auto_align(),
+        'AL':  lambda self: self._set_alignment('L', False),
+        'AP':  lambda self: self._set_alignment('P', True),
+        'AA':  lambda self: self._set_alignment('A', True),
+        # Reticule :B
+        'B+':  lambda self: self._step_reticule(+1),
+        'B-':  lambda self: self._step_reticule(-1),
+        # Sync :C
+        'CL':  lambda self: None,   # lunar sync — ignored
+        'CM':  lambda self: self._do_sync(),
+        # Fan / heater :f (lowercase)
+        'f+':  lambda self: None,
+        'f-':  lambda self: None,
+        'fp+': lambda self: None,
+        'fp-': lambda self: None,
+        'fT':  lambda self: '+20.000#',
+        'fC':  lambda self: '+18.000#',
+        # Focuser :F (uppercase)
+        'F+':  lambda self: self._set_focuser_moving(True),
+        'F-':  lambda self: self._set_focuser_moving(True),
+        'FQ':  lambda self: self._set_focuser_moving(False),
+        'FB':  lambda self: '1' if self.focuser_moving else '0',
+        'FF':  lambda self: self._set_focuser_speed(4),
+        'FS':  lambda self: self._set_focuser_speed(1),
+        'Fp':  lambda self: f'{self.focuser_position}#',
+        # GPS :g (lowercase)
+        'g+':  lambda self: self._set_gps(True),
+        'g-':  lambda self: self._set_gps(False),
+        'gT':  lambda self: '1',
+        'gps': lambda self: '$GPGGA,000000.00,0000.0000,N,00000.0000,W,0,00,,0.0,M,,,,0000*00#',
+    }
+
+    # first character of the body → handler(self, rest of body)
+    _COMMAND_FAMILIES = {
+        '$': _cmd_dollar,                    # :$B backlash, :$Q smart drive
+        'B': _cmd_reticule,                  # :BD, :B<n>
+        'f': _cmd_fan,                       # :fH
+        'F': _cmd_focuser,                   # :FC/:FL/:FP, :F<n>
+        'G': _cmd_get,
+        'h': _cmd_home,
+        'L': _cmd_library,
+        'M': _cmd_move,
+        'Q': _cmd_halt,
+        'r': lambda self, sub: None,         # field derotator — accept, no response
+        'R': _cmd_slew_rate,
+        'S': _cmd_set,
+        'T': _cmd_tracking,
+        'V': _cmd_pec_readout,               # :VD, :VR
+        'W': _cmd_site_select,               # :W<n>
+        '?': lambda self, sub: 'No help available#',
+        'E': _cmd_handset,
+    }
+
+    # :G<sub> → getter(self)
+    _GET_COMMANDS = {
+        # Alignment menu entries
+        '0':  lambda self: '#',
+        '1':  lambda self: '#',
+        '2':  lambda self: '#',
+        # Time / date
+        'a':  _get_local_time_12h,
+        'C':  lambda self: self._local_now().strftime('%m/%d/%y') + '#',
+        'c':  lambda self: '24#' if self.time_format_24h else '12#',
+        'G':  _get_utc_offset,
+        'g':  _get_longitude,
+        'H':  lambda self: '1#' if self.dst else '0#',
+        'h':  lambda self: f'+{self.high_limit:02d}*#',
+        'L':  lambda self: self._local_now().strftime('%H:%M:%S') + '#',
+        'o':  lambda self: f'{self.low_limit:02d}*#',
+        'S':  _get_sidereal_time,
+        't':  _get_latitude,
+        'T':  lambda self: f'{self.tracking_rate_hz:.1f}#',
+        # Coordinates
+        'A':  _get_altitude,
+        'D':  lambda self: self._fmt_dec(self.dec),
+        'd':  lambda self: self._fmt_dec(self.target_dec),
+        'R':  lambda self: self._fmt_ra(self.ra),
+        'r':  lambda self: self._fmt_ra(self.target_ra),
+        'Z':  _get_azimuth,
+        # Scope status
+        'W':  _get_status,
+        # Firmware
+        'VD': lambda self: datetime.datetime.now().strftime('%b %d %Y') + '#',
+        'VN': lambda self: f'{self.firmware_version}#',
+        'VO': lambda self: '0#',
+        'VP': lambda self: f'{self.product_name}#',
+        'VT': lambda self: datetime.datetime.now().strftime('%H:%M:%S') + '#',
+        # Find / browse limits
+        'b':  lambda self: f'+{self.brighter_limit:.1f}#',
+        'F':  lambda self: f'{self.find_field_diameter:03d}#',
+        'f':  lambda self: f'+{self.fainter_limit:.1f}#',
+        'l':  lambda self: f"{self.larger_limit:03d}'#",
+        's':  lambda self: f"{self.smaller_limit:03d}'#",
+        'q':  lambda self: f'{self.quality}#',
+        'y':  lambda self: f'{self.object_filter}#',
+        # Site names
+        'M':  lambda self: f'{self.site_names[0]}#',
+        'N':  lambda self: f'{self.site_names[1]}#',
+        'O':  lambda self: f'{self.site_names[2]}#',
+        'P':  lambda self: f'{self.site_names[3]}#',
+        # Backlash
+        'pB': lambda self: f'{self.backlash_az} {self.backlash_alt}#',
+        'pH': lambda self: '00#',
+        'pS': lambda self: '000#',
+        # Meridian distance
+        'm':  _get_meridian_distance,
+        # Selenographic (Moon) — not tracking Moon
+        'E':  lambda self: '+99*99#',
+        'e':  lambda self: '+999*99#',
+    }
+
+    # :S<sub>: first character of sub → [(precompiled pattern, setter(self, match))],
+    # tried in order
+    _SET_COMMANDS = {
+        'a': [(re.compile(r'^a([+-]\d+[*:]\d+(?:[:\x27]\d+)?)$'), _set_target_alt)],
+        'b': [(re.compile(r'^b([+-]?\d+\.?\d*)$'), _set_brighter_limit)],
+        'B': [(re.compile(r'^B\d$'), lambda self, m: '1')],             # baud rate (no-op on TCP)
+        'C': [(re.compile(r'^C(\d{2}/\d{2}/\d{2})$'),
+               lambda self, m: '1Updating Planetary Data#\r #')],       # set date
+        'd': [(re.compile(r'^d([+-]?\d+[*:]\d+(?:[:\x27]\d+)?)$'), _set_target_dec)],
+        'F': [(re.compile(r'^F(\d+)$'), _set_field_diameter)],
+        'f': [(re.compile(r'^f([+-]?\d+\.?\d*)$'), _set_fainter_limit)],
+        'g': [(re.compile(r'^g(\d+\*\d+)$'), _set_longitude)],
+        'G': [(re.compile(r'^G([+-]?\d+\.?\d*)$'), _set_utc_offset)],
+        'H': [(re.compile(r'^H([01])$'), _set_dst)],
+        'h': [(re.compile(r'^h(\d+)$'), _set_high_limit)],
+        'l': [(re.compile(r'^l(\d+)$'), _set_smaller_limit)],
+        'L': [(re.compile(r'^L\d{2}:\d{2}:\d{2}$'), lambda self, m: '1')],   # local time (system time used)
+        'm': [(re.compile(r'^m\+$'), lambda self, m: self._set_smart_mount(True)),
+              (re.compile(r'^m-$'), lambda self, m: self._set_smart_mount(False))],
+        'M': [(re.compile(r'^([MNOP])(.+)$'), _set_site_name)],
+        'N': [(re.compile(r'^([MNOP])(.+)$'), _set_site_name)],
+        'O': [(re.compile(r'^([MNOP])(.+)$'), _set_site_name)],
+        'P': [(re.compile(r'^([MNOP])(.+)$'), _set_site_name)],
+        'o': [(re.compile(r'^o(\d+)\*?$'), _set_low_limit)],
+        'p': [(re.compile(r'^pB(\d+) (\d+)$'), _set_backlash)],
+        'q': [(re.compile(r'^q$'), _step_quality)],
+        'r': [(re.compile(r'^r(.+)$'), _set_target_ra)],
+        's': [(re.compile(r'^s(\d+)$'), _set_larger_limit)],
+        'S': [(re.compile(r'^S\d{2}:\d{2}:\d{2}$'), lambda self, m: '1')],   # sidereal time (accepted)
+        't': [(re.compile(r'^t([+-]?\d+\*\d+)$'), _set_latitude)],
+        'T': [(re.compile(r'^T(\d+\.?\d*)$'), _set_tracking_rate),
+              (re.compile(r'^T\+$'), lambda self, m: self._step_tracking_rate(+0.1)),
+              (re.compile(r'^T-$'), lambda self, m: self._step_tracking_rate(-0.1)),
+              # PEC via :S prefix
+              (re.compile(r'^T([AZ])([+-])$'), lambda self, m: self._set_pec(m.group(1), m.group(2) == '+'))],
+        'w': [(re.compile(r'^w(\d)$'), _set_max_slew_rate)],
+        'y': [(re.compile(r'^y([GPDCOgpdco]{5})$'), _set_object_filter)],
+        'z': [(re.compile(r'^z(\d+\*\d+)$'), _set_target_az)],
+    }
+
 
 # ===========================================================================
 # Network server
 # ===========================================================================
 
+def extract_commands(recv_buf: str) -> tuple:
+    """
+    Split every '#'-terminated token off recv_buf.
+    Returns (commands, remainder); commands are ready for process_command
+    (leading ':' kept, '#' stripped; the ACK byte passed as '\\x06').
+    """
+    commands = []
+    while '#' in recv_buf:
+        token, recv_buf = recv_buf.split('#', 1)
+        token = token.strip()
+        if not token:
+            continue
+
+        # Handle ACK byte separately (no leading ':')
+        if token == '\x06':
+            commands.append('\x06')
+            continue
+
+        if token.startswith(':'):
+            commands.append(token)
+    return commands, recv_buf
+
+
 def listen_and_process(client_socket: socket.socket,
-                        state_machine: TelescopeStateMachine):
-    """Receive commands from one client, dispatch, send responses."""
+                        state_machine: TelescopeStateMachine,
+                        serial_chunk: int = 0):
+    """
+    Receive commands from one client, dispatch, send responses.
+    Legacy blocking loop (one client, 50 ms pause per cycle); see serve_clients.
+    Pending replies go out in one gather write; serial_chunk > 0 sends them
+    serial_chunk bytes per sendall instead, as the original loop did.
+    """
     show_response = True
     recv_buf      = ''
 
@@ -1407,54 +1984,256 @@ def listen_and_process(client_socket: socket.socket,
         else:
             if recv_buf.strip():
                 show_response = True
-                plog(f'RX [{recv_buf.strip()}]')
+                plog('RX [%s]', recv_buf.strip(), category='tx')
 
         # Process every '#'-terminated token in the buffer
-        while '#' in recv_buf:
-            token, recv_buf = recv_buf.split('#', 1)
-            token = token.strip()
-            if not token:
-                continue
-
-            # Handle ACK byte separately (no leading ':')
-            if token == '\x06':
-                state_machine.process_command('\x06')
-                continue
-
-            if token.startswith(':'):
-                state_machine.process_command(token)
+        commands, recv_buf = extract_commands(recv_buf)
+        for cmd in commands:
+            state_machine.process_command(cmd)
 
         # Flush send buffer
-        while state_machine.has_data():
-            chunk = state_machine.pop_from_send_buffer()
-            if show_response:
-                plog(f'TX [{chunk!r}]')
-            try:
-                client_socket.sendall(chunk.encode('latin-1'))
-            except (BrokenPipeError, OSError):
-                plog('Send failed — connection lost')
-                return
+        try:
+            if serial_chunk:
+                while state_machine.has_data():
+                    chunk = state_machine.pop_send_bytes(serial_chunk)
+                    if show_response and LOG.enabled('tx'):
+                        plog('TX [%r]', chunk.decode('latin-1'), category='tx')
+                    client_socket.sendall(chunk)
+            elif state_machine.has_data():
+                parts = state_machine.drain_send_parts()
+                if show_response and LOG.enabled('tx'):
+                    plog('TX [%r]', b''.join(parts).decode('latin-1'), category='tx')
+                send_gather(client_socket, parts)
+        except (BrokenPipeError, OSError):
+            plog('Send failed — connection lost')
+            return
 
         time.sleep(0.05)
 
 
-def emulate_telescope(port: int, mode: str = 'lx200gps'):
+class ClientSession:
+    """
+    One client of a mount shared by many: its own receive buffer and reply queue.
+
+    Commands go through TelescopeStateMachine.handle, which returns the reply
+    rather than appending it to the shared send_buffer, so every reply lands
+    in the queue of the client that sent the command.
+    """
+
+    def __init__(self, state_machine: TelescopeStateMachine):
+        self.state_machine = state_machine
+        self.recv_buf      = ''
+        self.replies       = ReplyQueue()
+        self.show_response = True
+
+    def feed(self, data: bytes) -> int:
+        """Dispatch every complete command in data; returns how many were handled."""
+        self.recv_buf += data.decode('latin-1', errors='replace')
+        # Suppress noisy polling pair (:ED# + :G0#)
+        if self.recv_buf.strip() == ':ED#:G0#':
+            self.show_response = False
+        elif self.recv_buf.strip():
+            self.show_response = True
+            plog('RX [%s]', self.recv_buf.strip(), category='tx')
+
+        commands, self.recv_buf = extract_commands(self.recv_buf)
+        for cmd in commands:
+            reply = self.state_machine.handle(cmd)
+            if reply:
+                self.replies.push(reply.encode('latin-1'))
+        return len(commands)
+
+    def pop_replies(self) -> list:
+        """Everything queued for this client as byte chunks, oldest first."""
+        parts = self.replies.drain()
+        if parts and self.show_response and LOG.enabled('tx'):
+            plog('TX [%r]', b''.join(parts).decode('latin-1'), category='tx')
+        return parts
+
+
+class _Client:
+    """Per-connection state for serve_clients."""
+    __slots__ = ('sock', 'addr', 'session', 'out', 'want_write')
+
+    def __init__(self, sock: socket.socket, addr, state_machine: TelescopeStateMachine):
+        self.sock       = sock
+        self.addr       = addr
+        self.session    = ClientSession(state_machine)
+        self.out        = ReplyQueue()
+        self.want_write = False
+
+
+def serve_clients(server: socket.socket,
+                  state_machine: TelescopeStateMachine,
+                  stop: threading.Event | None = None,
+                  serial_chunk: int = 0):
+    """
+    Readiness-driven server loop: one selector, any number of clients.
+
+    Each readable socket is read, its complete commands are dispatched and the
+    replies are sent straight away — no polling sleep. If the socket cannot
+    take everything, the rest is kept per client and written when the socket
+    becomes writable. Pending chunks go out in one writev; serial_chunk > 0
+    sends at most that many bytes per send() instead.
+    Runs until stop is set (checked at least every 250 ms).
+    """
+    sel = selectors.DefaultSelector()
+    server.setblocking(False)
+    sel.register(server, selectors.EVENT_READ, None)
+    clients = {}
+
+    def close(c: _Client):
+        sel.unregister(c.sock)
+        clients.pop(c.sock, None)
+        c.sock.close()
+        plog(f'Connection closed {c.addr[0]}:{c.addr[1]}')
+
+    def flush(c: _Client):
+        try:
+            while len(c.out):
+                if serial_chunk:
+                    n = c.sock.send(c.out.peek(serial_chunk))
+                elif HAS_SENDMSG:
+                    n = c.sock.sendmsg(c.out.pending()[:1024])   # IOV_MAX
+                else:
+                    n = c.sock.send(c.out.peek())
+                c.out.consume(n)
+        except BlockingIOError:
+            pass
+        except OSError:
+            plog('Send failed — connection lost')
+            close(c)
+            return
+        want_write = bool(c.out)
+        if want_write != c.want_write:
+            c.want_write = want_write
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if want_write else 0)
+            sel.modify(c.sock, events, c)
+
+    def on_readable(c: _Client):
+        try:
+            data = c.sock.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        if not data:
+            plog('Client disconnected')
+            close(c)
+            return
+
+        c.session.feed(data)
+        parts = c.session.pop_replies()
+        if parts:
+            for part in parts:
+                c.out.push(part)
+            flush(c)
+
+    try:
+        while stop is None or not stop.is_set():
+            for key, mask in sel.select(timeout=0.25):
+                c = key.data
+                if c is None:
+                    try:
+                        sock, addr = server.accept()
+                    except BlockingIOError:
+                        continue
+                    sock.setblocking(False)
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    c = _Client(sock, addr, state_machine)
+                    clients[sock] = c
+                    sel.register(sock, selectors.EVENT_READ, c)
+                    plog(f'Client connected from {addr[0]}:{addr[1]}')
+                    continue
+                if mask & selectors.EVENT_WRITE:
+                    flush(c)
+                if mask & selectors.EVENT_READ and c.sock in clients:
+                    on_readable(c)
+    finally:
+        for c in list(clients.values()):
+            close(c)
+        sel.unregister(server)
+        sel.close()
+
+
+def serve_threaded(server: socket.socket,
+                   state_machine: TelescopeStateMachine,
+                   stop: threading.Event | None = None,
+                   serial_chunk: int = 0):
+    """
+    One thread per client, all sharing one mount. Each thread owns a
+    ClientSession, so replies never cross between clients; the mount's
+    locks keep concurrent dispatch and the motion scheduler consistent.
+    Runs until stop is set (checked at least every 250 ms).
+    """
+    def client_thread(sock: socket.socket, addr):
+        session = ClientSession(state_machine)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(0.25)
+        try:
+            while stop is None or not stop.is_set():
+                try:
+                    data = sock.recv(4096)
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                if not data:
+                    plog('Client disconnected')
+                    break
+                session.feed(data)
+                parts = session.pop_replies()
+                if serial_chunk:
+                    data = b''.join(parts)
+                    for i in range(0, len(data), serial_chunk):
+                        sock.sendall(data[i:i + serial_chunk])
+                elif parts:
+                    send_gather(sock, parts)
+        except OSError:
+            plog('Send failed — connection lost')
+        finally:
+            sock.close()
+            plog(f'Connection closed {addr[0]}:{addr[1]}')
+
+    server.settimeout(0.25)
+    while stop is None or not stop.is_set():
+        try:
+            sock, addr = server.accept()
+        except socket.timeout:
+            continue
+        sock.settimeout(None)
+        plog(f'Client connected from {addr[0]}:{addr[1]}')
+        threading.Thread(target=client_thread, args=(sock, addr),
+                         daemon=True, name=f'client-{addr[1]}').start()
+
+
+def emulate_telescope(port: int, mode: str = 'lx200gps', server_mode: str = 'selector',
+                      serial_chunk: int = 0, sky_cache_ms: int = 100,
+                      time_scale: float = 1.0):
     profile       = EMULATOR_PROFILES.get(mode, EMULATOR_PROFILES['lx200gps'])
-    state_machine = TelescopeStateMachine(mode=mode)
+    state_machine = TelescopeStateMachine(mode=mode, sky_cache_ms=sky_cache_ms,
+                                          clock=VirtualClock(time_scale))
 
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server.bind(('0.0.0.0', port))
-    server.listen(1)
+    server.listen(1 if server_mode == 'legacy' else 64)
     plog(f"Emulating: {profile['description']}  "
          f"(product='{profile['product_name']}'  fw={profile['firmware']})")
-    plog(f'Listening on 0.0.0.0:{port}')
+    plog(f'Listening on 0.0.0.0:{port}  ({server_mode} server)')
+
+    if server_mode == 'selector':
+        serve_clients(server, state_machine, serial_chunk=serial_chunk)
+        return
+    if server_mode == 'threaded':
+        serve_threaded(server, state_machine, serial_chunk=serial_chunk)
+        return
 
     while True:
         client, addr = server.accept()
         plog(f'Client connected from {addr[0]}:{addr[1]}')
         try:
-            listen_and_process(client, state_machine)
+            listen_and_process(client, state_machine, serial_chunk)
         finally:
             client.close()
             plog('Connection closed')
@@ -1486,6 +2265,20 @@ def run_tests():
               f'  → RA={ra_r:.4f}h  Dec={dec_r:.4f}°'
               f'  (err {err_ra:.4f}°, {err_dec:.4f}°)')
 
+    print('\n=== Array conversion test ===')
+    ras, decs = [p[0] for p in test_pairs], [p[1] for p in test_pairs]
+    for use_np in ((False, True) if np is not None else (False,)):
+        alts, azs = radec_to_altaz_array(ras, decs, lat, lon, utc, use_numpy=use_np)
+        ras_r, decs_r = altaz_to_radec_array(alts, azs, lat, lon, utc, use_numpy=use_np)
+        err_scalar = max(max(abs(a - e[0]), abs(z - e[1]))
+                         for a, z, e in zip(alts, azs,
+                                            (radec_to_altaz(r, d, lat, lon, utc) for r, d in test_pairs)))
+        err_rt = max(max(min(abs(r2 - r1), abs(r2 - r1 - 24), abs(r2 - r1 + 24)) * 15.0, abs(d2 - d1))
+                     for r1, d1, r2, d2 in zip(ras, decs, ras_r, decs_r))
+        ok = '✓' if err_scalar < 1e-9 and err_rt < 0.01 else '✗'
+        name = 'numpy ' if use_np else 'python'
+        print(f'  {ok}  {name}  vs scalar {err_scalar:.1e}°  round-trip {err_rt:.1e}°')
+
     print('\n=== Format test ===')
     sm = TelescopeStateMachine()
     sm.high_precision = True
@@ -1519,6 +2312,103 @@ def run_tests():
         ok   = '✓' if (expected is None or resp == expected) else '✗'
         print(f'  {ok}  {cmd:20s} → [{resp}]  (expected [{expected}])')
 
+    print('\n=== Sky cache test ===')
+    sm = TelescopeStateMachine(sky_cache_ms=60_000)
+    first = sm._altaz()
+    ok = '✓' if sm._altaz() is first else '✗'
+    print(f'  {ok}  repeated :GA/:GZ reuse one Alt/Az computation')
+    sm.process_command(':St+10*00')
+    moved = sm._altaz()
+    exact = radec_to_altaz(sm.ra, sm.dec, sm.site_latitude, sm.site_longitude, sm._utc_now())
+    ok = '✓' if moved is not first and abs(moved[0] - exact[0]) < 0.01 else '✗'
+    print(f'  {ok}  :St invalidates  (Alt {first[0]:.2f}° → {moved[0]:.2f}°)')
+    sm.process_command(':Sr06:00:00'); sm.process_command(':Sd+10*00'); sm.process_command(':CM')
+    ok = '✓' if sm._altaz() is not moved else '✗'
+    print(f'  {ok}  sync to a new RA/Dec invalidates')
+    sm.sky_cache_ms = 0
+    ok = '✓' if sm._altaz() is not sm._altaz() else '✗'
+    print(f'  {ok}  sky_cache_ms=0 disables caching')
+
+    print('\n=== Motion engine test (manual clock) ===')
+
+    lst = TelescopeStateMachine()._lst()
+    start = (fmt_ra_high(lst)[:-1], fmt_sdms_high(20.0)[:-1])          # ~69° up
+    goal  = (fmt_ra_high(lst + 0.4)[:-1], fmt_sdms_high(28.0)[:-1])
+
+    def poll_track(poll_s: float, duration: float = 12.0):
+        clock = VirtualClock(manual=True)
+        sm = TelescopeStateMachine(clock=clock)
+        for cmd in (':Sr' + start[0], ':Sd' + start[1], ':CM',
+                    ':Sr' + goal[0], ':Sd' + goal[1]):
+            sm.process_command(cmd)
+        start_pos = sm.position()
+        sm.process_command(':MS')
+        t, arrived = 0.0, None
+        while t < duration:
+            clock.advance(poll_s)
+            t += poll_s
+            if arrived is None and not sm.slewing:
+                arrived = t
+        return sm.position(), arrived, sm, start_pos
+
+    (ra_a, dec_a), t_a, sm, (ra0, dec0) = poll_track(0.013)
+    (ra_b, dec_b), t_b, _, _ = poll_track(1.0)
+    ok = '✓' if abs(ra_a - ra_b) < 1e-12 and abs(dec_a - dec_b) < 1e-12 else '✗'
+    print(f'  {ok}  position independent of polling (13 ms vs 1 s polls)')
+    dist = math.hypot(((sm.target_ra - ra0 + 12.0) % 24.0 - 12.0) * 15.0, sm.target_dec - dec0)
+    v, a = 4.0, TelescopeStateMachine.SLEW_ACCEL_DEG_S2
+    t_min = dist / v + v / a           # trapezoid profile
+    ok = '✓' if abs(t_a - t_min) < 0.1 and sm.display_line1.startswith('Slew complete') else '✗'
+    print(f'  {ok}  accelerated slew of {dist:.1f}° arrives after {t_a:.2f} s (ideal {t_min:.2f} s)')
+
+    clock = VirtualClock(manual=True)
+    sm = TelescopeStateMachine(clock=clock)
+    dec0 = sm.dec
+    sm.process_command(':RM')          # 1°/s
+    sm.process_command(':Mn')
+    clock.advance(2.5)
+    mid = sm.dec                        # interpolated between integration steps
+    sm.process_command(':Qn')
+    clock.advance(5.0)
+    ok = '✓' if abs(mid - dec0 - 2.5) < 1e-9 and abs(sm.dec - mid) < 1e-9 else '✗'
+    print(f'  {ok}  :Mn for 2.5 s at 1°/s moves Dec {sm.dec - dec0:+.4f}°, :Qn stops')
+    sm.process_command(':hC')
+    clock.advance(1.9)
+    first = sm._dispatch(':h?')
+    clock.advance(0.2)
+    ok = '✓' if (first, sm._dispatch(':h?')) == ('2', '1') else '✗'
+    print(f'  {ok}  :hC completes after 2 s of motion-clock time')
+
+    engine = MotionEngine(6.0, 10.0)   # wall clock
+    engine.start_move('n', 1.0)
+    segment = (engine._t0, engine._ra0, engine._dec0)
+    for _ in range(6):
+        time.sleep(0.05)               # status display refresh
+        engine.position()
+    ok = '✓' if engine._thread is None and (engine._t0, engine._ra0, engine._dec0) == segment else '✗'
+    print(f'  {ok}  :Mn with 50 ms queries: no scheduler thread, no state writes')
+    engine.slew_to(7.0, 20.0, 4.0)
+    time.sleep(0.3)
+    ok = '✓' if engine.slewing and engine.wakeups <= 2 else '✗'
+    print(f'  {ok}  slewing for 0.3 s: {engine.wakeups} scheduler wake-up(s)')
+    engine.close()
+
+    print('\n=== Reply queue test ===')
+    q = ReplyQueue()
+    for part in (b'LX200GPS#', b'\x97Select Item:     Object         #', b'1'):
+        q.push(part)
+    whole = q.peek()
+    chunks = []
+    while len(q):
+        chunks.append(q.pop(16))
+    ok = '✓' if b''.join(chunks) == whole and all(len(c) <= 16 for c in chunks) else '✗'
+    print(f'  {ok}  16-byte pops reassemble {len(whole)} bytes in {len(chunks)} chunks')
+    for part in (b'abc#', b'defg#', b'h#'):
+        q.push(part)
+    q.consume(6)
+    ok = '✓' if q.drain() == [b'fg#', b'h#'] and len(q) == 0 else '✗'
+    print(f'  {ok}  consume() after partial send keeps the remainder')
+
     print('\n=== Menu navigation test ===')
     sm = TelescopeStateMachine()
     for key in 'DDDRLLLUD':
@@ -1526,6 +2416,44 @@ def run_tests():
     print(f'  Final menu position: {sm.current_menu_keys}')
     print(f'  Display: [{sm.display_line1}]')
 
+    print('\n=== Multi-client server test (shared mount, per-client replies) ===')
+    requests = [(b':GVP#:GVN#', b'LX200GPS#4.2g#'), (b':GVN#', b'4.2g#'), (b':GVP#', b'LX200GPS#')]
+    for name, serve in (('selector', serve_clients), ('threaded', serve_threaded)):
+        sm = TelescopeStateMachine()
+        srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        srv.bind(('127.0.0.1', 0))
+        srv.listen(8)
+        stop = threading.Event()
+        loop = threading.Thread(target=serve, args=(srv, sm, stop), daemon=True)
+        loop.start()
+        mismatches = []
+
+        def client(i: int, rounds: int = 200):
+            req, want = requests[i % len(requests)]
+            with socket.create_connection(srv.getsockname(), timeout=2.0) as c:
+                for _ in range(rounds):
+                    c.sendall(req)
+                    got = b''
+                    while len(got) < len(want):
+                        got += c.recv(64)
+                    if got != want:
+                        mismatches.append((i, got))
+                        return
+
+        t0 = time.perf_counter()
+        workers = [threading.Thread(target=client, args=(i,)) for i in range(6)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        ms = (time.perf_counter() - t0) * 1000.0
+        ok = '✓' if not mismatches else '✗'
+        print(f'  {ok}  {name:9s} 6 clients x 200 rounds in {ms:.0f} ms'
+              f'  (misrouted replies: {len(mismatches)})')
+        stop.set()
+        loop.join(timeout=2.0)
+        srv.close()
+
     print('\nAll tests complete.')
 
 
@@ -1548,7 +2476,60 @@ if __name__ == '__main__':
         choices=list(EMULATOR_PROFILES.keys()),
         help='telescope model to emulate (default: lx200gps)',
     )
+    parser.add_argument(
+        '--server',
+        default='selector',
+        choices=['selector', 'threaded', 'legacy'],
+        help='selector: readiness-driven, many clients (default); '
+             'threaded: one thread per client sharing the mount; '
+             'legacy: one client at a time with a 50 ms polling loop',
+    )
+    parser.add_argument(
+        '--serial-chunk',
+        metavar='N',
+        type=int,
+        default=0,
+        help='serial-timing emulation: send replies N bytes per write '
+             '(the original loop used 16); default 0 = one gather write',
+    )
+    parser.add_argument(
+        '--sky-cache-ms',
+        metavar='MS',
+        type=int,
+        default=100,
+        help='reuse computed LST and Alt/Az for this many ms while RA/Dec and '
+             'site are unchanged (~67 ms = 1 arcsec of sidereal motion); 0 = off',
+    )
+    parser.add_argument(
+        '--time-scale',
+        metavar='N',
+        type=float,
+        default=1.0,
+        help='run the motion clock (slews, moves, home timer) N times faster',
+    )
+    parser.add_argument(
+        '--log-levels',
+        metavar='SPEC',
+        default='',
+        help='per-category log levels, e.g. commands=off,tx=off '
+             '(categories: commands, tx, display, motion, server; '
+             'levels: debug, info, warning, off; default: all info)',
+    )
+    parser.add_argument(
+        '--log-queue',
+        metavar='N',
+        type=int,
+        default=LOG.max_queue,
+        help=f'log records buffered before new ones are dropped (default: {LOG.max_queue})',
+    )
     args = parser.parse_args()
+    try:
+        LOG.levels.update(parse_levels(args.log_levels))
+    except ValueError as e:
+        parser.error(str(e))
+    if args.time_scale <= 0:
+        parser.error(f'--time-scale must be > 0, got {args.time_scale}')
+    LOG.max_queue = args.log_queue
 
     if args.port == 'test':
         run_tests()
@@ -1557,4 +2538,6 @@ if __name__ == '__main__':
             port = int(args.port)
         except ValueError:
             parser.error(f'port must be an integer or "test", got: {args.port!r}')
-        emulate_telescope(port, mode=args.emulate)
+        emulate_telescope(port, mode=args.emulate, server_mode=args.server,
+                          serial_chunk=args.serial_chunk, sky_cache_ms=args.sky_cache_ms,
+                          time_scale=args.time_scale)
@@ -2,13 +2,22 @@
 Network-to-serial bridge: listens on a TCP port, connects to a serial port,
 and forwards all traffic bidirectionally. Logs every read/write with a
 timestamp (Unix time, millisecond accuracy), R or W, and the raw ASCII message.
+Log lines are queued and written in batches by a background thread.
+--capture also records the raw bytes, with a client id per connection, in a
+binary capture file (see capture.py).
+With --multiplex several clients share the serial line and each reply is
+routed back to the client that sent the command.
 
 Usage:
   python -m net2serial_bridge [--host HOST] [--port PORT] [--serial PATH] [--log PATH] [--baud BAUD]
+                              [--capture PATH] [--io select|threads] [--multiplex] [--cache-ttl MS]
 """
 from __future__ import annotations
 
 import argparse
+import collections
+import os
+import selectors
 import socket
 import sys
 import threading
@@ -16,16 +25,28 @@ import time
 
 import serial
 
+from buffered_log import DEFAULT_MAX_QUEUE, BufferedLog, parse_levels
+from capture import CaptureWriter
+from lx200_protocol import NONE, QUIET, ProtocolSpec, reply_length, split_frames
+
 # Defaults
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 4030
 DEFAULT_SERIAL = "/dev/ttyUSB0"
 DEFAULT_BAUD = 9600
+# "select" needs a pollable serial file descriptor (POSIX); elsewhere fall back to threads
+DEFAULT_IO = "select" if os.name == "posix" else "threads"
+# Read-only queries whose answer changes without a command (position, time, status):
+# cached for --cache-ttl; other read-only queries for --cache-static-ttl
+VOLATILE_QUERIES = frozenset({
+    b":GR#", b":GD#", b":GA#", b":GZ#", b":Gm#", b":GS#", b":GL#", b":Ga#", b":GC#",
+    b":GVT#", b":GW#", b":D#", b":h?#", b":FB#", b":Fp#", b":fT#", b":fC#",
+})
 
 
-def _format_log_line(direction: str, data: bytes) -> str:
+def _format_log_line(direction: str, data: bytes, ts: float | None = None) -> str:
     """Format one log line: unix timestamp (ms), R or W, colon, raw ASCII message."""
-    ts = f"{time.time():.3f}"
+    ts = f"{time.time() if ts is None else ts:.3f}"
     try:
         msg = data.decode("ascii")
     except UnicodeDecodeError:
@@ -33,20 +54,39 @@ def _format_log_line(direction: str, data: bytes) -> str:
     return f"{ts}:{direction}:{msg}\n"
 
 
-def _log(log_file, direction: str, data: bytes, lock: threading.Lock) -> None:
-    if not data or log_file is None:
+def _format_record(record: tuple) -> str:
+    """BufferedLog formatter: the category is the direction, the message the raw bytes."""
+    ts, direction, _level, data, _args = record
+    return _format_log_line(direction, data, ts)
+
+
+def _log(log, direction: str, data: bytes, client: int = 0) -> None:
+    """
+    Hand one read/write to the traffic log: a BufferedLog (decoding and writing
+    happen on its writer thread; the client id is not part of the text line),
+    a CaptureWriter, or a _Tee of both.
+    """
+    if not data or log is None:
         return
-    line = _format_log_line(direction, data)
-    with lock:
-        log_file.write(line)
-        log_file.flush()
+    log.log(direction, data, client)
+
+
+class _Tee:
+    """Traffic log that forwards to several (text log and capture)."""
+
+    def __init__(self, *logs):
+        self.logs = logs
+
+    def log(self, direction: str, data: bytes, client: int = 0) -> None:
+        for log in self.logs:
+            log.log(direction, data, client)
 
 
 def _run_client_bridge(
     client: socket.socket,
     ser: serial.Serial,
-    log_file,
-    log_lock: threading.Lock,
+    log: BufferedLog | None,
+    client_id: int = 0,
 ) -> None:
     """Forward between one client and serial until the client disconnects."""
     client.setblocking(True)
@@ -59,7 +99,7 @@ def _run_client_bridge(
                 buf = client.recv(4096)
                 if not buf:
                     break
-                _log(log_file, "W", buf, log_lock)
+                _log(log, "W", buf, client_id)
                 with serial_lock:
                     ser.write(buf)
         except (ConnectionResetError, BrokenPipeError, OSError):
@@ -75,7 +115,7 @@ def _run_client_bridge(
                 if not buf:
                     time.sleep(0.01)
                     continue
-                _log(log_file, "R", buf, log_lock)
+                _log(log, "R", buf, client_id)
                 try:
                     client.sendall(buf)
                 except (ConnectionResetError, BrokenPipeError, OSError):
@@ -98,6 +138,398 @@ def _run_client_bridge(
         pass
 
 
+def _write_some(write, out: bytearray) -> bool:
+    """Write as much of out as the descriptor takes now; False if the peer is gone."""
+    try:
+        n = write(out)
+    except (BlockingIOError, InterruptedError):
+        return True
+    except OSError:
+        return False
+    del out[:n]
+    return True
+
+
+def _run_client_bridge_select(
+    client: socket.socket,
+    serial_fd: int,
+    log: BufferedLog | None,
+    quit_event: threading.Event | None = None,
+    client_id: int = 0,
+) -> None:
+    """
+    Forward between one client and serial on a single thread: one selector
+    watches the client socket and the serial file descriptor, bytes are
+    relayed as soon as either side is readable, and bytes a side cannot take
+    yet wait for it to become writable without holding up the other direction.
+    """
+    client.setblocking(False)
+    os.set_blocking(serial_fd, False)
+    to_serial = bytearray()
+    to_client = bytearray()
+    write_serial = lambda data: os.write(serial_fd, data)
+    sel = selectors.DefaultSelector()
+    sel.register(client, selectors.EVENT_READ, "net")
+    sel.register(serial_fd, selectors.EVENT_READ, "serial")
+    try:
+        while quit_event is None or not quit_event.is_set():
+            for key, events in sel.select(0.25):
+                if key.data == "net":
+                    if events & selectors.EVENT_READ:
+                        try:
+                            buf = client.recv(4096)
+                        except (BlockingIOError, InterruptedError):
+                            buf = None
+                        except OSError:
+                            return
+                        if buf == b"":
+                            return
+                        if buf:
+                            _log(log, "W", buf, client_id)
+                            to_serial += buf
+                            if not _write_some(write_serial, to_serial):
+                                return
+                    if events & selectors.EVENT_WRITE and not _write_some(client.send, to_client):
+                        return
+                else:
+                    if events & selectors.EVENT_READ:
+                        try:
+                            buf = os.read(serial_fd, 4096)
+                        except (BlockingIOError, InterruptedError):
+                            buf = None
+                        except OSError:
+                            return
+                        if buf == b"":
+                            return
+                        if buf:
+                            _log(log, "R", buf, client_id)
+                            to_client += buf
+                            if not _write_some(client.send, to_client):
+                                return
+                    if events & selectors.EVENT_WRITE and not _write_some(write_serial, to_serial):
+                        return
+            # wait for writability only while something is queued for that side
+            sel.modify(client, selectors.EVENT_READ | (selectors.EVENT_WRITE if to_client else 0), "net")
+            sel.modify(serial_fd, selectors.EVENT_READ | (selectors.EVENT_WRITE if to_serial else 0), "serial")
+    finally:
+        sel.close()
+        try:
+            client.close()
+        except OSError:
+            pass
+
+
+class ReplyCache:
+    """
+    Replies to read-only queries, classified by MeadeLX200protocol.json, each
+    reused for its command's TTL: ttl for queries whose answer drifts on its
+    own (position, time, status), static_ttl for the rest, overrides per
+    command (0 = never cache). Any other command may change state and clears
+    the cache.
+
+    Misses are counted when a cacheable query goes to the mount; each hit adds
+    the last measured serial round trip of that query to saved_s.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        static_ttl: float | None = None,
+        overrides: dict[bytes, float] | None = None,
+        spec: ProtocolSpec | None = None,
+    ):
+        self.ttl = ttl
+        self.static_ttl = ttl if static_ttl is None else static_ttl
+        self.overrides = dict(overrides or {})
+        self.spec = spec or ProtocolSpec.load()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.saved_s = 0.0
+        self._entries: dict[bytes, tuple[float, bytes, float]] = {}   # frame → (stored at, reply, round trip)
+        self._ttls: dict[bytes, float] = {}                           # frame → TTL, 0 = not cacheable
+
+    def ttl_for(self, frame: bytes) -> float:
+        ttl = self._ttls.get(frame)
+        if ttl is None:
+            if frame in self.overrides:
+                ttl = self.overrides[frame]
+            elif not self.spec.is_read_only(frame):
+                ttl = 0.0
+            else:
+                ttl = self.ttl if frame in VOLATILE_QUERIES else self.static_ttl
+            self._ttls[frame] = ttl
+        return ttl
+
+    def get(self, frame: bytes, now: float) -> bytes | None:
+        hit = self._entries.get(frame)
+        if hit is None or now - hit[0] > self._ttls.get(frame, 0.0):
+            return None
+        self.hits += 1
+        self.saved_s += hit[2]
+        return hit[1]
+
+    def sent(self, frame: bytes) -> None:
+        """A command is going to the mount: count a miss, or invalidate if it may change state."""
+        if self.ttl_for(frame) > 0:
+            self.misses += 1
+        elif not self.spec.is_read_only(frame):
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+
+    def put(self, frame: bytes, reply: bytes, now: float, round_trip: float = 0.0) -> None:
+        if reply and self.ttl_for(frame) > 0:
+            self._entries[frame] = (now, reply, round_trip)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "serial_s_saved": round(self.saved_s, 3),
+        }
+
+
+class _MuxClient:
+    __slots__ = ("sock", "addr", "id", "inbuf", "out", "outstanding")
+
+    def __init__(self, sock: socket.socket, addr, client_id: int = 0):
+        self.sock = sock
+        self.id = client_id       # capture client id, 1, 2, ... in connection order
+        self.addr = addr
+        self.inbuf = bytearray()
+        self.out = bytearray()
+        self.outstanding = 0      # commands queued or on the line for this client
+
+
+class SerialMultiplexer:
+    """
+    Several TCP clients sharing one serial line. Each client's '#'-terminated
+    commands are queued in arrival order and sent one at a time; the reply is
+    cut from the serial stream using the command's reply format from
+    MeadeLX200protocol.json (nothing, one byte, '#'-terminated, or "until the
+    line is quiet" for commands the spec does not describe) and returned to
+    the client that sent it. Commands without a reply go out back to back.
+
+    Bytes that arrive while no command is waiting for a reply (e.g. the second
+    string of :SC#) go to the client whose command completed last.
+    """
+
+    def __init__(
+        self,
+        server: socket.socket,
+        serial_fd: int,
+        log: BufferedLog | None = None,
+        spec: ProtocolSpec | None = None,
+        cache: ReplyCache | None = None,
+        reply_timeout: float = 1.0,
+        quiet: float = 0.05,
+        stats_interval: float = 0.0,
+    ):
+        self.server = server
+        self.serial_fd = serial_fd
+        self.log = log
+        self.spec = spec or ProtocolSpec.load()
+        self.cache = cache
+        self.reply_timeout = reply_timeout
+        self.quiet = quiet
+        self.stats_interval = stats_interval
+        self.clients: dict[socket.socket, _MuxClient] = {}
+        self.commands = 0
+        self.timeouts = 0
+        self.connections = 0
+        self._queue: collections.deque = collections.deque()   # (client, frame, ReplyFormat)
+        self._inflight = None      # [client, frame, ReplyFormat, deadline, sent at]
+        self._rx = bytearray()     # serial bytes not yet assigned to a reply
+        self._rx_time = 0.0
+        self._to_serial = bytearray()
+        self._last_client: _MuxClient | None = None
+        self._sel = selectors.DefaultSelector()
+
+    # ---- Main loop ---------------------------------------------------------
+
+    def serve(self, quit_event: threading.Event | None = None) -> None:
+        self.server.setblocking(False)
+        os.set_blocking(self.serial_fd, False)
+        sel = self._sel
+        sel.register(self.server, selectors.EVENT_READ, None)
+        sel.register(self.serial_fd, selectors.EVENT_READ, self.serial_fd)
+        next_stats = time.monotonic() + self.stats_interval
+        try:
+            while quit_event is None or not quit_event.is_set():
+                if self.stats_interval > 0 and time.monotonic() >= next_stats:
+                    print(f"Multiplexer: {self.stats()}", file=sys.stderr)
+                    next_stats += self.stats_interval
+                for key, events in sel.select(self._select_timeout()):
+                    if key.data is None:
+                        self._accept()
+                    elif key.data == self.serial_fd:
+                        if events & selectors.EVENT_READ and not self._read_serial():
+                            return
+                        if events & selectors.EVENT_WRITE and not _write_some(self._write_serial, self._to_serial):
+                            return
+                    elif key.data.sock in self.clients:   # not dropped earlier in this round
+                        if events & selectors.EVENT_READ:
+                            self._read_client(key.data)
+                        if events & selectors.EVENT_WRITE:
+                            self._flush_client(key.data)
+                self._take_replies(time.monotonic())
+                self._pump()
+                sel.modify(self.serial_fd,
+                           selectors.EVENT_READ | (selectors.EVENT_WRITE if self._to_serial else 0),
+                           self.serial_fd)
+        finally:
+            for c in list(self.clients.values()):
+                self._drop(c)
+            sel.close()
+
+    def _select_timeout(self) -> float:
+        timeout = 0.25
+        if self._inflight is not None:
+            timeout = min(timeout, max(0.0, self._inflight[3] - time.monotonic()))
+            if self._rx and self._inflight[2].kind == QUIET:
+                timeout = min(timeout, max(0.0, self._rx_time + self.quiet - time.monotonic()))
+        return timeout
+
+    # ---- Clients -----------------------------------------------------------
+
+    def _accept(self) -> None:
+        try:
+            sock, addr = self.server.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        sock.setblocking(False)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connections += 1
+        c = _MuxClient(sock, addr, self.connections)
+        self.clients[sock] = c
+        self._sel.register(sock, selectors.EVENT_READ, c)
+        print(f"Client connected from {addr} ({len(self.clients)} connected)", file=sys.stderr)
+
+    def _drop(self, c: _MuxClient) -> None:
+        if self.clients.pop(c.sock, None) is None:
+            return
+        self._sel.unregister(c.sock)
+        try:
+            c.sock.close()
+        except OSError:
+            pass
+        print(f"Client {c.addr} disconnected ({len(self.clients)} connected)", file=sys.stderr)
+
+    def _read_client(self, c: _MuxClient) -> None:
+        try:
+            data = c.sock.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(c)
+            return
+        c.inbuf += data
+        now = time.monotonic()
+        for frame in split_frames(c.inbuf):
+            if self.cache is not None and c.outstanding == 0:
+                reply = self.cache.get(frame, now)
+                if reply is not None:       # nothing earlier pending, so order is kept
+                    self._send_client(c, reply)
+                    continue
+            c.outstanding += 1
+            self._queue.append((c, frame, self.spec.reply_format(frame)))
+
+    def _send_client(self, c: _MuxClient, data: bytes) -> None:
+        if not data:
+            return
+        c.out += data
+        self._flush_client(c)
+
+    def _flush_client(self, c: _MuxClient) -> None:
+        if c.sock not in self.clients:
+            return
+        if not _write_some(c.sock.send, c.out):
+            self._drop(c)
+            return
+        self._sel.modify(c.sock, selectors.EVENT_READ | (selectors.EVENT_WRITE if c.out else 0), c)
+
+    # ---- Serial line -------------------------------------------------------
+
+    def _write_serial(self, data) -> int:
+        return os.write(self.serial_fd, data)
+
+    def _read_serial(self) -> bool:
+        try:
+            data = os.read(self.serial_fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            return False
+        if not data:
+            return False
+        owner = self._inflight[0] if self._inflight is not None else self._last_client
+        _log(self.log, "R", data, owner.id if owner is not None else 0)
+        self._rx += data
+        self._rx_time = time.monotonic()
+        return True
+
+    def _pump(self) -> None:
+        """Put queued commands on the line while it is not waiting for a reply."""
+        while self._inflight is None and self._queue:
+            c, frame, fmt = self._queue.popleft()
+            if c.sock not in self.clients:
+                continue
+            _log(self.log, "W", frame, c.id)
+            if self.cache is not None:
+                self.cache.sent(frame)
+            self._to_serial += frame
+            if not _write_some(self._write_serial, self._to_serial):
+                return
+            self.commands += 1
+            if fmt.kind == NONE:
+                c.outstanding -= 1
+                self._last_client = c
+            else:
+                now = time.monotonic()
+                self._inflight = [c, frame, fmt, now + self.reply_timeout, now]
+
+    def _take_replies(self, now: float) -> None:
+        """Cut complete replies off the serial stream and route them."""
+        rx = self._rx
+        while True:
+            if self._inflight is None:
+                if rx and self._last_client is not None:   # late tail of the previous reply
+                    self._send_client(self._last_client, bytes(rx))
+                rx.clear()
+                return
+            c, frame, fmt, deadline, sent_at = self._inflight
+            n = reply_length(fmt, rx)
+            if n is None and fmt.kind == QUIET and rx and now - self._rx_time >= self.quiet:
+                n = len(rx)
+            complete = n is not None
+            if not complete:
+                if now < deadline:
+                    return
+                self.timeouts += 1             # give up on this reply, hand over what came
+                n = len(rx)
+            reply = bytes(rx[:n])
+            del rx[:n]
+            self._inflight = None
+            c.outstanding -= 1
+            self._last_client = c
+            if self.cache is not None and complete:
+                self.cache.put(frame, reply, now, now - sent_at)
+            self._send_client(c, reply)
+            self._pump()
+
+    def stats(self) -> dict:
+        stats = {"clients": len(self.clients), "commands": self.commands, "timeouts": self.timeouts}
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        return stats
+
+
 def _quit_listener(quit_event: threading.Event) -> None:
     """Read stdin; set quit_event when user types Q (and Enter)."""
     try:
@@ -116,6 +548,15 @@ def run_bridge(
     serial_path: str,
     baud: int,
     log_path: str | None,
+    log_levels: dict[str, int] | None = None,
+    log_queue: int = DEFAULT_MAX_QUEUE,
+    io_mode: str = DEFAULT_IO,
+    multiplex: bool = False,
+    cache_ttl: float = 0.0,
+    cache_static_ttl: float = 60.0,
+    cache_overrides: dict[bytes, float] | None = None,
+    stats_interval: float = 0.0,
+    capture_path: str | None = None,
 ) -> None:
     if log_path == "-":
         log_file = sys.stdout
@@ -123,12 +564,16 @@ def run_bridge(
         log_file = open(log_path, "a", encoding="utf-8")
     else:
         log_file = None
-    log_lock = threading.Lock()
+    log = None
+    if log_file is not None:
+        log = BufferedLog(log_file, formatter=_format_record, levels=log_levels, max_queue=log_queue)
+    capture = CaptureWriter(capture_path) if capture_path else None
+    traffic = _Tee(log, capture) if log is not None and capture is not None else log or capture
     ser = serial.Serial(serial_path, baudrate=baud, timeout=0.1)
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     server.bind((host, port))
-    server.listen(1)
+    server.listen(16 if multiplex else 1)
     server.settimeout(1.0)
 
     quit_event = threading.Event()
@@ -136,11 +581,30 @@ def run_bridge(
     quit_thread.start()
 
     print(
-        f"Listening on {host}:{port}, serial {serial_path} @ {baud} baud, log={log_path or 'none'}",
+        f"Listening on {host}:{port}, serial {serial_path} @ {baud} baud, log={log_path or 'none'}"
+        + (f", capture={capture_path}" if capture_path else ""),
         file=sys.stderr,
     )
     print("Press Q then Enter to quit.", file=sys.stderr)
 
+    if multiplex:
+        cache = ReplyCache(cache_ttl, cache_static_ttl, cache_overrides) if cache_ttl > 0 else None
+        mux = SerialMultiplexer(server, ser.fileno(), traffic, cache=cache, stats_interval=stats_interval)
+        try:
+            mux.serve(quit_event)
+        finally:
+            server.close()
+            ser.close()
+            if log is not None:
+                log.close()
+            if capture is not None:
+                capture.close()
+            if log_file and log_path and log_path != "-":
+                log_file.close()
+            print(f"Multiplexer: {mux.stats()}", file=sys.stderr)
+        return
+
+    client_id = 0
     try:
         while not quit_event.is_set():
             try:
@@ -153,11 +617,21 @@ def run_bridge(
                 print(f"Accept error: {e}", file=sys.stderr)
                 break
             print(f"Client connected from {addr}", file=sys.stderr)
-            _run_client_bridge(client, ser, log_file, log_lock)
+            client_id += 1
+            if io_mode == "select":
+                _run_client_bridge_select(client, ser.fileno(), traffic, quit_event, client_id)
+            else:
+                _run_client_bridge(client, ser, traffic, client_id)
             print("Client disconnected, waiting for next connection.", file=sys.stderr)
     finally:
         server.close()
         ser.close()
+        if log is not None:
+            log.close()
+            if log.dropped:
+                print(f"Log queue overflowed: {log.dropped} record(s) dropped", file=sys.stderr)
+        if capture is not None:
+            capture.close()
         if log_file and log_path and log_path != "-":
             log_file.close()
 
@@ -170,8 +644,46 @@ def main() -> None:
     ap.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Listen port (default: {DEFAULT_PORT})")
     ap.add_argument("--serial", default=DEFAULT_SERIAL, help=f"Serial port (default: {DEFAULT_SERIAL})")
     ap.add_argument("--log", default=None, help="Log file path; use '-' for stdout (default: no log)")
+    ap.add_argument("--capture", default=None, metavar="PATH",
+                    help="also write raw traffic with client ids to a binary capture (PATH and PATH.idx; "
+                         "see capture.py for converters)")
     ap.add_argument("--baud", type=int, default=DEFAULT_BAUD, help=f"Serial baud rate (default: {DEFAULT_BAUD})")
+    ap.add_argument("--io", choices=("select", "threads"), default=DEFAULT_IO,
+                    help="select: one thread, relay as soon as either side is readable; "
+                         f"threads: reader/writer thread pair with polled serial reads (default: {DEFAULT_IO})")
+    ap.add_argument("--multiplex", action="store_true",
+                    help="share the serial line between several clients; replies are routed to the sender "
+                         "(needs --io select)")
+    ap.add_argument("--cache-ttl", type=float, default=0.0, metavar="MS",
+                    help="answer repeated read-only queries from the mount's last reply: position, time and "
+                         "status queries (:GR#, :GD#, :GW#, ...) for MS ms; implies --multiplex (default: 0 = off)")
+    ap.add_argument("--cache-static-ttl", type=float, default=60000.0, metavar="MS",
+                    help="TTL of the other read-only queries (:GVP#, site, limits, ...) (default: 60000)")
+    ap.add_argument("--cache-ttl-for", action="append", default=[], metavar="CMD=MS",
+                    help="per-command TTL, e.g. ':GR#=250' or ':GW#=0' to never cache; repeatable")
+    ap.add_argument("--stats-interval", type=float, default=0.0, metavar="S",
+                    help="with --multiplex, print command/cache counters every S seconds (default: 0 = at exit)")
+    ap.add_argument("--log-levels", default="",
+                    help="Per-direction log levels, e.g. R=off to log writes only (default: both)")
+    ap.add_argument("--log-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                    help=f"Log lines buffered before new ones are dropped (default: {DEFAULT_MAX_QUEUE})")
     args = ap.parse_args()
+    try:
+        log_levels = parse_levels(args.log_levels)
+    except ValueError as e:
+        ap.error(str(e))
+    cache_overrides = {}
+    for item in args.cache_ttl_for:
+        cmd, sep, ms = item.rpartition("=")
+        try:
+            cache_overrides[cmd.encode("latin-1")] = float(ms) / 1000.0
+        except ValueError:
+            sep = ""
+        if not sep or not cmd:
+            ap.error(f"bad --cache-ttl-for {item!r}; expected CMD=MS")
+    multiplex = args.multiplex or args.cache_ttl > 0
+    if multiplex and args.io != "select":
+        ap.error("--multiplex and --cache-ttl need --io select")
 
     try:
         run_bridge(
@@ -180,6 +692,15 @@ def main() -> None:
             serial_path=args.serial,
             baud=args.baud,
             log_path=args.log,
+            log_levels=log_levels,
+            log_queue=args.log_queue,
+            io_mode=args.io,
+            multiplex=multiplex,
+            cache_ttl=args.cache_ttl / 1000.0,
+            cache_static_ttl=args.cache_static_ttl / 1000.0,
+            cache_overrides=cache_overrides,
+            stats_interval=args.stats_interval,
+            capture_path=args.capture,
         )
     except serial.SerialException as e:
         print(f"Serial error: {e}", file=sys.stderr)
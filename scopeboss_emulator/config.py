@@ -8,6 +8,8 @@ from typing import Optional, List, Literal
 
 
 HomeMode = Literal["scripted", "timer"]
+TRANSPORTS = ("streams", "protocol")
+EVENT_LOOPS = ("asyncio", "uvloop", "auto")
 
 @dataclass(frozen=True)
 class HomeBehavior:
@@ -24,6 +26,19 @@ class EmulatorConfig:
 
     # Parser
     max_frame_len: int = 256
+    # Yield zero-copy FrameView frames (decoded lazily) instead of CmdFrame
+    parser_frame_views: bool = False
+
+    # Server I/O: "streams" (StreamReader/Writer) or "protocol" (asyncio.Protocol);
+    # event loop "asyncio", "uvloop" or "auto" (uvloop when installed)
+    transport: str = "streams"
+    event_loop: str = "asyncio"
+
+    # Socket writes: all replies of one read are sent with one writelines() + one drain().
+    # write_coalesce=False restores write+drain per reply (for comparison benchmarks).
+    write_coalesce: bool = True
+    write_high_water: int = 64 * 1024
+    write_low_water: int = 16 * 1024
 
     # Busy/NAK behavior
     nak_on_lock: bool = True
@@ -32,6 +47,9 @@ class EmulatorConfig:
     park_duration_ms: int = 5000
     home: HomeBehavior = HomeBehavior()
 
+    # Simulation clock speed (server-wide); 10.0 runs park/home timers 10x faster
+    time_scale: float = 1.0
+
     # Response formatting for :h?# (protocol defines codes but not terminator in cited snippet) [2](http://company7.com/library/meade/LX200CommandSet.pdf)
     home_status_append_hash: bool = False
 
@@ -50,8 +68,15 @@ def load_config(path: str | None) -> EmulatorConfig:
     return EmulatorConfig(
         mount_mode_byte=data.get("mount_mode_byte", "P"),
         max_frame_len=int(data.get("max_frame_len", 256)),
+        parser_frame_views=bool(data.get("parser_frame_views", False)),
+        transport=data.get("transport", "streams"),
+        event_loop=data.get("event_loop", "asyncio"),
+        write_coalesce=bool(data.get("write_coalesce", True)),
+        write_high_water=int(data.get("write_high_water", 64 * 1024)),
+        write_low_water=int(data.get("write_low_water", 16 * 1024)),
         nak_on_lock=bool(data.get("nak_on_lock", True)),
         park_duration_ms=int(data.get("park_duration_ms", 5000)),
         home=home,
+        time_scale=float(data.get("time_scale", 1.0)),
         home_status_append_hash=bool(data.get("home_status_append_hash", False)),
     )
@@ -0,0 +1,76 @@
+
+from __future__ import annotations
+from typing import Callable, Dict, Optional, Union
+
+from .state import MutableTelescopeState
+from ..config import EmulatorConfig
+
+
+class _Unhandled:
+    def __repr__(self) -> str:
+        return "UNHANDLED"
+
+# Returned by a family handler that declines a command (e.g. ':F9#' under ':F'),
+# and by dispatch() when nothing matches.
+UNHANDLED = _Unhandled()
+
+HandlerResult = Union[Optional[bytes], _Unhandled]
+# A handler gets (state, frame text, cfg), updates state in place and returns
+# the reply bytes (None for no reply) or UNHANDLED.
+Handler = Callable[[MutableTelescopeState, str, EmulatorConfig], HandlerResult]
+
+
+class CommandRegistry:
+    """
+    Command text -> handler lookup.
+
+    - Exact commands (':hP#') resolve with one dict lookup.
+    - Prefix families (':F' for ':F1#'..':F4#', later ':G', ':S', ':M', ...) live in
+      a character trie; the longest registered prefix wins, so lookup cost is
+      bounded by the longest prefix, not by the number of commands.
+    Exact matches are tried before prefixes.
+    """
+
+    def __init__(self) -> None:
+        self.exact: Dict[str, Handler] = {}
+        self._trie: dict = {}
+
+    def register(self, *texts: str) -> Callable[[Handler], Handler]:
+        def deco(fn: Handler) -> Handler:
+            for t in texts:
+                if t in self.exact:
+                    raise ValueError(f"duplicate command handler: {t}")
+                self.exact[t] = fn
+            return fn
+        return deco
+
+    def register_prefix(self, prefix: str) -> Callable[[Handler], Handler]:
+        def deco(fn: Handler) -> Handler:
+            node = self._trie
+            for ch in prefix:
+                node = node.setdefault(ch, {})
+            if None in node:
+                raise ValueError(f"duplicate prefix handler: {prefix}")
+            node[None] = fn
+            return fn
+        return deco
+
+    def lookup_prefix(self, text: str) -> Optional[Handler]:
+        node = self._trie
+        found = node.get(None)
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
+
+    def dispatch(self, state: MutableTelescopeState, text: str, cfg: EmulatorConfig) -> HandlerResult:
+        """Run the handler for text; UNHANDLED if nothing is registered or the family declined."""
+        fn = self.exact.get(text)
+        if fn is not None:
+            return fn(state, text, cfg)
+        fn = self.lookup_prefix(text)
+        if fn is not None:
+            return fn(state, text, cfg)
+        return UNHANDLED
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 from .state import MotionState
-from ..protocol.types import CmdAck, CmdFrame, ProtocolCommand
+from ..protocol.types import CmdAck, FRAME_TYPES, ProtocolCommand
 
 NAK_BYTE = b"\x15"  # NAK (0x15) as busy/unavailable 12
 
@@ -21,7 +21,7 @@ def is_allowed(motion: MotionState, cmd: ProtocolCommand) -> PolicyResult:
     if isinstance(cmd, CmdAck):
         return PolicyResult(True)
 
-    if not isinstance(cmd, CmdFrame):
+    if not isinstance(cmd, FRAME_TYPES):
         return PolicyResult(False, NAK_BYTE)
 
     t = cmd.text
@@ -1,11 +1,11 @@
 
 from __future__ import annotations
-from dataclasses import replace
 from typing import Tuple, List, Optional
 
-from .state import TelescopeState, LinkState, MotionState, HomeStatus, FocusState, Timers
+from .state import TelescopeState, MutableTelescopeState, LinkState, MotionState, HomeStatus, FocusState, Timers
+from .dispatch import CommandRegistry, HandlerResult, UNHANDLED
 from ..config import EmulatorConfig
-from ..protocol.types import CmdAck, CmdFrame, ProtocolCommand
+from ..protocol.types import CmdAck, FRAME_TYPES, ProtocolCommand
 
 ACK_BYTE = b"\x06"  # incoming query; responses are mode bytes (not 0x06)
 
@@ -13,110 +13,174 @@ def handle_command(state: TelescopeState, cmd: ProtocolCommand, cfg: EmulatorCon
     """
     Apply command -> new state, and optional immediate reply bytes.
     """
-    s = state
+    m = MutableTelescopeState.from_state(state)
+    reply = apply_command(m, cmd, cfg)
+    return m.snapshot(), reply
 
+
+def apply_command(s: MutableTelescopeState, cmd: ProtocolCommand, cfg: EmulatorConfig) -> Optional[bytes]:
+    """
+    Mutable fast path of handle_command: update s in place, return reply bytes.
+    """
     # ACK query: respond with configured mount mode indicator (e.g., 'P', 'L', 'D') 4
     if isinstance(cmd, CmdAck):
-        b = cfg.mount_mode_byte.encode("ascii", errors="ignore")[:1]
-        return s, b
+        return cfg.mount_mode_byte.encode("ascii", errors="ignore")[:1]
 
-    if not isinstance(cmd, CmdFrame):
-        return replace(s, last_error="unknown_cmd_type"), None
+    if not isinstance(cmd, FRAME_TYPES):
+        s.last_error = "unknown_cmd_type"
+        return None
 
     t = cmd.text
+    reply = COMMANDS.dispatch(s, t, cfg)
+    if reply is not UNHANDLED:
+        return reply
+
+    # Unknown command: ignore (or set error)
+    s.last_error = f"unhandled:{t}"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Command handlers. New families (:G, :S, :M, :R, :T) register here.
+# ---------------------------------------------------------------------------
+
+COMMANDS = CommandRegistry()
+
+
+# Home commands 2
+@COMMANDS.register(":hS#", ":hF#")
+def _cmd_home_seek(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    s.motion = MotionState.HOMING
+    s.home_status = HomeStatus.IN_PROGRESS
+    s.home_done_at_ms = s.now_ms + cfg.home.duration_ms
+    s.last_error = None
+    return None
+
+
+@COMMANDS.register(":h?#")
+def _cmd_home_query(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    code = _home_status_code(s, cfg)
+    payload = str(code).encode("ascii")
+    if cfg.home_status_append_hash:
+        payload += b"#"
+    return payload
+
+
+@COMMANDS.register(":hP#")
+def _cmd_park(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    s.motion = MotionState.PARKING
+    s.park_done_at_ms = s.now_ms + cfg.park_duration_ms
+    s.last_error = None
+    return None
+
+
+@COMMANDS.register(":hN#")
+def _cmd_sleep(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    # Sleep: power down (model), focuser forced idle 2
+    s.motion = MotionState.SLEEPING
+    s.focus = FocusState.FOCUS_IDLE
+    s.last_error = None
+    return None
+
 
-    # Home commands 2
-    if t == ":hS#" or t == ":hF#":
-        s = replace(
-            s,
-            motion=MotionState.HOMING,
-            home_status=HomeStatus.IN_PROGRESS,
-            timers=replace(s.timers, home_done_at_ms=s.now_ms + cfg.home.duration_ms),
-            last_error=None,
-        )
-        return s, None
-
-    if t == ":h?#":
-        code = _home_status_code(s, cfg)
-        payload = str(code).encode("ascii")
-        if cfg.home_status_append_hash:
-            payload += b"#"
-        return s, payload
-
-    if t == ":hP#":
-        s = replace(
-            s,
-            motion=MotionState.PARKING,
-            timers=replace(s.timers, park_done_at_ms=s.now_ms + cfg.park_duration_ms),
-            last_error=None,
-        )
-        return s, None
-
-    if t == ":hN#":
-        # Sleep: power down (model), focuser forced idle 2
-        s = replace(s, motion=MotionState.SLEEPING, focus=FocusState.FOCUS_IDLE, last_error=None)
-        return s, None
-
-    if t == ":hW#":
-        s = replace(s, motion=MotionState.IDLE_TRACKING, last_error=None)
-        return s, None
-
-    # Focus commands 2
-    if t == ":F+#":
-        s = replace(s, focus=FocusState.FOCUS_IN, last_error=None)
-        return s, None
-    if t == ":F-#":
-        s = replace(s, focus=FocusState.FOCUS_OUT, last_error=None)
-        return s, None
-    if t == ":FQ#":
-        s = replace(s, focus=FocusState.FOCUS_IDLE, last_error=None)
-        return s, None
-
-    # Focus speed: :F1#..:F4# plus optional :FF#/:FS#
-    if t in (":FF#", ":FS#"):
-        # map aliases to speed if you want; protocol provides :FF#/:FS# 2
-        # We'll set 4 for FF, 1 for FS
-        n = 4 if t == ":FF#" else 1
-        s = replace(s, focus_speed=n, last_error=None)
-        return s, None
-
-    if len(t) == 4 and t.startswith(":F") and t.endswith("#"):
+@COMMANDS.register(":hW#")
+def _cmd_wake(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    s.motion = MotionState.IDLE_TRACKING
+    s.last_error = None
+    return None
+
+
+# Focus commands 2
+_FOCUS_MOTION = {":F+#": FocusState.FOCUS_IN, ":F-#": FocusState.FOCUS_OUT, ":FQ#": FocusState.FOCUS_IDLE}
+
+
+@COMMANDS.register(*_FOCUS_MOTION)
+def _cmd_focus_motion(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    s.focus = _FOCUS_MOTION[t]
+    s.last_error = None
+    return None
+
+
+@COMMANDS.register(":FF#", ":FS#")
+def _cmd_focus_fast_slow(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    # map aliases to speed if you want; protocol provides :FF#/:FS# 2
+    # We'll set 4 for FF, 1 for FS
+    s.focus_speed = 4 if t == ":FF#" else 1
+    s.last_error = None
+    return None
+
+
+# Focus speed: :F1#..:F4#
+@COMMANDS.register_prefix(":F")
+def _cmd_focus_speed(s: MutableTelescopeState, t: str, cfg: EmulatorConfig) -> HandlerResult:
+    if len(t) == 4 and t.endswith("#"):
         # e.g. ':F3#'
         ch = t[2]
         if ch.isdigit():
             n = int(ch)
             if 1 <= n <= 4:
-                s = replace(s, focus_speed=n, last_error=None)
-                return s, None
-
-    # Unknown command: ignore (or set error)
-    s = replace(s, last_error=f"unhandled:{t}")
-    return s, None
+                s.focus_speed = n
+                s.last_error = None
+                return None
+    return UNHANDLED
 
 
 def tick(state: TelescopeState, dt_ms: int, cfg: EmulatorConfig) -> TelescopeState:
     """
     Advance time and fire deterministic timers.
     """
-    s = replace(state, now_ms=state.now_ms + dt_ms)
+    m = MutableTelescopeState.from_state(state)
+    advance(m, dt_ms, cfg)
+    return m.snapshot()
+
+
+def advance(s: MutableTelescopeState, dt_ms: int, cfg: EmulatorConfig) -> bool:
+    """
+    Mutable fast path of tick: advance s.now_ms in place and fire due timers.
+    Allocates nothing when no timer fires. Returns True if a timer fired.
+    """
+    s.now_ms += dt_ms
+    fired = False
 
     # Park completion -> PARKED_READY (emulator modeling; :hP# returns nothing in cited text) 2
-    if s.timers.park_done_at_ms is not None and s.now_ms >= s.timers.park_done_at_ms:
+    if s.park_done_at_ms is not None and s.now_ms >= s.park_done_at_ms:
         if s.motion == MotionState.PARKING:
-            s = replace(s, motion=MotionState.PARKED_READY, timers=replace(s.timers, park_done_at_ms=None))
+            s.motion = MotionState.PARKED_READY
+            s.park_done_at_ms = None
+            fired = True
 
     # Home completion timer affects what :h?# will return
-    if s.timers.home_done_at_ms is not None and s.now_ms >= s.timers.home_done_at_ms:
+    if s.home_done_at_ms is not None and s.now_ms >= s.home_done_at_ms:
         # If timer-based home behavior, we mark FOUND/FAILED but keep HOMING until queried or immediately exit.
         # We'll immediately exit to IDLE_TRACKING for simplicity, while still allowing :h?# to report final code.
         if s.motion == MotionState.HOMING and cfg.home.mode == "timer":
-            final = HomeStatus.FOUND if cfg.home.succeed else HomeStatus.FAILED
-            s = replace(s, home_status=final, motion=MotionState.IDLE_TRACKING, timers=replace(s.timers, home_done_at_ms=None))
+            s.home_status = HomeStatus.FOUND if cfg.home.succeed else HomeStatus.FAILED
+            s.motion = MotionState.IDLE_TRACKING
+            s.home_done_at_ms = None
+            fired = True
 
-    return s
+    return fired
 
 
-def _home_status_code(s: TelescopeState, cfg: EmulatorConfig) -> int:
+def next_deadline(s: TelescopeState | MutableTelescopeState, cfg: EmulatorConfig) -> Optional[int]:
+    """
+    Earliest timer deadline (sim ms) that advance() would act on, or None when
+    no live timer is pending. Stale deadlines (e.g. a park timer after :hN#)
+    are ignored because advance() never fires them.
+    """
+    if isinstance(s, TelescopeState):
+        park, home = s.timers.park_done_at_ms, s.timers.home_done_at_ms
+    else:
+        park, home = s.park_done_at_ms, s.home_done_at_ms
+    due: Optional[int] = None
+    if park is not None and s.motion == MotionState.PARKING:
+        due = park
+    if home is not None and s.motion == MotionState.HOMING and cfg.home.mode == "timer":
+        due = home if due is None else min(due, home)
+    return due
+
+
+def _home_status_code(s: TelescopeState | MutableTelescopeState, cfg: EmulatorConfig) -> int:
     """
     Return code for :h?#: 0 failed, 1 found, 2 in progress. 2
     If scripted mode, pop from script until exhausted.
@@ -137,4 +201,4 @@ def _home_status_code(s: TelescopeState, cfg: EmulatorConfig) -> int:
 
 '''
 Note: The protocol defines the :h?# return codes (0/1/2) but the snippet we have does not specify a terminator for that response. We made it configurable (home_status_append_hash). [Meade Tele...d Protocol]
-'''
\ No newline at end of file
+'''
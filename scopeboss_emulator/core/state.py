@@ -45,3 +45,66 @@ class TelescopeState:
     timers: Timers = Timers()
     last_error: Optional[str] = None
 
+
+class MutableTelescopeState:
+    """
+    Mutable, __slots__ twin of TelescopeState used on the server fast path.
+    Commands and ticks update it in place; snapshot() copies it out as the
+    immutable TelescopeState that tests and golden traces compare against.
+    Timers are flattened into park_done_at_ms / home_done_at_ms.
+    """
+    __slots__ = (
+        "now_ms", "link", "motion", "home_status", "focus", "focus_speed",
+        "park_done_at_ms", "home_done_at_ms", "last_error",
+    )
+
+    def __init__(
+        self,
+        now_ms: int = 0,
+        link: LinkState = LinkState.DISCONNECTED,
+        motion: MotionState = MotionState.POWERED_OFF,
+        home_status: HomeStatus = HomeStatus.UNKNOWN,
+        focus: FocusState = FocusState.FOCUS_IDLE,
+        focus_speed: Optional[int] = None,
+        park_done_at_ms: Optional[int] = None,
+        home_done_at_ms: Optional[int] = None,
+        last_error: Optional[str] = None,
+    ) -> None:
+        self.now_ms = now_ms
+        self.link = link
+        self.motion = motion
+        self.home_status = home_status
+        self.focus = focus
+        self.focus_speed = focus_speed
+        self.park_done_at_ms = park_done_at_ms
+        self.home_done_at_ms = home_done_at_ms
+        self.last_error = last_error
+
+    @classmethod
+    def from_state(cls, s: TelescopeState) -> MutableTelescopeState:
+        return cls(
+            now_ms=s.now_ms,
+            link=s.link,
+            motion=s.motion,
+            home_status=s.home_status,
+            focus=s.focus,
+            focus_speed=s.focus_speed,
+            park_done_at_ms=s.timers.park_done_at_ms,
+            home_done_at_ms=s.timers.home_done_at_ms,
+            last_error=s.last_error,
+        )
+
+    def snapshot(self) -> TelescopeState:
+        return TelescopeState(
+            now_ms=self.now_ms,
+            link=self.link,
+            motion=self.motion,
+            home_status=self.home_status,
+            focus=self.focus,
+            focus_speed=self.focus_speed,
+            timers=Timers(park_done_at_ms=self.park_done_at_ms, home_done_at_ms=self.home_done_at_ms),
+            last_error=self.last_error,
+        )
+
+    def __repr__(self) -> str:
+        return f"Mutable{self.snapshot()!r}"
@@ -1,13 +1,31 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
-from .types import CmdAck, CmdFrame, ProtocolCommand
+from typing import Dict, List
+from .types import CmdAck, CmdFrame, FrameView, ProtocolCommand
 
 
 ACK_BYTE = 0x06  # protocol ACK query 14
 HASH = ord("#")
 
+ACK_CHAR = "\x06"
+FRAME_CACHE_MAX = 1024  # distinct command texts kept for frame reuse
+
+_ACK = CmdAck()
+# CmdFrame is frozen, so identical command texts can share one instance.
+# Polling traffic repeats a handful of commands, which makes this a near-100% hit.
+_frame_cache: Dict[str, CmdFrame] = {}
+
+
+def _frame(text: str) -> CmdFrame:
+    f = _frame_cache.get(text)
+    if f is None:
+        f = CmdFrame(text=text)
+        if len(_frame_cache) < FRAME_CACHE_MAX:
+            _frame_cache[text] = f
+    return f
+
+
 @dataclass
 class StreamParser:
     max_len: int = 256
@@ -16,6 +34,85 @@ class StreamParser:
         self.buf = bytearray()
 
     def feed(self, data: bytes) -> List[ProtocolCommand]:
+        """
+        Bulk framing path: locate '#' boundaries with find() and slice whole
+        frames instead of appending byte by byte. Produces exactly the same
+        commands as feed_bytewise (ACK only when no frame is open, overflow
+        drops the buffer and the overflowing byte, invalid ASCII frames dropped).
+        """
+        out: List[ProtocolCommand] = []
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        pos = 0
+        if not self.buf and data.isascii():
+            pos = self._split_ascii(data.decode("ascii"), out)
+        self._split_bytes(data, pos, out)
+        return out
+
+    def _split_ascii(self, text: str, out: List[ProtocolCommand]) -> int:
+        """
+        Fast path for an all-ASCII chunk starting with no open frame: decode once,
+        then slice complete frames out of the str. Returns the offset where it
+        stopped (after the last '#', or at a frame that would overflow).
+        """
+        max_len = self.max_len
+        pos = 0
+        while True:
+            end = text.find("#", pos)
+            if end < 0:
+                return pos
+            while text[pos] == ACK_CHAR:
+                out.append(_ACK)
+                pos += 1
+            if end - pos >= max_len:
+                # overflow: let the general path apply the drop semantics
+                return pos
+            out.append(_frame(text[pos:end + 1]))
+            pos = end + 1
+
+    def _split_bytes(self, data: bytes, pos: int, out: List[ProtocolCommand]) -> None:
+        """General path: handles partial frames carried in self.buf, overflow and non-ASCII."""
+        buf = self.buf
+        max_len = self.max_len
+        n = len(data)
+        while pos < n:
+            if not buf:
+                # standalone ACK bytes between frames
+                while pos < n and data[pos] == ACK_BYTE:
+                    out.append(_ACK)
+                    pos += 1
+                if pos >= n:
+                    break
+
+            end = data.find(b"#", pos)
+            stop = n if end < 0 else end + 1
+            room = max_len - len(buf)
+            if stop - pos > room:
+                # Parse error: byte at pos+room overflows; drop buffer and that byte
+                buf.clear()
+                pos += room + 1
+                continue
+
+            if end < 0:
+                buf += data[pos:]
+                break
+
+            if buf:
+                buf += data[pos:stop]
+                raw = bytes(buf)
+                buf.clear()
+            else:
+                raw = data[pos:stop]
+            pos = stop
+            try:
+                text = raw.decode("ascii", errors="strict")
+            except UnicodeDecodeError:
+                # invalid frame; ignore
+                continue
+            out.append(_frame(text))
+
+    def feed_bytewise(self, data: bytes) -> List[ProtocolCommand]:
+        """Reference byte-at-a-time framing loop; kept for equivalence tests and benchmarks."""
         out: List[ProtocolCommand] = []
         for b in data:
             # ACK is a single-byte query. We only treat it as such when not in a frame.
@@ -40,3 +137,78 @@ class StreamParser:
                 out.append(CmdFrame(text=text + "#"))
         return out
 
+
+class FrameViewParser:
+    """
+    Zero-copy parser mode: yields FrameView (offset/length) instead of CmdFrame.
+
+    Frames that lie entirely inside one fed chunk are views into that chunk.
+    A frame split across chunks is assembled in a preallocated two-slot carry
+    buffer (2 x max_len, never resized); slots alternate so the frame
+    completed in this feed is not overwritten by the partial tail that follows
+    it. Views are valid until the next feed() call. Framing semantics (ACK,
+    overflow, invalid ASCII) match StreamParser.
+    """
+
+    def __init__(self, max_len: int = 256) -> None:
+        self.max_len = max_len
+        self._ring = bytearray(2 * max_len)
+        self._mem = memoryview(self._ring)
+        self._slot = 0          # offset of the slot holding the open frame
+        self._fill = 0          # bytes of the open frame
+        self._fill_ascii = True
+
+    @property
+    def buf(self) -> bytes:
+        """Bytes of the currently open (unterminated) frame."""
+        return bytes(self._mem[self._slot:self._slot + self._fill])
+
+    def feed(self, data: bytes) -> List[ProtocolCommand]:
+        out: List[ProtocolCommand] = []
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        chunk_ascii = data.isascii()
+        mv = memoryview(data)
+        max_len = self.max_len
+        n = len(data)
+        pos = 0
+        while pos < n:
+            if not self._fill:
+                # standalone ACK bytes between frames
+                while pos < n and data[pos] == ACK_BYTE:
+                    out.append(_ACK)
+                    pos += 1
+                if pos >= n:
+                    break
+
+            end = data.find(b"#", pos)
+            stop = n if end < 0 else end + 1
+            fill = self._fill
+            if stop - pos > max_len - fill:
+                # Parse error: overflowing byte dropped together with the open frame
+                pos += max_len - fill + 1
+                self._fill = 0
+                self._fill_ascii = True
+                continue
+
+            seg_ascii = chunk_ascii or mv[pos:stop].tobytes().isascii()
+            if fill or end < 0:
+                base = self._slot + fill
+                self._ring[base:base + stop - pos] = mv[pos:stop]
+                if end < 0:
+                    self._fill = fill + stop - pos
+                    self._fill_ascii = self._fill_ascii and seg_ascii
+                    break
+                view = FrameView(self._mem, self._slot, fill + stop - pos)
+                ok = self._fill_ascii and seg_ascii
+                self._fill = 0
+                self._fill_ascii = True
+                self._slot = max_len - self._slot
+            else:
+                view = FrameView(mv, pos, stop - pos)
+                ok = seg_ascii
+            pos = stop
+            if ok:
+                out.append(view)
+            # else: invalid frame; ignore
+        return out
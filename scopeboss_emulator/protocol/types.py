@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Union
+from typing import Optional, Union
 
 @dataclass(frozen=True)
 class CmdAck:
@@ -13,5 +13,34 @@ class CmdFrame:
     """A full '#'-terminated ASCII command frame (decoded)."""
     text: str # includes trailing '#', e.g. ':hP#'
 
-ProtocolCommand = Union[CmdAck, CmdFrame]
+class FrameView:
+    """
+    A '#'-terminated frame as (offset, length) into a receive buffer; no copy.
+    `text` decodes on first access and is cached. Only valid until the parser
+    that produced it is fed again.
+    """
+    __slots__ = ("mem", "start", "length", "_text")
 
+    def __init__(self, mem: memoryview, start: int, length: int) -> None:
+        self.mem = mem
+        self.start = start
+        self.length = length
+        self._text: Optional[str] = None
+
+    @property
+    def raw(self) -> memoryview:
+        return self.mem[self.start:self.start + self.length]
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = str(self.raw, "ascii")
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"FrameView({bytes(self.raw)!r})"
+
+ProtocolCommand = Union[CmdAck, CmdFrame, FrameView]
+
+# Command types that carry frame text (decoded or lazily decoded)
+FRAME_TYPES = (CmdFrame, FrameView)
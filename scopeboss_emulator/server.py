@@ -2,27 +2,88 @@
 from __future__ import annotations
 import argparse
 import asyncio
-from typing import Optional
+from dataclasses import dataclass, replace
+from typing import Callable, List, Optional
 
-from .config import load_config, EmulatorConfig
-from .protocol.parser import StreamParser
-from .core.state import TelescopeState, LinkState, MotionState
+from .config import load_config, EmulatorConfig, TRANSPORTS, EVENT_LOOPS
+from .protocol.parser import StreamParser, FrameViewParser
+from .core.state import MutableTelescopeState, LinkState, MotionState
 from .core.policy import is_allowed, NAK_BYTE
-from .core.reducer import handle_command, tick
-
-TICK_MS = 50
-
-async def client_session(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cfg: EmulatorConfig) -> None:
-    parser = StreamParser(max_len=cfg.max_frame_len)
-    state = TelescopeState(link=LinkState.CONNECTED, motion=MotionState.IDLE_TRACKING)
-
-    async def ticker():
-        nonlocal state
-        while True:
-            await asyncio.sleep(TICK_MS / 1000.0)
-            state = tick(state, TICK_MS, cfg)
-
-    tick_task = asyncio.create_task(ticker())
+from .core.reducer import apply_command
+from .timers import SessionTimer, SimClock, Scheduler
+
+
+@dataclass
+class ServerStats:
+    """Per-process counters; summed across processes in --workers mode."""
+    sessions_total: int = 0
+    sessions_active: int = 0
+    commands: int = 0
+    replies: int = 0
+    naks: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+class Session:
+    """
+    Transport-independent per-connection state: parser, telescope state, timer
+    and stats. handle() turns one read into the replies for that batch, in
+    command order; both the Streams and the Protocol transport drive it.
+    """
+
+    def __init__(self, cfg: EmulatorConfig, scheduler: Scheduler, stats: ServerStats) -> None:
+        self.cfg = cfg
+        self.stats = stats
+        stats.sessions_total += 1
+        stats.sessions_active += 1
+        if cfg.parser_frame_views:
+            self.parser = FrameViewParser(max_len=cfg.max_frame_len)
+        else:
+            self.parser = StreamParser(max_len=cfg.max_frame_len)
+        # mutated in place; use state.snapshot() for an immutable TelescopeState
+        self.state = MutableTelescopeState(
+            now_ms=scheduler.clock.tick_now_ms(), link=LinkState.CONNECTED, motion=MotionState.IDLE_TRACKING)
+        # queued on the shared scheduler only when a park/home deadline is due; clock caught up on each read
+        self.timer = SessionTimer(self.state, cfg, scheduler)
+
+    def handle(self, data: bytes) -> List[bytes]:
+        cfg, stats, state = self.cfg, self.stats, self.state
+        cmds = self.parser.feed(data)
+        stats.bytes_in += len(data)
+        stats.commands += len(cmds)
+        self.timer.sync()
+        out: List[bytes] = []
+        for cmd in cmds:
+            # lock/busy policy
+            pol = is_allowed(state.motion, cmd)
+            if not pol.allowed:
+                if pol.immediate_reply is not None:
+                    out.append(pol.immediate_reply)
+                    stats.naks += 1
+                continue
+
+            # apply command
+            reply = apply_command(state, cmd, cfg)
+            if reply is not None:
+                out.append(reply)
+        self.timer.reschedule()
+        if out:
+            stats.replies += len(out)
+            stats.bytes_out += sum(map(len, out))
+        return out
+
+    def close(self) -> None:
+        self.stats.sessions_active -= 1
+        self.timer.close()
+
+
+async def client_session(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, cfg: EmulatorConfig,
+                         scheduler: Scheduler, stats: Optional[ServerStats] = None) -> None:
+    session = Session(cfg, scheduler, stats if stats is not None else ServerStats())
+
+    # drain() only blocks above the high-water mark, and resumes below the low one
+    writer.transport.set_write_buffer_limits(high=cfg.write_high_water, low=cfg.write_low_water)
 
     try:
         while True:
@@ -30,37 +91,108 @@ async def client_session(reader: asyncio.StreamReader, writer: asyncio.StreamWri
             if not data:
                 break
 
-            cmds = parser.feed(data)
-            for cmd in cmds:
-                # lock/busy policy
-                pol = is_allowed(state.motion, cmd)
-                if not pol.allowed:
-                    if pol.immediate_reply is not None:
-                        writer.write(pol.immediate_reply)
-                        await writer.drain()
-                    continue
-
-                # apply command
-                state, reply = handle_command(state, cmd, cfg)
-                if reply is not None:
+            out = session.handle(data)
+            if not out:
+                continue
+            if cfg.write_coalesce:
+                # replies in command order, one gather-write and one drain per batch
+                writer.writelines(out)
+                await writer.drain()
+            else:
+                for reply in out:
                     writer.write(reply)
                     await writer.drain()
     finally:
-        tick_task.cancel()
-        try:
-            await tick_task
-        except asyncio.CancelledError:
-            pass
+        session.close()
         writer.close()
         await writer.wait_closed()
 
 
-async def run_server(host: str, port: int, cfg: EmulatorConfig) -> None:
-    server = await asyncio.start_server(lambda r, w: client_session(r, w, cfg), host, port)
+class EmulatorProtocol(asyncio.Protocol):
+    """
+    asyncio.Protocol transport path: data_received feeds the parser directly,
+    with no StreamReader buffer or per-read coroutine in between. Flow control
+    pauses reading while the write buffer is above the high-water mark.
+    """
+
+    def __init__(self, cfg: EmulatorConfig, scheduler: Scheduler, stats: ServerStats) -> None:
+        self.cfg = cfg
+        self.scheduler = scheduler
+        self.stats = stats
+        self.transport: Optional[asyncio.Transport] = None
+        self.session: Optional[Session] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+        transport.set_write_buffer_limits(high=self.cfg.write_high_water, low=self.cfg.write_low_water)  # type: ignore[attr-defined]
+        self.session = Session(self.cfg, self.scheduler, self.stats)
+
+    def data_received(self, data: bytes) -> None:
+        out = self.session.handle(data)
+        if not out:
+            return
+        if self.cfg.write_coalesce:
+            self.transport.writelines(out)
+        else:
+            for reply in out:
+                self.transport.write(reply)
+
+    def pause_writing(self) -> None:
+        self.transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self.transport.resume_reading()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+
+async def run_server(host: str, port: int, cfg: EmulatorConfig, reuse_port: bool = False,
+                     stats: Optional[ServerStats] = None, started: Optional[asyncio.Future] = None) -> None:
+    """
+    Serve until cancelled. reuse_port lets several worker processes bind the same port.
+    started, if given, receives the bound (host, port) once listening.
+    """
+    if stats is None:
+        stats = ServerStats()
+    # one simulation clock and one scheduler coroutine for all sessions
+    scheduler = Scheduler(SimClock(time_scale=cfg.time_scale))
+    sched_task = asyncio.create_task(scheduler.run())
+    if cfg.transport == "protocol":
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(
+            lambda: EmulatorProtocol(cfg, scheduler, stats), host, port, reuse_port=reuse_port or None)
+    else:
+        server = await asyncio.start_server(
+            lambda r, w: client_session(r, w, cfg, scheduler, stats), host, port, reuse_port=reuse_port or None)
     addrs = ", ".join(str(sock.getsockname()) for sock in server.sockets or [])
-    print(f"ScopeBoss emulator listening on {addrs}")
-    async with server:
-        await server.serve_forever()
+    print(f"ScopeBoss emulator listening on {addrs} (time scale {cfg.time_scale:g}x, "
+          f"{cfg.transport} transport, {type(asyncio.get_running_loop()).__module__} loop)")
+    if started is not None:
+        started.set_result(server.sockets[0].getsockname()[:2])
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        sched_task.cancel()
+
+
+def loop_factory(name: str) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Event loop for asyncio.run(): 'asyncio' (stdlib), 'uvloop' (must be
+    installed) or 'auto' (uvloop when importable, else stdlib).
+    """
+    if name == "asyncio":
+        return None
+    try:
+        import uvloop  # optional, not a project dependency
+    except ImportError:
+        if name == "uvloop":
+            raise SystemExit("event loop 'uvloop' requested but uvloop is not installed")
+        return None
+    return uvloop.new_event_loop
 
 
 def main():
@@ -68,10 +200,32 @@ def main():
     ap.add_argument("--host", default="127.0.0.1")
     ap.add_argument("--port", default=4030, type=int)
     ap.add_argument("--config", default=None)
+    ap.add_argument("--time-scale", default=None, type=float,
+                    help="simulation clock speed factor, e.g. 10 for 10x faster park/home (overrides config)")
+    ap.add_argument("--workers", default=1, type=int,
+                    help="worker processes sharing the port via SO_REUSEPORT (default: 1, single process)")
+    ap.add_argument("--stats-interval", default=10.0, type=float,
+                    help="seconds between aggregated stats lines in --workers mode (default: 10)")
+    ap.add_argument("--transport", default=None, choices=TRANSPORTS,
+                    help="connection handling: streams (StreamReader/Writer, default) or protocol (asyncio.Protocol)")
+    ap.add_argument("--loop", default=None, choices=EVENT_LOOPS,
+                    help="event loop: asyncio (default), uvloop, or auto (uvloop if installed)")
     args = ap.parse_args()
 
     cfg = load_config(args.config)
-    asyncio.run(run_server(args.host, args.port, cfg))
+    if args.time_scale is not None:
+        cfg = replace(cfg, time_scale=args.time_scale)
+    if args.transport is not None:
+        cfg = replace(cfg, transport=args.transport)
+    if args.loop is not None:
+        cfg = replace(cfg, event_loop=args.loop)
+    if args.workers > 1:
+        loop_factory(cfg.event_loop)  # fail fast in the supervisor, not in every worker
+        from .workers import run_workers
+        run_workers(args.host, args.port, cfg, args.workers, stats_interval=args.stats_interval)
+        return
+    factory = loop_factory(cfg.event_loop)
+    asyncio.run(run_server(args.host, args.port, cfg), loop_factory=factory)
 
 if __name__ == "__main__":
     main()
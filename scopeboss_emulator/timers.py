@@ -0,0 +1,160 @@
+
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+from typing import List, Optional, Tuple
+
+from .config import EmulatorConfig
+from .core.state import MutableTelescopeState
+from .core.reducer import advance, next_deadline
+
+TICK_MS = 50
+
+
+class SimClock:
+    """
+    Server-wide simulation clock shared by all sessions.
+
+    Sim time is loop time since start, in ms, multiplied by time_scale (e.g. 10
+    makes a 5 s park finish in 0.5 s of wall time), quantized to tick_ms so the
+    fixed-tick model is preserved.
+    """
+
+    def __init__(self, time_scale: float = 1.0, tick_ms: int = TICK_MS,
+                 loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        if time_scale <= 0:
+            raise ValueError(f"time_scale must be > 0, got {time_scale}")
+        self.time_scale = time_scale
+        self.tick_ms = tick_ms
+        self.loop = loop or asyncio.get_running_loop()
+        self.origin = self.loop.time()
+
+    def tick_now_ms(self) -> int:
+        """Sim time of the most recent tick at the current loop time."""
+        elapsed_ms = (self.loop.time() - self.origin) * 1000.0 * self.time_scale
+        return int(elapsed_ms // self.tick_ms) * self.tick_ms
+
+    def loop_time(self, sim_ms: int) -> float:
+        """Loop time at which sim time reaches sim_ms."""
+        return self.origin + sim_ms / (1000.0 * self.time_scale)
+
+
+class Scheduler:
+    """
+    One deadline heap and one coroutine for every session on the server.
+
+    Sessions push (wake_ms, ...) entries; run() sleeps until the earliest one
+    and fire_due() advances every session that is due in a single pass.
+    Re-arming a session bumps its generation, so superseded heap entries are
+    skipped lazily instead of being removed.
+    """
+
+    def __init__(self, clock: SimClock) -> None:
+        self.clock = clock
+        self._heap: List[Tuple[int, int, SessionTimer, int]] = []
+        self._seq = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+        self.passes = 0
+
+    def schedule(self, timer: SessionTimer, wake_ms: int) -> None:
+        head = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (wake_ms, next(self._seq), timer, timer._gen))
+        if self._changed is not None and (head is None or wake_ms < head):
+            self._changed.set()
+
+    def next_wake_ms(self) -> Optional[int]:
+        heap = self._heap
+        while heap and heap[0][3] != heap[0][2]._gen:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def fire_due(self, at_ms: Optional[int] = None) -> int:
+        """Advance every session whose wake tick has been reached. Returns the count fired."""
+        now_ms = self.clock.tick_now_ms()
+        if at_ms is not None:
+            now_ms = max(now_ms, at_ms)
+        heap = self._heap
+        fired: List[SessionTimer] = []
+        while heap and heap[0][0] <= now_ms:
+            _, _, timer, gen = heapq.heappop(heap)
+            if gen == timer._gen:
+                timer._gen += 1
+                fired.append(timer)
+        for timer in fired:
+            timer.wakeups += 1
+            timer._advance_to(now_ms)
+            timer.reschedule()
+        self.passes += 1
+        return len(fired)
+
+    async def run(self) -> None:
+        self._changed = asyncio.Event()
+        loop = self.clock.loop
+        while True:
+            wake_ms = self.next_wake_ms()
+            if wake_ms is None:
+                await self._changed.wait()
+                self._changed.clear()
+                continue
+            delay = self.clock.loop_time(wake_ms) - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._changed.wait(), delay)
+                    # an earlier deadline arrived; recompute the sleep
+                    self._changed.clear()
+                    continue
+                except TimeoutError:
+                    pass
+            # the wait may end up to one clock resolution early; the wake tick is authoritative
+            self.fire_due(at_ms=wake_ms)
+
+
+class SessionTimer:
+    """
+    Per-session view of the shared clock; replaces the per-session fixed ticker.
+
+    The simulation is still the fixed-tick model (now_ms advances in tick_ms
+    steps, timers fire on the first tick at or after their deadline) but is
+    evaluated lazily: sync() jumps state.now_ms to the current tick before
+    commands are applied, and the session is queued on the Scheduler only for
+    the tick where its next live deadline fires. Idle sessions queue nothing.
+    """
+
+    def __init__(self, state: MutableTelescopeState, cfg: EmulatorConfig, scheduler: Scheduler) -> None:
+        self.state = state
+        self.cfg = cfg
+        self.scheduler = scheduler
+        self.wakeups = 0
+        self._gen = 0
+        self._wake_ms: Optional[int] = None
+
+    def sync(self) -> None:
+        """Bring state.now_ms up to the current tick, firing any due timers."""
+        self._advance_to(self.scheduler.clock.tick_now_ms())
+
+    def reschedule(self) -> None:
+        """Arm (or disarm) the wakeup for the state's next live deadline."""
+        due = next_deadline(self.state, self.cfg)
+        if due is None:
+            self.close()
+            return
+        # first tick at/after the deadline, and strictly after the current tick
+        tick = self.scheduler.clock.tick_ms
+        wake_ms = max(-(-due // tick) * tick, self.state.now_ms + tick)
+        if wake_ms == self._wake_ms:
+            return
+        self._gen += 1
+        self._wake_ms = wake_ms
+        self.scheduler.schedule(self, wake_ms)
+
+    def close(self) -> None:
+        if self._wake_ms is not None:
+            self._gen += 1
+            self._wake_ms = None
+
+    def _advance_to(self, now_ms: int) -> None:
+        if self._wake_ms is not None and self._wake_ms <= now_ms:
+            self._wake_ms = None
+        if now_ms > self.state.now_ms:
+            advance(self.state, now_ms - self.state.now_ms, self.cfg)
@@ -0,0 +1,192 @@
+
+from __future__ import annotations
+import asyncio
+import multiprocessing as mp
+import os
+import queue
+import sys
+import time
+from dataclasses import asdict, fields
+from typing import Callable, Dict, List, Optional
+
+from .config import EmulatorConfig
+from .server import ServerStats, run_server, loop_factory
+
+RESTART_BACKOFF_S = 1.0       # delay after a worker exits, doubled per consecutive fast failure
+RESTART_BACKOFF_MAX_S = 60.0  # cap on that delay
+HEALTHY_UPTIME_S = 10.0       # a worker that ran this long resets its slot's backoff
+MAX_FAST_FAILURES = 8         # give up on a slot after this many fast failures in a row
+REPORT_INTERVAL_S = 1.0       # how often each worker pushes its counters
+
+
+async def _serve_and_report(idx: int, host: str, port: int, cfg: EmulatorConfig, reports) -> None:
+    stats = ServerStats()
+    server_task = asyncio.create_task(run_server(host, port, cfg, reuse_port=True, stats=stats))
+    try:
+        while not server_task.done():
+            await asyncio.sleep(REPORT_INTERVAL_S)
+            reports.put((idx, os.getpid(), asdict(stats)))
+        await server_task
+    finally:
+        server_task.cancel()
+
+
+def _worker_main(idx: int, host: str, port: int, cfg: EmulatorConfig, reports) -> None:
+    """Entry point of one worker process: its own event loop and sessions."""
+    try:
+        factory = loop_factory(cfg.event_loop)
+        asyncio.run(_serve_and_report(idx, host, port, cfg, reports), loop_factory=factory)
+    except KeyboardInterrupt:
+        pass
+
+
+def aggregate_stats(latest: Dict[int, dict], retired: dict) -> dict:
+    """
+    Sum the latest report of every live worker with counters carried over from
+    workers that have exited. sessions_active only counts live workers.
+    """
+    total = {f.name: retired.get(f.name, 0) for f in fields(ServerStats)}
+    total["sessions_active"] = 0
+    for rep in latest.values():
+        for k, v in rep.items():
+            total[k] += v
+    return total
+
+
+def retire(latest: Dict[int, dict], retired: dict, idx: int) -> None:
+    """Fold a dead worker's last report into the retired totals."""
+    rep = latest.pop(idx, None)
+    if rep is None:
+        return
+    for k, v in rep.items():
+        if k != "sessions_active":
+            retired[k] = retired.get(k, 0) + v
+
+
+class RestartPolicy:
+    """
+    When to restart each worker slot. The delay runs from the exit, starts at
+    base_s and doubles (up to max_s) for every consecutive exit within
+    healthy_s of starting; after max_fast_failures of those the slot is given
+    up (e.g. the port is busy or SO_REUSEPORT is unavailable).
+    """
+
+    def __init__(self, n: int, base_s: float = RESTART_BACKOFF_S, max_s: float = RESTART_BACKOFF_MAX_S,
+                 healthy_s: float = HEALTHY_UPTIME_S, max_fast_failures: int = MAX_FAST_FAILURES) -> None:
+        self.base_s = base_s
+        self.max_s = max_s
+        self.healthy_s = healthy_s
+        self.max_fast_failures = max_fast_failures
+        self.fast_failures = [0] * n
+        self.restart_at: List[Optional[float]] = [None] * n
+
+    def exited(self, idx: int, uptime: float, now: float) -> Optional[float]:
+        """Record an exit; the restart delay, or None if the slot is given up."""
+        if uptime >= self.healthy_s:
+            self.fast_failures[idx] = 0
+        else:
+            self.fast_failures[idx] += 1
+            if self.fast_failures[idx] >= self.max_fast_failures:
+                self.restart_at[idx] = None
+                return None
+        delay = min(self.max_s, self.base_s * 2 ** max(0, self.fast_failures[idx] - 1))
+        self.restart_at[idx] = now + delay
+        return delay
+
+    def due(self, idx: int, now: float) -> bool:
+        at = self.restart_at[idx]
+        if at is None or now < at:
+            return False
+        self.restart_at[idx] = None
+        return True
+
+
+def check_workers(procs: list, started_at: List[float], policy: RestartPolicy, now: float,
+                  start: Callable[[int], None], latest: Dict[int, dict], retired: dict) -> int:
+    """
+    Retire workers that have exited, schedule their restart with policy and
+    start the ones that are due. Returns the number of workers started.
+    """
+    started = 0
+    for i, p in enumerate(procs):
+        if p is not None and not p.is_alive():
+            delay = policy.exited(i, now - started_at[i], now)
+            if delay is None:
+                print(f"Supervisor: worker {i} (pid {p.pid}) exited with code {p.exitcode}; "
+                      f"{policy.max_fast_failures} fast failures in a row, not restarting", file=sys.stderr)
+            else:
+                print(f"Supervisor: worker {i} (pid {p.pid}) exited with code {p.exitcode}; "
+                      f"restarting in {delay:g} s", file=sys.stderr)
+            retire(latest, retired, i)
+            procs[i] = None
+        if procs[i] is None and policy.due(i, now):
+            start(i)
+            started += 1
+    return started
+
+
+def _format_stats(total: dict, alive: int, restarts: int) -> str:
+    return (f"[workers] alive={alive} restarts={restarts} "
+            + " ".join(f"{k}={v}" for k, v in total.items()))
+
+
+def run_workers(host: str, port: int, cfg: EmulatorConfig, n: int, stats_interval: float = 10.0) -> None:
+    """
+    Supervisor: start n worker processes that each bind host:port with
+    SO_REUSEPORT (the kernel spreads connections across them), restart any
+    that exit (with backoff, see RestartPolicy), and print aggregated stats every stats_interval seconds.
+    """
+    ctx = mp.get_context("fork" if sys.platform.startswith("linux") else "spawn")
+    reports = ctx.Queue()
+    procs: List[Optional[mp.process.BaseProcess]] = [None] * n
+    started_at = [0.0] * n
+    policy = RestartPolicy(n)
+    latest: Dict[int, dict] = {}
+    retired: dict = {}
+    restarts = 0
+
+    def start(idx: int) -> None:
+        p = ctx.Process(target=_worker_main, args=(idx, host, port, cfg, reports),
+                        name=f"scopeboss-worker-{idx}", daemon=True)
+        p.start()
+        procs[idx] = p
+        started_at[idx] = time.monotonic()
+
+    for i in range(n):
+        start(i)
+    print(f"Supervisor: {n} workers on {host}:{port} (SO_REUSEPORT)")
+
+    next_report = time.monotonic() + stats_interval
+    try:
+        while True:
+            try:
+                msg = reports.get(timeout=0.5)
+                while True:
+                    idx, pid, rep = msg
+                    # drop late reports from a worker that has already been replaced
+                    if procs[idx] is not None and procs[idx].pid == pid:
+                        latest[idx] = rep
+                    msg = reports.get_nowait()
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            restarts += check_workers(procs, started_at, policy, now, start, latest, retired)
+            if all(p is None for p in procs) and all(at is None for at in policy.restart_at):
+                print("Supervisor: every worker slot has given up; exiting", file=sys.stderr)
+                break
+
+            if now >= next_report:
+                alive = sum(1 for p in procs if p is not None and p.is_alive())
+                print(_format_stats(aggregate_stats(latest, retired), alive, restarts))
+                next_report = now + stats_interval
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for p in procs:
+            if p is not None and p.is_alive():
+                p.terminate()
+        for p in procs:
+            if p is not None:
+                p.join(timeout=2.0)
+        print(_format_stats(aggregate_stats(latest, retired), 0, restarts))
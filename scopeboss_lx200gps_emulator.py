@@ -16,7 +16,7 @@ Protocol grounding:
 - Operational guidance: after Park, you can power off (wait for motors to stop). 4
 """
 
-from future import annotations
+from __future__ import annotations
 
 import argparse
 import asyncio
@@ -116,7 +116,7 @@ class StreamParser:
     and CmdFrame for ASCII frames terminated with '#'.
     """
 
-    def init(self, max_len: int = 256):
+    def __init__(self, max_len: int = 256):
         self.max_len = max_len
         self.buf = bytearray()
 
@@ -508,6 +508,6 @@ def main():
     asyncio.run(run_server(cfg))
 
 
-if name == "main":
+if __name__ == "__main__":
     main()
 
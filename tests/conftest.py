@@ -1,6 +1,8 @@
 """
 Shared fixtures for scopeboss_emulator tests.
 Uses a fast-timer config so reducer/tick tests complete without sleep.
+quiet_v2_log mutes lx200emulator_v2's background log writer, whose lines would
+otherwise land after the test that logged them (or in another test's capture).
 """
 from __future__ import annotations
 
@@ -37,3 +39,17 @@ def idle_state() -> TelescopeState:
         motion=MotionState.IDLE_TRACKING,
         timers=Timers(),
     )
+
+
+@pytest.fixture
+def quiet_v2_log():
+    """lx200emulator_v2 with every log category off for the duration of the test."""
+    import lx200emulator_v2 as v2
+    from buffered_log import OFF
+
+    saved = dict(v2.LOG.levels), v2.LOG.default_level
+    v2.LOG.default_level = OFF
+    v2.LOG.levels.clear()
+    yield v2
+    v2.LOG.levels.update(saved[0])
+    v2.LOG.default_level = saved[1]
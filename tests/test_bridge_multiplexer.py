@@ -0,0 +1,211 @@
+"""
+net2serial_bridge.SerialMultiplexer with several TCP clients on an ephemeral port and a
+scripted mount on a pty: replies go back to the client that asked, commands without a
+reply are not waited for, lost replies time out, and the reply cache skips the serial line
+for read-only queries until their TTL runs out or a state-changing command clears it.
+Traffic goes to a binary capture with one client id per connection.
+"""
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("serial")
+tty = pytest.importorskip("tty")
+
+from capture import CaptureReader, CaptureWriter
+from net2serial_bridge import ReplyCache, SerialMultiplexer, split_frames
+
+REPLIES = {
+    b":GR#": b"12:34:56#",
+    b":GD#": b"+10*00'00#",
+    b":GVP#": b"LX200GPS#",
+    b":Sr12:00:00#": b"1",
+    b":MS#": b"0",
+    b":Q#": b"",           # no reply
+    b":GW#": None,         # mount never answers
+    b":XY#": b"ABC",       # not in the spec: undelimited reply
+}
+
+
+class ScriptedMount(threading.Thread):
+    """Answers complete frames on the pty's mount end after a serial-ish delay."""
+
+    def __init__(self, fd: int, delay: float = 0.002):
+        super().__init__(daemon=True)
+        self.fd = fd
+        self.delay = delay
+        self.received: list[bytes] = []
+        self.stop = threading.Event()
+
+    def run(self):
+        buf = bytearray()
+        while not self.stop.is_set():
+            try:
+                data = os.read(self.fd, 4096)
+            except OSError:
+                return
+            buf += data
+            for frame in split_frames(buf):
+                self.received.append(frame)
+                reply = REPLIES.get(frame)
+                if reply:
+                    time.sleep(self.delay)
+                    os.write(self.fd, reply)
+
+
+@pytest.fixture
+def bridge(request, tmp_path):
+    cache = getattr(request, "param", None)
+    capture = CaptureWriter(tmp_path / "bridge.lxcap")
+    mount_fd, port_fd = os.openpty()
+    tty.setraw(port_fd)
+    mount = ScriptedMount(mount_fd)
+    mount.start()
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    mux = SerialMultiplexer(server, port_fd, capture, cache=cache, reply_timeout=0.3, quiet=0.03)
+    quit_event = threading.Event()
+    thread = threading.Thread(target=mux.serve, args=(quit_event,), daemon=True)
+    thread.start()
+    yield mux, mount, server.getsockname()
+    quit_event.set()
+    thread.join(2.0)
+    capture.close()
+    mount.stop.set()
+    server.close()
+    os.close(port_fd)
+    os.close(mount_fd)
+
+
+def _connect(addr) -> socket.socket:
+    s = socket.create_connection(addr, timeout=2.0)
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return s
+
+
+def _recv_exactly(sock: socket.socket, n: int) -> bytes:
+    buf = b""
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def test_replies_are_routed_to_the_sender(bridge):
+    _mux, _mount, addr = bridge
+    rounds = 30
+    work = {b":GR#": REPLIES[b":GR#"], b":GD#": REPLIES[b":GD#"], b":GVP#": REPLIES[b":GVP#"]}
+    results = {}
+
+    def client(cmd, reply):
+        with _connect(addr) as s:
+            s.sendall(cmd * rounds)              # pipelined
+            results[cmd] = _recv_exactly(s, len(reply) * rounds)
+
+    threads = [threading.Thread(target=client, args=item) for item in work.items()]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10.0)
+    assert results == {cmd: reply * rounds for cmd, reply in work.items()}
+
+
+def test_reply_formats_from_the_spec(bridge):
+    mux, mount, addr = bridge
+    with _connect(addr) as s:
+        s.sendall(b":Q#:Sr12:00:00#:MS#\x06:GR#")
+        # ACK is not answered by this mount: it times out and the queue moves on
+        assert _recv_exactly(s, 2 + len(REPLIES[b":GR#"])) == b"10" + REPLIES[b":GR#"]
+        s.sendall(b":XY#:GD#")
+        assert _recv_exactly(s, 3 + len(REPLIES[b":GD#"])) == b"ABC" + REPLIES[b":GD#"]
+    assert mux.timeouts == 1
+
+
+def test_lost_reply_times_out(bridge):
+    mux, _mount, addr = bridge
+    with _connect(addr) as s:
+        t0 = time.monotonic()
+        s.sendall(b":GW#:GR#")
+        assert _recv_exactly(s, len(REPLIES[b":GR#"])) == REPLIES[b":GR#"]
+        assert 0.25 < time.monotonic() - t0 < 2.0
+    assert mux.timeouts == 1
+
+
+@pytest.mark.parametrize("bridge", [ReplyCache(ttl=10.0)], indirect=True)
+def test_cache_answers_repeated_queries(bridge):
+    mux, mount, addr = bridge
+    with _connect(addr) as s:
+        for _ in range(5):
+            s.sendall(b":GR#")
+            assert _recv_exactly(s, len(REPLIES[b":GR#"])) == REPLIES[b":GR#"]
+    assert mount.received.count(b":GR#") == 1
+    stats = mux.cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (4, 1, 0.8)
+    assert stats["serial_s_saved"] > 0
+
+
+@pytest.mark.parametrize("bridge", [ReplyCache(ttl=0.15, static_ttl=10.0)], indirect=True)
+def test_cache_ttls_and_invalidation(bridge):
+    mux, mount, addr = bridge
+
+    def ask(s, cmd):
+        s.sendall(cmd)
+        reply = REPLIES[cmd]
+        assert _recv_exactly(s, len(reply)) == reply
+
+    with _connect(addr) as s:
+        for cmd in (b":GR#", b":GVP#", b":GR#", b":GVP#"):
+            ask(s, cmd)
+        time.sleep(0.2)                         # :GR# (volatile) expires, :GVP# (static) does not
+        ask(s, b":GR#")
+        ask(s, b":GVP#")
+        ask(s, b":Sr12:00:00#")                 # may change state: clears everything
+        ask(s, b":GVP#")
+        ask(s, b":XY#")                         # not in the spec: never cached, and
+        ask(s, b":XY#")                         # may change state too
+    assert mount.received.count(b":GR#") == 2
+    assert mount.received.count(b":GVP#") == 2
+    assert mount.received.count(b":XY#") == 2
+    assert mux.cache.invalidations == 2          # :Sr, then the first :XY# (after :GVP# was cached again)
+
+
+def test_cache_classification():
+    cache = ReplyCache(ttl=0.5, static_ttl=60.0, overrides={b":GW#": 0.0})
+    assert cache.ttl_for(b":GR#") == 0.5
+    assert cache.ttl_for(b":GVP#") == 60.0
+    assert cache.ttl_for(b":h?#") == 0.5
+    assert cache.ttl_for(b":GW#") == 0.0        # override
+    assert cache.ttl_for(b":Sd+10*00#") == 0.0  # mutating
+    assert cache.ttl_for(b":?+#") == 0.0        # moves the help cursor
+
+
+def test_capture_records_raw_bytes_per_client(bridge):
+    mux, _mount, addr = bridge
+    with _connect(addr) as a, _connect(addr) as b:
+        a.sendall(b":GR#")
+        assert _recv_exactly(a, len(REPLIES[b":GR#"])) == REPLIES[b":GR#"]
+        b.sendall(b":XY#")
+        assert _recv_exactly(b, 3) == b"ABC"
+    mux.log.close()
+    got = []
+    with CaptureReader(mux.log.path) as r:
+        for rec in r:                           # a reply may take more than one serial read
+            if got and got[-1][:2] == (rec.direction, rec.client):
+                got[-1] = (rec.direction, rec.client, got[-1][2] + rec.data)
+            else:
+                got.append((rec.direction, rec.client, rec.data))
+    assert got == [("W", 1, b":GR#"), ("R", 1, REPLIES[b":GR#"]), ("W", 2, b":XY#"), ("R", 2, b"ABC")]
+
+
+def test_split_frames():
+    buf = bytearray(b"\x06:GR#:Sr12:00:00#:GD")
+    assert split_frames(buf) == [b"\x06", b":GR#", b":Sr12:00:00#"]
+    assert buf == b":GD"
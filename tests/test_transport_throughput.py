@@ -0,0 +1,55 @@
+"""
+In-process throughput comparison of the Streams and Protocol transports.
+Starts scopeboss_emulator.server on an ephemeral port (no external server needed),
+checks both transports return identical bytes, and prints commands/sec (-s).
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import replace
+
+import pytest
+
+from scopeboss_emulator.config import EmulatorConfig
+from scopeboss_emulator.server import run_server
+
+BATCH = b"\x06:h?#:F2#:XX#" * 8   # 8 x (ACK, home status, focus speed, unknown)
+REPLY = b"P0" * 8
+ROUNDS = 300
+
+
+async def _measure(cfg: EmulatorConfig) -> tuple[bytes, float]:
+    loop = asyncio.get_running_loop()
+    started = loop.create_future()
+    server_task = asyncio.create_task(run_server("127.0.0.1", 0, cfg, started=started))
+    host, port = await started
+    reader, writer = await asyncio.open_connection(host, port)
+    received = bytearray()
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        writer.write(BATCH)
+        want = len(received) + len(REPLY)
+        while len(received) < want:
+            received += await reader.read(4096)
+    dt = time.perf_counter() - t0
+    writer.close()
+    await writer.wait_closed()
+    server_task.cancel()
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+    return bytes(received), ROUNDS * BATCH.count(b"#") / dt
+
+
+@pytest.mark.asyncio
+async def test_streams_and_protocol_transports_agree_and_report_throughput():
+    results = {}
+    for transport in ("streams", "protocol"):
+        cfg = replace(EmulatorConfig(), transport=transport)
+        received, rate = await _measure(cfg)
+        assert received == REPLY * ROUNDS
+        results[transport] = rate
+    print("  ".join(f"{k}={v:,.0f} cmd/s" for k, v in results.items())
+          + f"  protocol/streams={results['protocol'] / results['streams']:.2f}x")
@@ -0,0 +1,131 @@
+"""
+Unit tests for buffered_log.BufferedLog: deferred formatting, per-category levels,
+batched writes with one flush per batch, drop counting on overflow, drain on close,
+no writer wakeups while the queue is empty.
+"""
+from __future__ import annotations
+
+import io
+import threading
+import time
+
+import pytest
+
+from buffered_log import DEBUG, INFO, OFF, BufferedLog, parse_levels
+
+pytestmark = pytest.mark.unit
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+def _plain(record):
+    _ts, category, _level, msg, args = record
+    return f"{category}:{msg % args if args else msg}\n"
+
+
+def test_records_are_written_in_order_with_one_flush_per_batch():
+    out = CountingStream()
+    log = BufferedLog(out, formatter=_plain, flush_interval=60.0)
+    for i in range(100):
+        log.log("commands", "CMD [%d]", i)
+    log.close()
+    lines = out.getvalue().splitlines()
+    assert lines == [f"commands:CMD [{i}]" for i in range(100)]
+    assert out.flushes == 1
+    assert log.stats() == {"queued": 0, "written": 100, "dropped": 0}
+
+
+def test_category_levels_filter_before_formatting():
+    class Exploding:
+        def __repr__(self):
+            raise AssertionError("formatted a filtered record")
+
+    out = io.StringIO()
+    log = BufferedLog(out, formatter=_plain, levels={"tx": OFF, "motion": DEBUG})
+    log.log("tx", "TX [%r]", Exploding())
+    log.log("motion", "step", level=DEBUG)
+    log.log("commands", "detail", level=DEBUG)       # default level INFO
+    log.log("commands", "CMD [:GR#]")
+    assert not log.enabled("tx") and log.enabled("motion", DEBUG)
+    log.close()
+    assert out.getvalue().splitlines() == ["motion:step", "commands:CMD [:GR#]"]
+
+
+def test_overflow_drops_and_reports_count():
+    out = io.StringIO()
+    log = BufferedLog(out, formatter=_plain, max_queue=10)
+    log._queue.extend((0.0, "commands", INFO, "%d", (i,)) for i in range(10))   # writer not started yet
+    for i in range(10, 25):
+        log.log("commands", "%d", i)
+    log.close()
+    text = out.getvalue()
+    assert log.dropped == 15
+    assert text.splitlines()[:10] == [f"commands:{i}" for i in range(10)]
+    assert "15 record(s) dropped" in text
+
+
+def test_drops_are_counted_exactly_across_threads():
+    log = BufferedLog(io.StringIO(), formatter=_plain, max_queue=10)
+    log._queue.extend((0.0, "commands", INFO, "%d", (i,)) for i in range(10))   # full, writer not started
+
+    def spam():
+        for i in range(2000):
+            log.log("commands", "%d", i)
+
+    threads = [threading.Thread(target=spam) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert log.dropped == 16000
+    assert len(log._queue) == 10
+    log.close()
+
+
+def test_flush_waits_for_writer_and_close_ignores_later_records():
+    out = io.StringIO()
+    log = BufferedLog(out, formatter=_plain, flush_interval=60.0)
+    log.log("display", "Display: [%s]", "Object")
+    log.flush()
+    assert out.getvalue() == "display:Display: [Object]\n"
+    log.close()
+    log.log("display", "late")
+    assert out.getvalue() == "display:Display: [Object]\n"
+
+
+def test_idle_writer_sleeps_until_the_next_record():
+    class CountingLog(BufferedLog):
+        batches = 0
+
+        def _write_batch(self):
+            self.batches += 1
+            super()._write_batch()
+
+    out = io.StringIO()
+    log = CountingLog(out, formatter=_plain, flush_interval=0.005)
+    log.log("commands", "first")
+    log.flush()
+    time.sleep(0.05)                       # let the writer settle into its idle wait
+    settled = log.batches
+    time.sleep(0.1)                        # 20 flush intervals with nothing queued
+    assert log.batches == settled
+    log.log("commands", "second")          # a record on an empty queue wakes it
+    deadline = time.monotonic() + 2.0
+    while "second" not in out.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert out.getvalue() == "commands:first\ncommands:second\n"
+    log.close()
+
+
+def test_parse_levels():
+    assert parse_levels("commands=off, tx=debug") == {"commands": OFF, "tx": DEBUG}
+    assert parse_levels("") == {}
+    with pytest.raises(ValueError):
+        parse_levels("commands=loud")
@@ -0,0 +1,113 @@
+"""
+Unit tests for capture: binary round trip with raw bytes and client ids, index
+seeks, truncated tails, and the text log / tcpick dump converters.
+"""
+from __future__ import annotations
+
+import pytest
+
+from capture import (
+    CaptureReader,
+    CaptureWriter,
+    Record,
+    build_index,
+    format_text,
+    index_path,
+    read_index,
+    read_text,
+    read_tcpick,
+    write_capture,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_round_trip_keeps_raw_bytes_and_clients(tmp_path):
+    path = tmp_path / "t.lxcap"
+    records = [
+        Record(1_000, "W", 1, b":ED#"),
+        Record(2_000, "R", 1, b"\x97Select Item:\x00\xff#"),
+        Record(3_000, "W", 2, b"\x06"),
+        Record(3_000, "R", 2, b""),
+    ]
+    write_capture(records, path, wall_offset_ns=5)
+    with CaptureReader(path) as r:
+        assert list(r) == records
+        assert r.wall_offset_ns == 5
+
+
+def test_timestamps_never_decrease(tmp_path):
+    path = tmp_path / "t.lxcap"
+    with CaptureWriter(path, wall_offset_ns=0) as w:
+        w.write("W", b":GR#", ts_ns=200)
+        w.write("R", b"12:00:00#", ts_ns=100)      # wall clock stepped back
+    with CaptureReader(path) as r:
+        assert [rec.ts_ns for rec in r] == [200, 200]
+
+
+def test_seek_through_index(tmp_path):
+    path = tmp_path / "t.lxcap"
+    with CaptureWriter(path, wall_offset_ns=0, index_every=10) as w:
+        for i in range(1000):
+            w.write("W" if i % 2 == 0 else "R", b"%d" % i, ts_ns=i * 1_000)
+    entries = read_index(path)
+    assert len(entries) == 100 and entries[3][0] == 30_000
+    with CaptureReader(path) as r:
+        got = list(r.records(start_ns=555_000, end_ns=560_000))
+    assert [rec.data for rec in got] == [b"555", b"556", b"557", b"558", b"559"]
+
+    index_path(path).unlink()                       # missing sidecar is rebuilt
+    with CaptureReader(path) as r:
+        assert next(r.records(start_ns=999_000)).data == b"999"
+    assert read_index(path) == build_index(path) == [(0, entries[0][1])]
+
+
+def test_truncated_tail_ends_the_capture(tmp_path):
+    path = tmp_path / "t.lxcap"
+    write_capture([Record(i, "R", 0, b"12:34:56#") for i in range(3)], path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-4])
+    with CaptureReader(path) as r:
+        assert len(list(r)) == 2
+    path.write_bytes(b"not a capture")
+    with pytest.raises(ValueError):
+        CaptureReader(path)
+
+
+def test_text_log_round_trip():
+    text = (b"1772468644.490:W::GR#\n"
+            b"1772468644.711:R:\x04\x16#\n"
+            b"1772468645.049:R:line one\n"
+            b"line two#\n")
+    records = list(read_text(text.splitlines(keepends=True)))
+    assert records == [
+        Record(1772468644_490_000_000, "W", 0, b":GR#"),
+        Record(1772468644_711_000_000, "R", 0, b"\x04\x16#"),
+        Record(1772468645_049_000_000, "R", 0, b"line one\nline two#"),
+    ]
+    assert b"".join(format_text(rec) for rec in records) == text
+
+
+def test_tcpick_dump():
+    dump = [
+        b"Starting tcpick 0.2.1 at 2023-10-14 12:42 CEST\n",
+        b"\x00\x00_hap\x04_tcp\x05local\n",                  # mDNS noise outside any session
+        b"1      ESTABLISHED    192.168.178.227:49185 > 192.168.178.20:4030\n",
+        b":SF021#:GF#:G0#\n",
+        b"\x9f   Welcome to  \n",
+        b":     Object    \n",                               # display text, not a command
+        b"\x06\n",
+        b"1      CLOSED         192.168.178.227:49185 > 192.168.178.20:4030\n",
+        b"2      ESTABLISHED    192.168.178.227:49189 > 192.168.178.20:4030\n",
+        b":GVP#\n",
+    ]
+    records = list(read_tcpick(dump))
+    assert [(r.direction, r.client, r.data) for r in records] == [
+        ("W", 1, b":SF021#:GF#:G0#"),
+        ("R", 1, b"\x9f   Welcome to  "),
+        ("R", 1, b":     Object    "),
+        ("W", 1, b"\x06"),
+        ("W", 2, b":GVP#"),
+    ]
+    assert records[0].ts_ns == 1697287320 * 10**9
+    assert records[1].ts_ns - records[0].ts_ns == 1_000_000
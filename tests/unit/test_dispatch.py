@@ -0,0 +1,89 @@
+"""
+Unit tests for CommandRegistry: exact lookup, prefix trie, registration errors,
+and how many handlers a dispatch reaches. No TCP or server required.
+Timings live in benchmarks/bench_dispatch.py.
+"""
+from __future__ import annotations
+
+import pytest
+
+from scopeboss_emulator.core.dispatch import CommandRegistry, UNHANDLED
+from scopeboss_emulator.core.reducer import COMMANDS
+
+pytestmark = pytest.mark.unit
+
+
+def _tag(name):
+    def fn(s, t, cfg):
+        return name.encode("ascii")
+    return fn
+
+
+def test_exact_lookup_beats_prefix(idle_state, fast_cfg):
+    reg = CommandRegistry()
+    reg.register(":GR#")(_tag("exact"))
+    reg.register_prefix(":G")(_tag("family"))
+    assert reg.dispatch(idle_state, ":GR#", fast_cfg) == b"exact"
+    assert reg.dispatch(idle_state, ":GD#", fast_cfg) == b"family"
+
+
+def test_longest_prefix_wins(idle_state, fast_cfg):
+    reg = CommandRegistry()
+    reg.register_prefix(":S")(_tag("S"))
+    reg.register_prefix(":Sr")(_tag("Sr"))
+    assert reg.dispatch(idle_state, ":Sr05:30:30#", fast_cfg) == b"Sr"
+    assert reg.dispatch(idle_state, ":Sd+10*00#", fast_cfg) == b"S"
+
+
+def test_unregistered_returns_unhandled(idle_state, fast_cfg):
+    reg = CommandRegistry()
+    reg.register_prefix(":F")(lambda s, t, cfg: UNHANDLED)  # family declines
+    reg.register(":hP#")(lambda s, t, cfg: None)            # handled, no reply
+    assert reg.dispatch(idle_state, ":XX#", fast_cfg) is UNHANDLED
+    assert reg.dispatch(idle_state, ":F9#", fast_cfg) is UNHANDLED
+    assert reg.dispatch(idle_state, ":hP#", fast_cfg) is None
+
+
+def test_duplicate_registration_rejected():
+    reg = CommandRegistry()
+    reg.register(":hP#")(_tag("a"))
+    with pytest.raises(ValueError):
+        reg.register(":hP#")(_tag("b"))
+    reg.register_prefix(":F")(_tag("a"))
+    with pytest.raises(ValueError):
+        reg.register_prefix(":F")(_tag("b"))
+
+
+def test_reducer_registers_home_and_focus_commands():
+    for t in (":hS#", ":hF#", ":h?#", ":hP#", ":hN#", ":hW#", ":F+#", ":F-#", ":FQ#", ":FF#", ":FS#"):
+        assert t in COMMANDS.exact
+    assert COMMANDS.lookup_prefix(":F3#") is not None
+
+
+def test_dispatch_calls_at_most_one_handler(idle_state, fast_cfg):
+    """Unknown commands reach no handler and known ones exactly one: no scan over the table."""
+    calls = []
+
+    def _counting(name):
+        def fn(s, t, cfg):
+            calls.append(name)
+            return name.encode("ascii")
+        return fn
+
+    reg = CommandRegistry()
+    for i in range(200):
+        reg.register(f":X{i}#")(_counting(f"x{i}"))
+    for prefix in (":F", ":Sr", ":Sd", ":G"):
+        reg.register_prefix(prefix)(_counting(prefix))
+
+    assert reg.dispatch(idle_state, ":ZZ#", fast_cfg) is UNHANDLED
+    assert reg.dispatch(idle_state, ":XX#", fast_cfg) is UNHANDLED
+    assert calls == []
+    assert reg.dispatch(idle_state, ":X199#", fast_cfg) == b"x199"
+    assert reg.dispatch(idle_state, ":Sd+10*00#", fast_cfg) == b":Sd"
+    assert calls == ["x199", ":Sd"]
+
+
+def test_reducer_unknown_command_matches_no_handler():
+    assert ":XX#" not in COMMANDS.exact
+    assert COMMANDS.lookup_prefix(":XX#") is None
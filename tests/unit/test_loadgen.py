@@ -0,0 +1,32 @@
+"""
+Unit tests for benchmarks.loadgen helpers: nearest-rank percentiles and custom
+command mixes. No server required.
+"""
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.loadgen import parse_mix, percentile
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("vals, p, expected", [
+    ([], 50, None),
+    ([7.0], 99, 7.0),
+    ([1.0, 2.0], 50, 1.0),
+    ([1.0, 2.0], 51, 2.0),
+    (list(range(1, 11)), 50, 5),
+    (list(range(1, 11)), 0, 1),
+    (list(range(1, 11)), 100, 10),
+    (list(range(1, 101)), 99, 99),
+    (list(range(1, 101)), 99.5, 100),
+])
+def test_percentile_nearest_rank(vals, p, expected):
+    assert percentile(vals, p) == expected
+
+
+def test_parse_mix():
+    assert parse_mix(":GR#,\\x06=byte,:Q#=none") == [(":GR#", "hash"), ("\x06", "byte"), (":Q#", "none")]
+    with pytest.raises(ValueError):
+        parse_mix(":GR#=line")
@@ -0,0 +1,134 @@
+"""
+Unit tests for lx200_protocol.ProtocolSpec: template heads, frame lookup and reply
+formats derived from MeadeLX200protocol.json, parameter parsing, profile support
+masks, and the precompiled lx200_protocol_table.
+"""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import lx200_protocol_table
+from lx200_protocol import (
+    BYTE,
+    BYTE_OR_HASH,
+    DEFAULT_SPEC_PATH,
+    DEFAULT_TABLE_PATH,
+    HASH,
+    NONE,
+    PROFILES,
+    QUIET,
+    ProtocolSpec,
+    compile_table,
+    reply_format,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="module")
+def spec() -> ProtocolSpec:
+    return ProtocolSpec.load()
+
+
+@pytest.mark.parametrize("frame, template", [
+    (b":GR#", ":GR#"),
+    (b":Sr12:34:56#", ":SrHH:MM.T#"),
+    (b":Ss015#", ":SsNNN#"),
+    (b":Mgs0500#", ":MgsDDDD#"),
+    (b":FP+00010.0000#", ":FPsDDDDD.DDDD#"),
+    (b":F3#", ":F<n>#"),
+    (b":ST+#", ":ST+#"),
+    (b":ST60.1#", ":STdddd.ddddddd#"),
+    (b"\x06", "\x06"),
+])
+def test_lookup(spec, frame, template):
+    assert spec.lookup(frame).template == template
+
+
+@pytest.mark.parametrize("frame, kind", [
+    (b":GR#", HASH),
+    (b":Q#", NONE),
+    (b":Sd+10*00#", BYTE),
+    (b":MS#", BYTE_OR_HASH),
+    (b"\x06", BYTE),
+    (b":P#", QUIET),
+    (b":XY#", QUIET),       # not in the spec
+])
+def test_reply_kinds(spec, frame, kind):
+    assert spec.reply_format(frame).kind == kind
+
+
+def test_reply_format_codes():
+    fmt = reply_format({"0": "Slew is possible", "1<string>#": "Below horizon"})
+    assert fmt.kind == BYTE_OR_HASH and fmt.short == {b"0"}
+    assert reply_format({"12#": "12-hour", "24#": "24-hour"}).kind == HASH
+    assert reply_format("1 (at current baud rate)").kind == BYTE
+
+
+@pytest.mark.parametrize("frame, read_only", [
+    (b":GR#", True),
+    (b":GVP#", True),
+    (b":h?#", True),        # "Query home status"
+    (b":VD0001#", True),    # "Read Dec PEC Table Entry"
+    (b"\x06", True),
+    (b":Sr12:00:00#", False),
+    (b":MS#", False),
+    (b":Q#", False),
+    (b":?+#", False),       # moves the help text cursor
+    (b":XY#", False),       # unknown: assume it changes state
+])
+def test_read_only(spec, frame, read_only):
+    assert spec.is_read_only(frame) is read_only
+
+
+def test_compiled_table_is_current():
+    source = DEFAULT_SPEC_PATH.read_bytes()
+    assert DEFAULT_TABLE_PATH.read_text(encoding="utf-8") == compile_table(source)
+    from_doc = ProtocolSpec.from_doc(json.loads(source))
+    assert ProtocolSpec.from_table(lx200_protocol_table).entries == from_doc.entries
+
+
+@pytest.mark.parametrize("frame", [b":GR#", b":Sr12:34:56#", b":F3#", b":ST60.1#", b"\x06", b":XX#", b":G"])
+def test_table_match_agrees_with_lookup(spec, frame):
+    i = lx200_protocol_table.match(frame.decode("latin-1"))
+    entry = spec.lookup(frame)
+    assert (spec.entries[i] if i >= 0 else None) is entry
+
+
+@pytest.mark.parametrize("frame, params", [
+    (b":GR#", {}),
+    (b":Sr12:34:56#", {"HH:MM.T": "12:34:56"}),
+    (b":Ss015#", {"NNN": "015"}),
+    (b":FP+00010.0000#", {"sDDDDD.DDDD": "+00010.0000"}),
+    (b":F3#", {"n": "3"}),
+    (b":XX#", None),
+])
+def test_parse_params(spec, frame, params):
+    assert spec.parse_params(frame) == params
+
+
+@pytest.mark.parametrize("frame, unsupported", [
+    (b":GR#", ()),
+    (b":Aa#", ("lx200classic", "lx200_16", "autostar")),
+    (b":BD2#", ("lx200gps", "lx200_16", "autostar", "autostar2", "maxrcx")),
+    (b":fC#", ("lx200gps", "lx200classic", "lx200_16", "autostar", "autostar2")),
+    (b":XX#", ()),
+])
+def test_profile_support(spec, frame, unsupported):
+    assert [p for p in PROFILES if not spec.supported(frame, p)] == list(unsupported)
+
+
+def test_profiles_match_emulator():
+    from lx200emulator_v2 import EMULATOR_PROFILES
+    assert tuple(EMULATOR_PROFILES) == PROFILES
+
+
+def test_emulator_naks_unsupported_commands(quiet_v2_log):
+    TelescopeStateMachine = quiet_v2_log.TelescopeStateMachine
+    assert TelescopeStateMachine("lx200gps").handle(":Aa") == "1"
+    assert TelescopeStateMachine("autostar").handle(":Aa") == "\x15"
+    assert TelescopeStateMachine("autostar").handle(":GR").endswith("#")
+    assert TelescopeStateMachine("lx200gps").handle(":fC") == "\x15"
+    assert TelescopeStateMachine("maxrcx").handle(":fC").endswith("#")
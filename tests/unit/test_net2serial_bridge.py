@@ -0,0 +1,89 @@
+"""
+Unit tests for net2serial_bridge's selector relay. A pty stands in for the serial
+port (the test drives the mount end) and a socketpair for the TCP client.
+"""
+from __future__ import annotations
+
+import os
+import select
+import socket
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("serial")
+tty = pytest.importorskip("tty")
+
+from net2serial_bridge import _run_client_bridge_select
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def bridge():
+    mount, port = os.openpty()
+    tty.setraw(port)
+    app, bridge_end = socket.socketpair()
+    quit_event = threading.Event()
+    thread = threading.Thread(target=_run_client_bridge_select,
+                              args=(bridge_end, port, None, quit_event), daemon=True)
+    thread.start()
+    yield app, mount, quit_event, thread
+    quit_event.set()
+    thread.join(2.0)
+    app.close()
+    os.close(mount)
+    os.close(port)
+
+
+def _read_exactly(read, n: int, timeout: float = 2.0) -> bytes:
+    buf = b""
+    end = time.monotonic() + timeout
+    while len(buf) < n and time.monotonic() < end:
+        buf += read(n - len(buf))
+    return buf
+
+
+def _mount_read(mount: int, n: int) -> bytes:
+    def read(k):
+        ready, _, _ = select.select([mount], [], [], 0.1)
+        return os.read(mount, k) if ready else b""
+    return _read_exactly(read, n)
+
+
+def test_relays_both_directions(bridge):
+    app, mount, _, _ = bridge
+    app.settimeout(2.0)
+    for _ in range(20):
+        app.sendall(b":GR#")
+        assert _mount_read(mount, 4) == b":GR#"
+        os.write(mount, b"12:34:56#")
+        assert _read_exactly(app.recv, 9) == b"12:34:56#"
+
+
+def test_replies_flow_while_serial_writes_are_backed_up(bridge):
+    app, mount, _, _ = bridge
+    app.settimeout(2.0)
+    blob = bytes(range(256)) * 1024          # far more than the pty buffer holds
+    sender = threading.Thread(target=app.sendall, args=(blob,), daemon=True)
+    sender.start()
+    time.sleep(0.1)
+    os.write(mount, b"1")                    # mount replies while its input is full
+    assert _read_exactly(app.recv, 1) == b"1"
+    assert _mount_read(mount, len(blob)) == blob
+    sender.join(2.0)
+
+
+def test_session_ends_on_disconnect(bridge):
+    app, _, _, thread = bridge
+    app.close()
+    thread.join(2.0)
+    assert not thread.is_alive()
+
+
+def test_session_ends_on_quit(bridge):
+    _, _, quit_event, thread = bridge
+    quit_event.set()
+    thread.join(2.0)
+    assert not thread.is_alive()
@@ -1,13 +1,13 @@
 """
-Unit tests for StreamParser: frame-by-# parsing, single-byte ACK, chunked input, overflow, invalid ASCII.
+Unit tests for StreamParser and FrameViewParser: frame-by-# parsing, single-byte ACK, chunked input, overflow, invalid ASCII.
 No TCP or server required.
 """
 from __future__ import annotations
 
 import pytest
 
-from scopeboss_emulator.protocol.parser import StreamParser
-from scopeboss_emulator.protocol.types import CmdAck, CmdFrame
+from scopeboss_emulator.protocol.parser import StreamParser, FrameViewParser
+from scopeboss_emulator.protocol.types import CmdAck, CmdFrame, FrameView
 
 pytestmark = pytest.mark.unit
 
@@ -81,3 +81,83 @@ def test_parser_preserves_trailing_hash_in_text():
     parser = StreamParser(max_len=256)
     out = parser.feed(b":F1#")
     assert out[0].text == ":F1#"
+
+
+@pytest.mark.parametrize("max_len", [3, 5, 8, 256])
+def test_feed_matches_bytewise_reference_on_random_streams(max_len):
+    import random
+
+    rng = random.Random(max_len)
+    alphabet = b":hP?#F1\x06\xffGR"
+    for _ in range(200):
+        data = bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        bulk = StreamParser(max_len=max_len)
+        ref = StreamParser(max_len=max_len)
+        got, want = [], []
+        pos = 0
+        while pos < len(data):
+            step = rng.randint(1, 7)
+            got += bulk.feed(data[pos:pos + step])
+            want += ref.feed_bytewise(data[pos:pos + step])
+            pos += step
+        assert got == want
+        assert bulk.buf == ref.buf
+
+
+def test_overflowing_hash_is_dropped_with_buffer():
+    parser = StreamParser(max_len=3)
+    # ':hP' fills the buffer; '#' overflows and is dropped, so no frame is emitted
+    assert parser.feed(b":hP#") == []
+    assert parser.feed(b":F1#") == []
+    assert parser.feed(bytes([0x06])) == [CmdAck()]
+
+
+def test_feed_accepts_memoryview():
+    parser = StreamParser(max_len=256)
+    assert parser.feed(memoryview(b":hP#\x06")) == [CmdFrame(text=":hP#"), CmdAck()]
+
+
+# --- FrameViewParser (zero-copy mode) ---
+
+
+def test_view_parser_returns_frame_views_with_lazy_text():
+    parser = FrameViewParser(max_len=256)
+    out = parser.feed(b"\x06:ED#:G0#")
+    assert out[0] == CmdAck()
+    assert all(isinstance(v, FrameView) for v in out[1:])
+    assert [v.text for v in out[1:]] == [":ED#", ":G0#"]
+    assert out[1].raw == b":ED#"
+
+
+def test_view_parser_assembles_frame_split_across_feeds():
+    parser = FrameViewParser(max_len=256)
+    assert parser.feed(b":h") == []
+    assert parser.buf == b":h"
+    out = parser.feed(b"P#:G")
+    assert [v.text for v in out] == [":hP#"]
+    assert parser.buf == b":G"
+    # completed carry frame must survive the tail written in the same feed
+    out = parser.feed(b"R#:F")
+    assert [v.text for v in out] == [":GR#"]
+
+
+@pytest.mark.parametrize("max_len", [3, 5, 8, 256])
+def test_view_parser_matches_stream_parser_on_random_streams(max_len):
+    import random
+
+    rng = random.Random(1000 + max_len)
+    alphabet = b":hP?#F1\x06\xffGR"
+    for _ in range(200):
+        data = bytes(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        views = FrameViewParser(max_len=max_len)
+        ref = StreamParser(max_len=max_len)
+        pos = 0
+        while pos < len(data):
+            step = rng.randint(1, 7)
+            got = views.feed(data[pos:pos + step])
+            want = ref.feed(data[pos:pos + step])
+            # decode within the same feed window (views are only valid until next feed)
+            assert [c if isinstance(c, CmdAck) else c.text for c in got] == \
+                   [c if isinstance(c, CmdAck) else c.text for c in want]
+            pos += step
+        assert views.buf == bytes(ref.buf)
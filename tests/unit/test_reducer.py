@@ -7,15 +7,16 @@ from __future__ import annotations
 import pytest
 from dataclasses import replace
 
-from scopeboss_emulator.core.reducer import handle_command, tick
+from scopeboss_emulator.core.reducer import handle_command, tick, apply_command, advance
 from scopeboss_emulator.core.state import (
     TelescopeState,
+    MutableTelescopeState,
     MotionState,
     HomeStatus,
     FocusState,
     Timers,
 )
-from scopeboss_emulator.protocol.types import CmdAck, CmdFrame
+from scopeboss_emulator.protocol.types import CmdAck, CmdFrame, FrameView
 
 pytestmark = pytest.mark.unit
 
@@ -126,3 +127,38 @@ def test_home_status_append_hash(idle_state, fast_cfg):
     state, _ = handle_command(idle_state, CmdFrame(text=":hS#"), cfg_hash)
     _, reply = handle_command(state, CmdFrame(text=":h?#"), cfg_hash)
     assert reply == b"2#"
+
+
+def test_frame_view_commands_handled_like_frames(idle_state, fast_cfg):
+    view = FrameView(memoryview(b"xx:hP#"), 2, 4)
+    state, reply = handle_command(idle_state, view, fast_cfg)
+    assert reply is None
+    assert state.motion == MotionState.PARKING
+
+
+def test_mutable_state_snapshot_round_trip(idle_state):
+    state = replace(idle_state, focus_speed=3, timers=Timers(park_done_at_ms=40), last_error="x")
+    m = MutableTelescopeState.from_state(state)
+    assert m.snapshot() == state
+    m.focus_speed = 1
+    assert state.focus_speed == 3  # snapshot is a copy, not a view
+
+
+def test_apply_command_mutates_in_place_and_matches_handle_command(idle_state, fast_cfg):
+    m = MutableTelescopeState.from_state(idle_state)
+    for text in (":hP#", ":F2#", ":XX#", ":h?#"):
+        want_state, want_reply = handle_command(m.snapshot(), CmdFrame(text=text), fast_cfg)
+        reply = apply_command(m, CmdFrame(text=text), fast_cfg)
+        assert reply == want_reply
+        assert m.snapshot() == want_state
+
+
+def test_advance_without_due_timer_only_moves_clock(idle_state, fast_cfg):
+    m = MutableTelescopeState.from_state(idle_state)
+    assert advance(m, 50, fast_cfg) is False
+    assert m.snapshot() == replace(idle_state, now_ms=50)
+    apply_command(m, CmdFrame(text=":hP#"), fast_cfg)
+    assert advance(m, 50, fast_cfg) is False
+    assert advance(m, 50, fast_cfg) is True
+    assert m.motion == MotionState.PARKED_READY
+    assert m.park_done_at_ms is None
@@ -0,0 +1,127 @@
+"""
+Unit tests for benchmarks.replay: pairing replayed and recorded replies per
+command (pipelined writes, replies split over records), mismatch and timeout
+counting, recorded latency of undelimited replies, latency histograms, and an
+in-process replay against lx200emulator_v2.
+"""
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.replay import LatencyHistogram, Replayer, SessionTarget
+from capture import Record
+
+pytestmark = pytest.mark.unit
+
+
+class ScriptedTarget:
+    """Answers from a table as soon as a command is sent; None never answers."""
+
+    synchronous = True
+    quiet = 0.0
+
+    def __init__(self, replies: dict[bytes, bytes | None]):
+        self.replies = replies
+        self.received: list[tuple[int, bytes]] = []
+        self._ready: list[tuple[int, bytes]] = []
+
+    def send(self, client: int, data: bytes) -> None:
+        self.received.append((client, data))
+        reply = self.replies.get(data)
+        if reply:
+            self._ready.append((client, reply))
+
+    def poll(self, timeout: float):
+        out, self._ready = self._ready, []
+        return out
+
+
+def _records(*items):
+    return [Record(i * 1_000_000, d, c, data) for i, (d, c, data) in enumerate(items)]
+
+
+def test_pipelined_commands_pair_with_split_replies():
+    target = ScriptedTarget({b":GR#": b"12:34:56#", b":GD#": b"+10*00'00#", b":Q#": b""})
+    records = _records(
+        ("W", 1, b":GR#:Q#:GD#"),
+        ("R", 1, b"12:34:"),               # reply split over two reads
+        ("R", 1, b"56#+10*00'00#"),
+        ("W", 2, b":GR#"),
+        ("R", 2, b"12:35:00#"),             # differs in digits only
+    )
+    report = Replayer(target, time_scale=0).run(records)
+    assert target.received == [(1, b":GR#"), (1, b":Q#"), (1, b":GD#"), (2, b":GR#")]
+    gr, gd, q = (report["per_command"][k] for k in (":GR#", ":GD#", ":Q#"))
+    assert (gr["count"], gr["mismatches"], gr["shape_mismatches"]) == (2, 1, 0)
+    assert gr["example"] == {"sent": ":GR#", "recorded": "12:35:00#", "replayed": "12:34:56#"}
+    assert (gd["count"], gd["mismatches"]) == (1, 0)
+    assert q["latency_ms"]["count"] == 0
+    assert gr["recorded_ms"]["max"] == 2.0        # second R record, 2 ms after the W
+    assert report["compared"] == 4 and report["timeouts"] == 0
+
+
+def test_missing_and_unexpected_replies():
+    target = ScriptedTarget({b":GR#": None, b":GVP#": b"LX200GPS#"})
+    records = _records(
+        ("W", 1, b":GR#"),
+        ("R", 1, b"12:34:56#"),
+        ("W", 1, b":GVP#"),                 # the recording ends before its reply
+    )
+    report = Replayer(target, time_scale=0).run(records)
+    gr, gvp = report["per_command"][":GR#"], report["per_command"][":GVP#"]
+    assert (gr["timeouts"], gr["mismatches"], gr["example"]["replayed"]) == (1, 1, "")
+    assert (gvp["unmatched"], report["compared"]) == (1, 1)
+
+
+def test_commands_outside_lx200_framing_are_one_per_record():
+    target = ScriptedTarget({b"e": b"782CA700,27099E00#"})
+    records = _records(("W", 0, b"e"), ("R", 0, b"782CA700,27099E00#"), ("W", 0, b"e"))
+    report = Replayer(target, time_scale=0).run(records)
+    e = report["per_command"]["e"]
+    assert (e["count"], e["mismatches"], e["unmatched"]) == (2, 0, 1)
+
+
+def test_undelimited_reply_latency_ends_at_its_last_r_record():
+    target = ScriptedTarget({b"e": b"782CA700,27099E00#"})
+    ms = 1_000_000
+    records = [
+        Record(0, "W", 0, b"e"),
+        Record(200 * ms, "R", 0, b"782CA700,"),
+        Record(217 * ms, "R", 0, b"27099E00#"),
+        Record(337 * ms, "W", 0, b"e"),           # client think time is not reply latency
+        Record(550 * ms, "R", 0, b"782CA700,27099E00#"),   # last reply: cut at end of run
+    ]
+    report = Replayer(target, time_scale=0).run(records)
+    e = report["per_command"]["e"]
+    assert (e["count"], e["mismatches"]) == (2, 0)
+    rec = e["recorded_ms"]
+    assert (rec["count"], rec["max"], rec["mean"]) == (2, 217.0, 215.0)   # 217 ms and 550 - 337 ms
+
+
+def test_negative_time_scale_rejected():
+    with pytest.raises(ValueError):
+        Replayer(ScriptedTarget({}), time_scale=-1)
+
+
+def test_latency_histogram():
+    h = LatencyHistogram()
+    for ms in range(1, 101):
+        h.add(ms / 1000.0)
+    s = h.summary()
+    assert s["count"] == 100 and s["max"] == 100.0 and s["mean"] == 50.5
+    assert 50.0 <= s["p50"] <= 50.0 * 1.13       # bucket upper edge, about 12 % wide
+    assert 99.0 <= s["p99"] <= 100.0
+
+
+def test_in_process_v2():
+    records = _records(
+        ("W", 1, b":GVP#"), ("R", 1, b"LX200GPS#"),
+        ("W", 1, b":GR#"), ("R", 1, b"05:30:50#"),
+        ("W", 1, b":XX#"), ("R", 1, b"#"),
+    )
+    report = Replayer(SessionTarget("lx200gps"), time_scale=0).run(records)
+    per = report["per_command"]
+    assert per[":GVP#"]["mismatches"] == 0
+    assert per[":GR#"]["shape_mismatches"] == 0
+    assert per[":X..."]["mismatches"] == 1         # not in the spec: NAK instead of the recorded '#'
+    assert report["timeouts"] == 0
@@ -0,0 +1,170 @@
+"""
+Unit tests for SimClock/Scheduler/SessionTimer: lazy fixed-tick clock, deadline-only
+wakeups, one-pass firing across sessions, time scale, and equivalence with the 50 ms
+fixed-tick reducer model. Uses a manual fake clock; no TCP, server or real sleeping.
+"""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from scopeboss_emulator.config import HomeBehavior
+from scopeboss_emulator.core.reducer import apply_command, advance
+from scopeboss_emulator.core.state import MutableTelescopeState, LinkState, MotionState
+from scopeboss_emulator.protocol.types import CmdFrame
+from scopeboss_emulator.timers import SessionTimer, SimClock, Scheduler, TICK_MS
+
+pytestmark = pytest.mark.unit
+
+
+class FakeLoop:
+    """Just enough of an event loop for SimClock: time()."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+
+def _sched(time_scale=1.0):
+    loop = FakeLoop()
+    return loop, Scheduler(SimClock(time_scale=time_scale, loop=loop))
+
+
+def _run_until(loop, sched, t):
+    """Fire every due wakeup, in deadline order, up to loop time t."""
+    while True:
+        wake = sched.next_wake_ms()
+        if wake is None or sched.clock.loop_time(wake) > t:
+            break
+        loop.now = max(loop.now, sched.clock.loop_time(wake))
+        sched.fire_due(at_ms=wake)
+    loop.now = t
+
+
+def _state():
+    return MutableTelescopeState(link=LinkState.CONNECTED, motion=MotionState.IDLE_TRACKING)
+
+
+def test_idle_session_schedules_no_wakeups(fast_cfg):
+    loop, sched = _sched()
+    timer = SessionTimer(_state(), fast_cfg, sched)
+    timer.reschedule()
+    assert sched.next_wake_ms() is None
+    _run_until(loop, sched, 60.0)
+    assert timer.wakeups == 0
+
+
+def test_park_wakes_once_at_deadline_tick(fast_cfg):
+    loop, sched = _sched()
+    state = _state()
+    timer = SessionTimer(state, fast_cfg, sched)
+    _run_until(loop, sched, 0.120)
+    timer.sync()
+    assert state.now_ms == 100
+    apply_command(state, CmdFrame(text=":hP#"), fast_cfg)   # deadline 200
+    timer.reschedule()
+    _run_until(loop, sched, 0.199)
+    assert state.motion == MotionState.PARKING
+    _run_until(loop, sched, 0.200)
+    assert state.motion == MotionState.PARKED_READY
+    assert state.now_ms == 200
+    assert timer.wakeups == 1
+    assert sched.next_wake_ms() is None
+
+
+def test_zero_duration_timer_fires_on_next_tick(fast_cfg):
+    from dataclasses import replace
+    cfg = replace(fast_cfg, park_duration_ms=0)
+    loop, sched = _sched()
+    state = _state()
+    timer = SessionTimer(state, cfg, sched)
+    apply_command(state, CmdFrame(text=":hP#"), cfg)
+    timer.reschedule()
+    _run_until(loop, sched, 0.049)
+    assert state.motion == MotionState.PARKING
+    _run_until(loop, sched, 0.050)
+    assert state.motion == MotionState.PARKED_READY
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_fixed_tick_model(fast_cfg, seed):
+    """Same arrival schedule: lazy SessionTimer vs advancing every 50 ms."""
+    rng = random.Random(seed)
+    cfg = fast_cfg
+    if seed % 2:
+        from dataclasses import replace
+        cfg = replace(fast_cfg, home=HomeBehavior(mode="timer", duration_ms=130, succeed=False))
+    texts = [":hP#", ":hS#", ":h?#", ":hN#", ":hW#", ":F2#", ":XX#"]
+    arrivals = sorted(rng.uniform(0, 2.0) for _ in range(40))
+
+    ref = _state()
+    ref_replies = []
+    loop, sched = _sched()
+    lazy = _state()
+    lazy_replies = []
+    timer = SessionTimer(lazy, cfg, sched)
+
+    for t in arrivals:
+        text = rng.choice(texts)
+        # fixed-tick model: every whole tick up to the arrival time has run
+        while ref.now_ms + TICK_MS <= t * 1000.0:
+            advance(ref, TICK_MS, cfg)
+        ref_replies.append(apply_command(ref, CmdFrame(text=text), cfg))
+
+        _run_until(loop, sched, t)
+        timer.sync()
+        lazy_replies.append(apply_command(lazy, CmdFrame(text=text), cfg))
+        timer.reschedule()
+        assert lazy.snapshot() == ref.snapshot()
+
+    assert lazy_replies == ref_replies
+
+
+def test_one_pass_fires_all_due_sessions(fast_cfg):
+    loop, sched = _sched()
+    states = [_state() for _ in range(50)]
+    timers = [SessionTimer(st, fast_cfg, sched) for st in states]
+    for st, timer in zip(states, timers):
+        apply_command(st, CmdFrame(text=":hP#"), fast_cfg)
+        timer.reschedule()
+    loop.now = 0.100
+    assert sched.fire_due() == 50
+    assert all(st.motion == MotionState.PARKED_READY for st in states)
+    assert sched.next_wake_ms() is None
+
+
+def test_rearm_supersedes_old_entry(fast_cfg):
+    loop, sched = _sched()
+    state = _state()
+    timer = SessionTimer(state, fast_cfg, sched)
+    apply_command(state, CmdFrame(text=":hP#"), fast_cfg)      # wake at 100
+    timer.reschedule()
+    apply_command(state, CmdFrame(text=":hN#"), fast_cfg)      # sleeping: park timer stale
+    timer.reschedule()
+    assert sched.next_wake_ms() is None
+    loop.now = 1.0
+    assert sched.fire_due() == 0
+    assert timer.wakeups == 0
+
+
+def test_time_scale_speeds_up_timers(fast_cfg):
+    from dataclasses import replace
+    cfg = replace(fast_cfg, park_duration_ms=5000)
+    loop, sched = _sched(time_scale=10.0)
+    state = _state()
+    timer = SessionTimer(state, cfg, sched)
+    apply_command(state, CmdFrame(text=":hP#"), cfg)
+    timer.reschedule()
+    _run_until(loop, sched, 0.499)
+    assert state.motion == MotionState.PARKING
+    _run_until(loop, sched, 0.500)
+    assert state.motion == MotionState.PARKED_READY
+    assert state.now_ms == 5000
+
+
+def test_time_scale_must_be_positive():
+    with pytest.raises(ValueError):
+        SimClock(time_scale=0, loop=FakeLoop())
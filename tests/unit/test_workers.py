@@ -0,0 +1,101 @@
+"""
+Unit tests for the --workers supervisor: stats bookkeeping (aggregate_stats, retire)
+and restarts (RestartPolicy backoff, check_workers with fake processes).
+No processes, TCP or server started.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import pytest
+
+from scopeboss_emulator.server import ServerStats
+from scopeboss_emulator.workers import RestartPolicy, aggregate_stats, check_workers, retire
+
+pytestmark = pytest.mark.unit
+
+
+def _rep(**kw):
+    return asdict(ServerStats(**kw))
+
+
+def test_aggregate_sums_live_workers():
+    latest = {0: _rep(sessions_total=2, sessions_active=1, commands=10),
+              1: _rep(sessions_total=3, sessions_active=2, commands=5, naks=1)}
+    total = aggregate_stats(latest, {})
+    assert total["sessions_total"] == 5
+    assert total["sessions_active"] == 3
+    assert total["commands"] == 15
+    assert total["naks"] == 1
+
+
+def test_retired_counters_survive_restart_but_not_active_sessions():
+    latest = {0: _rep(sessions_total=4, sessions_active=2, commands=40)}
+    retired = {}
+    retire(latest, retired, 0)
+    assert latest == {}
+    latest[0] = _rep(sessions_total=1, sessions_active=1, commands=3)   # restarted worker
+    total = aggregate_stats(latest, retired)
+    assert total["sessions_total"] == 5
+    assert total["commands"] == 43
+    assert total["sessions_active"] == 1
+
+
+def test_retire_unknown_worker_is_noop():
+    retired = {}
+    retire({}, retired, 3)
+    assert retired == {}
+
+
+class _Proc:
+    def __init__(self, pid, alive=True, exitcode=None):
+        self.pid, self.alive, self.exitcode = pid, alive, exitcode
+
+    def is_alive(self):
+        return self.alive
+
+
+def test_fast_failures_back_off_exponentially_then_give_up():
+    policy = RestartPolicy(1, base_s=1.0, max_s=4.0, healthy_s=10.0, max_fast_failures=5)
+    assert [policy.exited(0, uptime=0.1, now=100.0) for _ in range(4)] == [1.0, 2.0, 4.0, 4.0]
+    assert policy.exited(0, uptime=0.1, now=100.0) is None
+    assert not policy.due(0, now=1e9)
+
+
+def test_healthy_run_resets_backoff():
+    policy = RestartPolicy(1, base_s=1.0, healthy_s=10.0)
+    policy.exited(0, uptime=0.1, now=0.0)
+    policy.exited(0, uptime=0.1, now=0.0)
+    assert policy.exited(0, uptime=60.0, now=0.0) == 1.0
+
+
+def test_restart_is_timed_from_the_exit():
+    procs = [_Proc(100, alive=False, exitcode=1), _Proc(101)]
+    started_at = [0.0, 0.0]
+    latest, retired = {0: _rep(commands=7), 1: _rep(commands=1)}, {}
+    starts = []
+
+    def start(idx):
+        starts.append(idx)
+        procs[idx] = _Proc(200 + len(starts))
+        started_at[idx] = now
+
+    policy = RestartPolicy(2, base_s=1.0, healthy_s=10.0)
+    now = 50.0                      # worker 0 ran 50 s: healthy, base delay
+    assert check_workers(procs, started_at, policy, now, start, latest, retired) == 0
+    assert procs[0] is None and retired["commands"] == 7 and 0 not in latest
+    now = 50.5
+    assert check_workers(procs, started_at, policy, now, start, latest, retired) == 0
+    now = 51.0
+    assert check_workers(procs, started_at, policy, now, start, latest, retired) == 1
+    assert starts == [0] and procs[0].pid == 201
+
+    for died, due in ((51.2, 52.2), (52.4, 54.4)):   # dies 0.2 s after starting: 1 s, then 2 s
+        procs[0].alive = False
+        now = died
+        check_workers(procs, started_at, policy, now, start, latest, retired)
+        now = due - 0.1
+        assert check_workers(procs, started_at, policy, now, start, latest, retired) == 0
+        now = due
+        assert check_workers(procs, started_at, policy, now, start, latest, retired) == 1
+    assert starts == [0, 0, 0]